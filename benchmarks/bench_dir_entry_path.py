@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+"""
+    DirEntryPath memory and speed benchmark
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compare the old "eager" DirEntryPath (all information computed in __init__)
+    with the current lazy, __slots__ based DirEntryPath.
+
+    e.g.:
+        ~/pathlib_revised$ python3 benchmarks/bench_dir_entry_path.py --files 100000
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BASE_PATH not in sys.path:
+    sys.path.insert(0, BASE_PATH)
+
+# pathlib_revised
+from pathlib_revised import DirEntryPath, Path2  # noqa: E402 isort:skip
+
+
+class EagerDirEntryPath:
+    """
+    The DirEntryPath implementation before it was lazy.
+    """
+
+    def __init__(self, path, onerror=print):
+        self.path_instance = Path2(path)
+        self.path = str(self.path_instance)
+
+        self.is_symlink = self.path_instance.is_symlink()
+        self.is_file = self.path_instance.is_file()
+        self.is_dir = self.path_instance.is_dir()
+        self.stat = self.path_instance.stat()
+
+        try:
+            self.resolved_path = self.path_instance.resolve()
+        except (PermissionError, FileNotFoundError) as err:
+            onerror("Resolve %r error: %s" % (self.path, err))
+            self.resolved_path = None
+            self.resolve_error = err
+        else:
+            self.resolve_error = None
+
+        if self.resolved_path is None:
+            self.different_path = True
+        else:
+            self.different_path = self.path_instance.path != self.resolved_path.path
+
+
+def create_files(path, count):
+    for no in range(count):
+        with open(os.path.join(path, "file_%07i.txt" % no), "wb") as f:
+            f.write(b"X" * (no % 1024))
+
+
+def eager_scan(path):
+    return [EagerDirEntryPath(dir_entry) for dir_entry in Path2(path).scandir()]
+
+
+def lazy_scan(path):
+    # Like the walkers: the parent is shared by all entries
+    parent = Path2(path)
+    return [DirEntryPath.from_dir_entry(dir_entry, parent=parent) for dir_entry in parent.scandir()]
+
+
+def use_entries(entries):
+    """
+    The typical use case: only "is_dir" and "stat.st_size" are needed.
+    """
+    total_size = 0
+    for entry in entries:
+        if not entry.is_dir:
+            total_size += entry.stat.st_size
+    return total_size
+
+
+def measure(name, scan_func, path):
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+
+    entries = scan_func(path)
+    total_size = use_entries(entries)
+
+    duration = time.perf_counter() - start_time
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(entries)
+    print(
+        "%-6s: %i entries, %i Bytes - %.3f sec. (%.1f µs per entry) - %.1f MiB hold (%i Bytes per entry)" % (
+            name, count, total_size,
+            duration, duration / count * 1000000,
+            current / 1024 / 1024, current / count
+        )
+    )
+    del entries
+    return duration, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20000, help="Number of files to create (default: %(default)s)")
+    parser.add_argument("--path", help="Create the files in this directory (default: a temp directory)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.path) as temp_path:
+        print("Create %i files in %r..." % (args.files, temp_path))
+        create_files(temp_path, args.files)
+
+        # Fill the OS caches, before measuring:
+        lazy_scan(temp_path)
+
+        eager_duration, eager_memory = measure("eager", eager_scan, temp_path)
+        lazy_duration, lazy_memory = measure("lazy", lazy_scan, temp_path)
+
+    print("lazy needs %.1f%% time and %.1f%% memory of eager" % (
+        lazy_duration / eager_duration * 100,
+        lazy_memory / eager_memory * 100,
+    ))
+
+
+if __name__ == "__main__":
+    main()
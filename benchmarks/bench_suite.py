@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+
+"""
+    Path2 and DirEntryPath benchmark suite
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Create a synthetic tree and measure the throughput and the peak memory of
+    the hot paths. Save the results as JSON, to compare them across versions.
+
+    e.g.:
+        ~/pathlib_revised$ python3 benchmarks/bench_suite.py --output old.json
+        ~/pathlib_revised$ git checkout ...
+        ~/pathlib_revised$ python3 benchmarks/bench_suite.py --output new.json --compare old.json
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import argparse
+import collections
+import datetime
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BASE_PATH not in sys.path:
+    sys.path.insert(0, BASE_PATH)
+
+# pathlib_revised
+import pathlib_revised  # noqa: E402 isort:skip
+from pathlib_revised import DirEntryPath, Path2  # noqa: E402 isort:skip
+import synthetic_tree  # noqa: E402 isort:skip
+
+BENCHMARKS = collections.OrderedDict()
+
+
+def benchmark(func):
+    """
+    Register a benchmark function: func(info, work_path) -> number of processed items
+
+    'info' is the TreeInfo() of the synthetic tree and 'work_path' a empty directory
+    """
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def _scandir_tree(path):
+    for dir_entry in Path2(path).scandir():
+        yield dir_entry
+        if dir_entry.is_dir(follow_symlinks=False):
+            yield from _scandir_tree(dir_entry.path)
+
+
+@benchmark
+def path_construction(info, work_path):
+    paths = info.dirs + info.files
+    for path in paths:
+        Path2(path)
+    return len(paths)
+
+
+@benchmark
+def scandir(info, work_path):
+    count = 0
+    for dir_entry in _scandir_tree(info.path):
+        count += 1
+    return count
+
+
+@benchmark
+def dir_entry_path(info, work_path):
+    count = 0
+    for dir_entry in _scandir_tree(info.path):
+        entry = DirEntryPath.from_dir_entry(dir_entry)
+        if entry.is_file:
+            entry.stat
+        count += 1
+    return count
+
+
+@benchmark
+def walk_parallel(info, work_path):
+    count = 0
+    for entry in Path2(info.path).walk_parallel():
+        count += 1
+    return count
+
+
+@benchmark
+def copyfile(info, work_path):
+    for no, path in enumerate(info.files):
+        Path2(path).copyfile(Path2(work_path, "%i.txt" % no))
+    return len(info.files)
+
+
+@benchmark
+def link(info, work_path):
+    for no, path in enumerate(info.files):
+        Path2(path).link(Path2(work_path, "%i.txt" % no))
+    return len(info.files)
+
+
+@benchmark
+def glob(info, work_path):
+    pattern = "/".join(["*"] * info.spec.depth) + "/*.txt"
+    return len(list(Path2(info.path).glob(pattern)))
+
+
+@benchmark
+def rglob(info, work_path):
+    return len(list(Path2(info.path).rglob("*.txt")))
+
+
+@benchmark
+def rglob_parallel(info, work_path):
+    return len(list(Path2(info.path).rglob("*.txt", max_workers=8)))
+
+
+def _run_once(func, info, temp_path):
+    work_path = tempfile.mkdtemp(dir=temp_path)
+    try:
+        gc.collect()
+        start_time = time.perf_counter()
+        count = func(info, work_path)
+        duration = time.perf_counter() - start_time
+    finally:
+        shutil.rmtree(work_path)
+    return count, duration
+
+
+def _peak_memory(func, info, temp_path):
+    work_path = tempfile.mkdtemp(dir=temp_path)
+    try:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(info, work_path)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        shutil.rmtree(work_path)
+    return peak
+
+
+def measure(func, info, temp_path, repeat):
+    """
+    Run the benchmark 'repeat' times and once more with tracemalloc
+    (tracemalloc slows down the run, so it's not used for the timing)
+    """
+    durations = []
+    for no in range(repeat):
+        count, duration = _run_once(func, info, temp_path)
+        durations.append(duration)
+
+    best = min(durations)
+    return {
+        "count": count,
+        "best": best,
+        "mean": sum(durations) / len(durations),
+        "per_sec": count / best if best else None,
+        "peak_memory": _peak_memory(func, info, temp_path),
+    }
+
+
+def print_results(results, compare=None):
+    for name, result in results.items():
+        line = "%-18s %8i items %10.1f/sec. peak: %7.1f KiB" % (
+            name, result["count"], result["per_sec"] or 0, result["peak_memory"] / 1024
+        )
+        if compare and name in compare and compare[name]["per_sec"] and result["per_sec"]:
+            line += " - speed: %5.1f%% memory: %5.1f%%" % (
+                result["per_sec"] / compare[name]["per_sec"] * 100,
+                result["peak_memory"] / max(1, compare[name]["peak_memory"]) * 100,
+            )
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", help="Create the tree in this directory (default: a temp directory)")
+    parser.add_argument("--repeat", type=int, default=3, help="Run every benchmark n times (default: %(default)s)")
+    parser.add_argument(
+        "--benchmark", action="append", choices=list(BENCHMARKS),
+        help="Run only this benchmark (can be used multiple times, default: all)"
+    )
+    parser.add_argument("--output", help="Save the results into this JSON file")
+    parser.add_argument("--compare", help="Compare the results with this JSON file")
+    synthetic_tree.add_arguments(parser)
+    args = parser.parse_args()
+
+    compare = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            compare = json.load(f)["results"]
+
+    names = args.benchmark or list(BENCHMARKS)
+    spec = synthetic_tree.spec_from_args(args)
+
+    with tempfile.TemporaryDirectory(dir=args.path) as temp_path:
+        tree_path = os.path.join(temp_path, "tree")
+        os.mkdir(tree_path)
+        info = synthetic_tree.create_tree(tree_path, spec)
+        print("Synthetic tree: %s" % info.as_dict())
+
+        results = collections.OrderedDict()
+        for name in names:
+            results[name] = measure(BENCHMARKS[name], info, temp_path, args.repeat)
+
+    print_results(results, compare)
+
+    if args.output:
+        data = {
+            "meta": {
+                "version": pathlib_revised.__version__,
+                "python": sys.version,
+                "platform": platform.platform(),
+                "date": datetime.datetime.now().isoformat(),
+                "repeat": args.repeat,
+                "tree": info.as_dict(),
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=4)
+        print("Results saved to %r" % args.output)
+
+
+if __name__ == "__main__":
+    main()
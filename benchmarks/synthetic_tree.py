@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+"""
+    Create reproducible synthetic directory trees for benchmarks
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The same arguments (incl. the seed) create always the same tree.
+
+    e.g.:
+        ~/pathlib_revised$ python3 benchmarks/synthetic_tree.py /tmp/tree --width 5 --depth 3
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import argparse
+import collections
+import os
+import random
+
+IS_WINDOWS = os.name == 'nt'
+
+TreeSpec = collections.namedtuple(
+    "TreeSpec", ("width", "depth", "files_per_dir", "min_size", "max_size", "symlinks", "broken_links", "seed")
+)
+DEFAULT_SPEC = TreeSpec(
+    width=5,  # sub directories per directory
+    depth=3,  # directory levels below the root
+    files_per_dir=20,
+    min_size=0,  # file sizes in Bytes
+    max_size=64 * 1024,
+    symlinks=2,  # symlinks to files per directory
+    broken_links=1,  # symlinks to not existing files per directory
+    seed=42,
+)
+
+
+class TreeInfo:
+    """
+    Summary of a created tree.
+    """
+
+    def __init__(self, path, spec):
+        self.path = path
+        self.spec = spec
+        self.dirs = []
+        self.files = []
+        self.symlinks = []
+        self.broken_links = []
+        self.total_size = 0
+
+    def as_dict(self):
+        return {
+            "spec": dict(self.spec._asdict()),
+            "dirs": len(self.dirs),
+            "files": len(self.files),
+            "symlinks": len(self.symlinks),
+            "broken_links": len(self.broken_links),
+            "total_size": self.total_size,
+        }
+
+
+def _file_size(rnd, spec):
+    # Most files are small, like in real trees:
+    return int(spec.min_size + (spec.max_size - spec.min_size) * rnd.random() ** 3)
+
+
+def _fill_dir(rnd, path, spec, info):
+    file_names = []
+    for no in range(spec.files_per_dir):
+        file_name = "file_%04i.txt" % no
+        file_path = os.path.join(path, file_name)
+        size = _file_size(rnd, spec)
+        with open(file_path, "wb") as f:
+            f.write(rnd.getrandbits(8 * size).to_bytes(size, "little") if size else b"")
+        info.files.append(file_path)
+        info.total_size += size
+        file_names.append(file_name)
+
+    if IS_WINDOWS:
+        # Creating symlinks needs special privileges
+        return
+
+    for no in range(spec.symlinks if file_names else 0):
+        link_path = os.path.join(path, "symlink_%04i.txt" % no)
+        os.symlink(rnd.choice(file_names), link_path)
+        info.symlinks.append(link_path)
+
+    for no in range(spec.broken_links):
+        link_path = os.path.join(path, "broken_%04i.txt" % no)
+        os.symlink("missing_%04i.txt" % no, link_path)
+        info.broken_links.append(link_path)
+
+
+def create_tree(path, spec=DEFAULT_SPEC):
+    """
+    Create the tree in the existing directory 'path' and returns a TreeInfo() instance.
+    """
+    rnd = random.Random(spec.seed)
+    info = TreeInfo(path, spec)
+
+    level = [path]
+    for depth in range(spec.depth + 1):
+        next_level = []
+        for dir_path in level:
+            info.dirs.append(dir_path)
+            _fill_dir(rnd, dir_path, spec, info)
+            if depth < spec.depth:
+                for no in range(spec.width):
+                    sub_dir = os.path.join(dir_path, "dir_%04i" % no)
+                    os.mkdir(sub_dir)
+                    next_level.append(sub_dir)
+        level = next_level
+    return info
+
+
+def add_arguments(parser):
+    """
+    Add the TreeSpec arguments to a argparse.ArgumentParser()
+    """
+    group = parser.add_argument_group("synthetic tree")
+    for name, default in DEFAULT_SPEC._asdict().items():
+        group.add_argument("--%s" % name.replace("_", "-"), type=int, default=default, help="(default: %(default)s)")
+
+
+def spec_from_args(args):
+    return TreeSpec(**{name: getattr(args, name) for name in TreeSpec._fields})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Create the tree in this (empty) directory")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    os.makedirs(args.path, exist_ok=True)
+    info = create_tree(args.path, spec_from_args(args))
+    print(info.as_dict())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    asyncio front-end: Run the blocking Path2() methods in a thread pool.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import asyncio
+import functools
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# pathlib_revised
+from pathlib_revised.pathlib import Path2
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_BATCH_SIZE = 256
+
+
+def _next_batch(iterator, batch_size):
+    return list(itertools.islice(iterator, batch_size))
+
+
+class AsyncExecutor:
+    """
+    A bounded thread pool for the blocking file system calls.
+
+    Use one instance per mount point, to tune the concurrency e.g.:
+    many workers for a network file system and a few for a local HDD.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, batch_size=DEFAULT_BATCH_SIZE):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Call func(*args, **kwargs) in the thread pool and returns the result.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def iterate(self, iterator_factory):
+        """
+        Create the iterator in the thread pool and yield its items.
+
+        The items are fetched in batches of 'batch_size', so the event loop
+        is not woken up for every single item. The iterator will be closed,
+        if the async iteration is stopped early.
+        """
+        iterator = await self.run(iterator_factory)
+        try:
+            while True:
+                batch = await self.run(_next_batch, iterator, self.batch_size)
+                if not batch:
+                    return
+                for item in batch:
+                    yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await self.run(close)
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor():
+    """
+    Returns the AsyncExecutor() instance, that is used if no executor is given.
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = AsyncExecutor()
+        return _default_executor
+
+
+class AsyncPath2:
+    """
+    Wrap a Path2() instance and make the blocking methods awaitable, e.g.:
+
+        path = AsyncPath2("/foo/bar", executor=AsyncExecutor(max_workers=8))
+        stat = await path.stat()
+        async for dir_entry in path.scandir():
+            ...
+
+    All calls are run in the AsyncExecutor() thread pool.
+    """
+    __slots__ = ("path_instance", "executor")
+
+    def __init__(self, *args, executor=None):
+        if len(args) == 1 and isinstance(args[0], AsyncPath2):
+            args = (args[0].path_instance,)
+        self.path_instance = Path2(*args)
+        self.executor = executor or get_default_executor()
+
+    def _new(self, path):
+        return AsyncPath2(path, executor=self.executor)
+
+    def _run(self, func, *args, **kwargs):
+        return self.executor.run(func, *args, **kwargs)
+
+    @property
+    def path(self):
+        return self.path_instance.path
+
+    @property
+    def name(self):
+        return self.path_instance.name
+
+    @property
+    def parent(self):
+        return self._new(self.path_instance.parent)
+
+    def __truediv__(self, other):
+        return self._new(self.path_instance / other)
+
+    def __fspath__(self):
+        return self.path_instance.path
+
+    def __str__(self):
+        return self.path_instance.path
+
+    def __repr__(self):
+        return "<AsyncPath2 %r>" % self.path_instance.path
+
+    def __eq__(self, other):
+        if isinstance(other, AsyncPath2):
+            other = other.path_instance
+        return self.path_instance == other
+
+    def __hash__(self):
+        return hash(self.path_instance)
+
+    async def stat(self):
+        return await self._run(self.path_instance.stat)
+
+    async def lstat(self):
+        return await self._run(self.path_instance.lstat)
+
+    async def exists(self):
+        return await self._run(self.path_instance.exists)
+
+    async def is_dir(self):
+        return await self._run(self.path_instance.is_dir)
+
+    async def is_file(self):
+        return await self._run(self.path_instance.is_file)
+
+    async def is_symlink(self):
+        return await self._run(self.path_instance.is_symlink)
+
+    async def copyfile(self, other, **kwargs):
+        """
+        see: Path2().copyfile()
+        Note: a 'callback' will be called in the executor thread.
+        """
+        return await self._run(self.path_instance.copyfile, Path2(str(other)), **kwargs)
+
+    async def hash_content(self, algorithms=None, block_size=None):
+        return await self._run(self.path_instance.hash_content, algorithms=algorithms, block_size=block_size)
+
+    async def link(self, other):
+        return await self._run(self.path_instance.link, Path2(str(other)))
+
+    async def makedirs(self, *args, **kwargs):
+        return await self._run(self.path_instance.makedirs, *args, **kwargs)
+
+    async def utime(self, *args, **kwargs):
+        return await self._run(self.path_instance.utime, *args, **kwargs)
+
+    async def unlink(self):
+        return await self._run(self.path_instance.unlink)
+
+    async def rmdir(self):
+        return await self._run(self.path_instance.rmdir)
+
+    async def listdir(self):
+        return await self._run(self.path_instance.listdir)
+
+    def scandir(self):
+        """
+        Async iterator over the os.DirEntry() instances of this directory.
+        """
+        return self.executor.iterate(self.path_instance.scandir)
+
+    def walk_parallel(self, max_workers=None, topdown=True, onerror=print, max_queue=None, resolve_cache=None,
+                      path_filter=None):
+        """
+        Async iterator over the DirEntryPath() instances of Path2().walk_parallel()
+
+        Note: 'onerror' will be called in the executor thread.
+        """
+        return self.executor.iterate(functools.partial(
+            self.path_instance.walk_parallel,
+            max_workers=max_workers, topdown=topdown, onerror=onerror, max_queue=max_queue,
+            resolve_cache=resolve_cache, path_filter=path_filter,
+        ))
@@ -0,0 +1,120 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Compare the content of files.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import mmap
+import os
+import stat
+
+DEFAULT_SAMPLES = 8
+DEFAULT_SAMPLE_SIZE = 4 * 1024  # 4 KiB
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB
+
+
+def _pread(f, size, offset):
+    try:
+        pread = os.pread
+    except AttributeError:
+        # e.g.: under Windows
+        f.seek(offset)
+        return f.read(size)
+    return pread(f.fileno(), size, offset)
+
+
+def _read_full(f, size):
+    """
+    Read 'size' bytes, unless the end of the file is reached.
+    Unbuffered reads from e.g. pipes may return less bytes.
+    """
+    data = f.read(size)
+    if not data or len(data) == size:
+        return data
+    parts = [data]
+    size -= len(data)
+    while size:
+        data = f.read(size)
+        if not data:
+            break
+        parts.append(data)
+        size -= len(data)
+    return b"".join(parts)
+
+
+def _same_samples(f1, f2, size, samples, sample_size):
+    """
+    Compare 'samples' blocks spread over the whole file.
+    """
+    last_offset = size - sample_size
+    for no in range(samples):
+        offset = last_offset * no // (samples - 1)
+        if _pread(f1, sample_size, offset) != _pread(f2, sample_size, offset):
+            return False
+    return True
+
+
+def _same_mmap(f1, f2, size, chunk_size):
+    with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as map1:
+        with mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as map2:
+            if hasattr(map1, "madvise"):  # new in Python 3.8
+                map1.madvise(mmap.MADV_SEQUENTIAL)
+                map2.madvise(mmap.MADV_SEQUENTIAL)
+            for offset in range(0, size, chunk_size):
+                if map1[offset:offset + chunk_size] != map2[offset:offset + chunk_size]:
+                    return False
+    return True
+
+
+def _same_buffered(f1, f2, chunk_size):
+    f1.seek(0)
+    f2.seek(0)
+    while True:
+        data1 = _read_full(f1, chunk_size)
+        if data1 != _read_full(f2, chunk_size):
+            return False
+        if not data1:
+            return True
+
+
+def same_content(path1, path2, samples=DEFAULT_SAMPLES, sample_size=DEFAULT_SAMPLE_SIZE,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns True, if both files have the same content.
+
+    The files are compared in stages, so different files are rarely read completely:
+        1. the same (st_dev, st_ino) -> same content, different size -> different content
+        2. compare 'samples' blocks of 'sample_size' spread over the files
+        3. compare the memory-mapped files in chunks of 'chunk_size', until the first difference
+
+    Files that can't be mapped (e.g.: pipes or special files) are compared by reading them.
+    """
+    with open(path1, "rb", buffering=0) as f1, open(path2, "rb", buffering=0) as f2:
+        st1 = os.fstat(f1.fileno())
+        st2 = os.fstat(f2.fileno())
+        if st1.st_ino and (st1.st_dev, st1.st_ino) == (st2.st_dev, st2.st_ino):
+            return True
+
+        if not (stat.S_ISREG(st1.st_mode) and stat.S_ISREG(st2.st_mode)):
+            # The size of special files has no meaning
+            return _same_buffered(f1, f2, chunk_size)
+
+        size = st1.st_size
+        if size != st2.st_size:
+            return False
+        if size == 0:
+            return True
+
+        if size > chunk_size and samples > 1:
+            if not _same_samples(f1, f2, size, samples, sample_size):
+                return False
+
+        try:
+            return _same_mmap(f1, f2, size, chunk_size)
+        except (OSError, ValueError):
+            # e.g.: a file system without mmap support
+            return _same_buffered(f1, f2, chunk_size)
@@ -0,0 +1,140 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Copy directory trees.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import os
+import stat
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# pathlib_revised
+from pathlib_revised.file_copy import copy_file
+from pathlib_revised.links import link_many
+from pathlib_revised.pathlib import Path2
+from pathlib_revised.walk import default_max_workers
+
+CopyTreeError = collections.namedtuple("CopyTreeError", ("source", "destination", "error"))
+
+
+def _set_metadata(item):
+    """
+    Set the permissions and the access/modification times of the copied entry.
+    """
+    src, dst, st = item
+    try:
+        if stat.S_ISLNK(st.st_mode):
+            if os.utime in os.supports_follow_symlinks:
+                os.utime(dst.extended_path, ns=(st.st_atime_ns, st.st_mtime_ns), follow_symlinks=False)
+        else:
+            os.chmod(dst.extended_path, stat.S_IMODE(st.st_mode))
+            os.utime(dst.extended_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError as err:
+        return CopyTreeError(src, dst, err)
+
+
+def copy_tree(src, dst, max_workers=None, max_in_flight=None, dirs_exist_ok=False, onerror=print,
+              reflink=False, sparse=False):
+    """
+    Copy the directory tree 'src' to 'dst'.
+
+    The tree is walked with walk_parallel() and the files are copied with
+    copy_file() in a thread pool. Hardlinks are recreated: Only the first
+    path of a (st_dev, st_ino) group is copied, the other paths are linked
+    to it. Symlinks are copied as symlinks.
+
+    The permissions and the access/modification times are set in a final
+    pass, after all data was written.
+
+    Scan errors are reported via onerror(message), like walk_parallel().
+    Errors doesn't stop the copying: Returns a list of
+    CopyTreeError(source, destination, error) for all failed entries.
+    """
+    src = Path2(src)
+    dst = Path2(dst)
+    max_workers = max_workers or default_max_workers()
+    max_in_flight = max_in_flight or max_workers * 2
+
+    src_stat = src.stat()
+    dst.makedirs(exist_ok=dirs_exist_ok)
+
+    errors = []
+    metadata = []  # (source, destination, stat result) of all directories, files and symlinks
+    dir_metadata = [(src, dst, src_stat)]
+    dst_dirs = {src.path: dst}  # source directory path -> destination Path2() instance
+    inodes = {}  # (st_dev, st_ino) -> destination of the first path of a hardlink group
+    link_pairs = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}
+
+        def process_done(return_when):
+            done, not_done = wait(in_flight, return_when=return_when)
+            for future in done:
+                src_path, dst_path = in_flight.pop(future)
+                try:
+                    future.result()
+                except OSError as err:
+                    errors.append(CopyTreeError(src_path, dst_path, err))
+
+        for entry in src.walk_parallel(max_workers=max_workers, onerror=onerror):
+            src_path = entry.path_instance
+            dst_dir = dst_dirs.get(src_path.parent.path)
+            if dst_dir is None:
+                # The destination directory wasn't created (error is recorded): skip the subtree
+                continue
+            dst_path = dst_dir.child(src_path.name)
+            try:
+                if entry.is_symlink:
+                    os.symlink(os.readlink(src_path.extended_path), dst_path.extended_path)
+                    metadata.append((src_path, dst_path, src_path.lstat()))
+                elif entry.is_dir:
+                    dst_path.mkdir(exist_ok=dirs_exist_ok)
+                    dst_dirs[src_path.path] = dst_path
+                    dir_metadata.append((src_path, dst_path, entry.stat))
+                else:
+                    st = entry.stat
+                    if st.st_nlink > 1:
+                        key = (st.st_dev, st.st_ino)
+                        if key in inodes:
+                            link_pairs.append((inodes[key], dst_path))
+                            continue
+                        inodes[key] = dst_path
+
+                    if len(in_flight) >= max_in_flight:
+                        process_done(FIRST_COMPLETED)
+                    future = executor.submit(
+                        copy_file, src_path.extended_path, dst_path.extended_path, reflink=reflink, sparse=sparse
+                    )
+                    in_flight[future] = (src_path, dst_path)
+                    metadata.append((src_path, dst_path, st))
+            except OSError as err:
+                errors.append(CopyTreeError(src_path, dst_path, err))
+
+        if in_flight:
+            process_done(ALL_COMPLETED)
+
+        # The first path of all hardlink groups are copied, now link the others:
+        for link_error in link_many(link_pairs, max_workers=max_workers):
+            errors.append(CopyTreeError(link_error.source, link_error.destination, link_error.error))
+
+        for error in executor.map(_set_metadata, metadata):
+            if error is not None:
+                errors.append(error)
+
+        # Set the metadata of the directories at last, the content may change the modification time.
+        # The deepest directories first: e.g.: a removed 'x' permission would block the sub directories.
+        levels = collections.defaultdict(list)
+        for item in dir_metadata:
+            levels[len(item[1].parts)].append(item)
+        for depth in sorted(levels, reverse=True):
+            for error in executor.map(_set_metadata, levels[depth]):
+                if error is not None:
+                    errors.append(error)
+
+    return errors
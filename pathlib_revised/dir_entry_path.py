@@ -8,7 +8,10 @@
 """
 
 # pathlib_revised
-from pathlib_revised.pathlib import Path2
+from pathlib_revised.pathlib import IS_WINDOWS, Path2, SharedPathMethods
+
+# Marker for not yet computed attributes
+_UNSET = object()
 
 
 class DirEntryPath:
@@ -40,33 +43,148 @@ class DirEntryPath:
         self.different_path = True
         self.resolved_path = None
         self.resolve_error: contains the Error instance
-    """
 
-    def __init__(self, path, onerror=print):
-        self.path_instance = Path2(path)
-        self.path = str(self.path_instance)
+    All information will be computed on first access and cached.
+    A ResolveCache() instance can be used for resolved_path, see:
+    pathlib_revised.resolve_cache
 
-        self.is_symlink = self.path_instance.is_symlink()
-        self.is_file = self.path_instance.is_file()
-        self.is_dir = self.path_instance.is_dir()
-        self.stat = self.path_instance.stat()
+    To save memory, a instance from from_dir_entry(parent=...) stores only
+    the parent Path2() instance (shared by all entries of the directory) and
+    the name, until .path_instance is used the first time.
+    """
 
+    __slots__ = (
+        "_path_instance", "_parent", "_name", "_onerror", "_resolve_cache",
+        "_is_symlink", "_is_file", "_is_dir", "_stat",
+        "_resolved_path", "_resolve_error",
+    )
+
+    def __init__(self, path, onerror=print, resolve_cache=None):
+        if not isinstance(path, SharedPathMethods):
+            path = Path2(path)
+        self._setup(path, None, None, onerror, resolve_cache)
+
+    def _setup(self, path_instance, parent, name, onerror, resolve_cache):
+        self._path_instance = path_instance
+        self._parent = parent
+        self._name = name
+        self._onerror = onerror
+        self._resolve_cache = resolve_cache
+
+        self._is_symlink = _UNSET
+        self._is_file = _UNSET
+        self._is_dir = _UNSET
+        self._stat = _UNSET
+
+        self._resolved_path = _UNSET
+        self._resolve_error = _UNSET
+
+    @classmethod
+    def from_dir_entry(cls, dir_entry, onerror=print, resolve_cache=None, parent=None):
+        """
+        Create a instance from a os.DirEntry() instance, e.g.: from Path2().scandir()
+
+        The file type information (d_type) of the os.DirEntry() is reused,
+        so that no stat call is needed for the "is_*" information.
+        The os.DirEntry() instance itself is not stored.
+
+        'parent' is the Path2() instance of the scanned directory:
+        The path will be created via parent.child() without parsing it again.
+        """
+        if parent is None:
+            self = cls(dir_entry.path, onerror=onerror, resolve_cache=resolve_cache)
+        else:
+            self = cls.__new__(cls)
+            self._setup(None, parent, dir_entry.name, onerror, resolve_cache)
+
+        self._is_symlink = dir_entry.is_symlink()
+        self._is_file = dir_entry.is_file()
+        self._is_dir = dir_entry.is_dir()
+
+        if self._is_symlink and not IS_WINDOWS:
+            # is_file() and is_dir() must follow the symlink, so
+            # os.DirEntry() has already a cached stat result.
+            # Note: Under Windows os.DirEntry().stat() doesn't fill
+            # st_ino, st_dev and st_nlink
+            try:
+                self._stat = dir_entry.stat()
+            except OSError:
+                # e.g.: broken symlink -> .stat will raise the error
+                pass
+
+        return self
+
+    @property
+    def path_instance(self):
+        if self._path_instance is None:
+            self._path_instance = self._parent.child(self._name)
+        return self._path_instance
+
+    @property
+    def path(self):
+        return self.path_instance.path
+
+    @property
+    def is_symlink(self):
+        if self._is_symlink is _UNSET:
+            self._is_symlink = self.path_instance.is_symlink()
+        return self._is_symlink
+
+    @property
+    def is_file(self):
+        if self._is_file is _UNSET:
+            self._is_file = self.path_instance.is_file()
+        return self._is_file
+
+    @property
+    def is_dir(self):
+        if self._is_dir is _UNSET:
+            self._is_dir = self.path_instance.is_dir()
+        return self._is_dir
+
+    @property
+    def stat(self):
+        if self._stat is _UNSET:
+            self._stat = self.path_instance.stat()
+        return self._stat
+
+    def _resolve(self):
         try:
-            self.resolved_path = self.path_instance.resolve()
+            if self._resolve_cache is None:
+                self._resolved_path = self.path_instance.resolve()
+            else:
+                self._resolved_path = self._resolve_cache.resolve(
+                    self.path_instance, is_symlink=self.is_symlink, is_dir=self.is_dir
+                )
         except (PermissionError, FileNotFoundError) as err:
-            onerror("Resolve %r error: %s" % (self.path, err))
-            self.resolved_path = None
-            self.resolve_error = err
+            self._onerror("Resolve %r error: %s" % (self.path, err))
+            self._resolved_path = None
+            self._resolve_error = err
         else:
-            self.resolve_error = None
-
-        if self.resolved_path is None:
+            self._resolve_error = None
+
+    @property
+    def resolved_path(self):
+        if self._resolved_path is _UNSET:
+            self._resolve()
+        return self._resolved_path
+
+    @property
+    def resolve_error(self):
+        if self._resolved_path is _UNSET:
+            self._resolve()
+        return self._resolve_error
+
+    @property
+    def different_path(self):
+        resolved_path = self.resolved_path
+        if resolved_path is None:
             # e.g.: broken symlink under linux
-            self.different_path = True
-        else:
-            # e.g.: a junction under windows
-            # https://www.python-forum.de/viewtopic.php?f=1&t=37725&p=290429#p290428 (de)
-            self.different_path = self.path_instance.path != self.resolved_path.path
+            return True
+
+        # e.g.: a junction under windows
+        # https://www.python-forum.de/viewtopic.php?f=1&t=37725&p=290429#p290428 (de)
+        return self.path_instance.path != resolved_path.path
 
     def pformat(self):
         return "\n".join((
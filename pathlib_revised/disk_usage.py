@@ -0,0 +1,163 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Hardlink aware disk usage of directory trees.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import stat
+
+# pathlib_revised
+from pathlib_revised.pathlib import Path2
+from pathlib_revised.walk import SCANNED, _TreeScheduler
+
+
+def _allocated_size(st):
+    # st_blocks is always in 512-byte units, not in st_blksize. Not available under Windows.
+    blocks = getattr(st, "st_blocks", None)
+    if blocks is None:
+        return st.st_size
+    return blocks * 512
+
+
+class DiskUsage:
+    """
+    The summed up usage of a directory tree.
+    Every (st_dev, st_ino) is counted only once, additional hardlinks are
+    counted in 'hardlinks' only.
+    """
+    __slots__ = ("apparent_size", "allocated_size", "files", "dirs", "symlinks", "hardlinks")
+
+    def __init__(self):
+        self.apparent_size = 0  # sum of st_size
+        self.allocated_size = 0  # sum of the allocated blocks in bytes
+        self.files = 0
+        self.dirs = 0
+        self.symlinks = 0
+        self.hardlinks = 0  # number of skipped paths to already counted inodes
+
+    def add_stat(self, st):
+        self.apparent_size += st.st_size
+        self.allocated_size += _allocated_size(st)
+        mode = st.st_mode
+        if stat.S_ISDIR(mode):
+            self.dirs += 1
+        elif stat.S_ISLNK(mode):
+            self.symlinks += 1
+        else:
+            self.files += 1
+
+    def add(self, other):
+        for attr in self.__slots__:
+            setattr(self, attr, getattr(self, attr) + getattr(other, attr))
+
+    def as_dict(self):
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    def __eq__(self, other):
+        if not isinstance(other, DiskUsage):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return "<DiskUsage %s>" % " ".join("%s=%i" % item for item in self.as_dict().items())
+
+
+def _scan_usage(node, one_file_system):
+    """
+    Sum up the usage of all not hardlinked entries of one directory.
+    Returns: ((usage, hardlinked entries, errors), sub directory nodes)
+    """
+    path, st, parent_key = node
+    usage = DiskUsage()
+    usage.add_stat(st)
+    linked = []  # (stat result) of files with more than one link
+    errors = []
+    children = []
+    try:
+        with path.scandir() as scandir_it:
+            for dir_entry in scandir_it:
+                try:
+                    entry_stat = dir_entry.stat(follow_symlinks=False)
+                except OSError as err:
+                    errors.append("Stat %r error: %s" % (dir_entry.path, err))
+                    continue
+                if stat.S_ISDIR(entry_stat.st_mode):
+                    if one_file_system and entry_stat.st_dev != st.st_dev:
+                        continue
+                    children.append((path.child(dir_entry.name), entry_stat, path.path))
+                elif entry_stat.st_nlink > 1 and entry_stat.st_ino:
+                    linked.append(entry_stat)
+                else:
+                    usage.add_stat(entry_stat)
+    except OSError as err:
+        errors.append("Scandir %r error: %s" % (path.path, err))
+    return (usage, linked, errors), children
+
+
+def iter_disk_usage(top, max_workers=None, max_queue=None, onerror=print, one_file_system=False):
+    """
+    Walk the directory tree 'top' with a thread pool and yield (path, DiskUsage())
+    for every directory, after all of its sub directories. The DiskUsage() of a
+    directory contains the directory itself and its whole subtree,
+    the last yielded item is 'top' with the total usage.
+
+    Files with more than one link are counted once per (st_dev, st_ino), in the
+    subtree, where the first link was found (same as 'du'). The inode of a group
+    is forgotten, after all of its links are seen, so the memory usage depends
+    only on the number of hardlink groups with links outside of the scanned part.
+
+    Symlinks are counted, but not followed.
+    one_file_system=True: skip directories on other file systems (like 'du -x')
+    Scan errors are reported via onerror(message) in the calling thread.
+    """
+    top = Path2(top)
+    root = (top, top.stat(), None)
+
+    def scan_func(node):
+        return _scan_usage(node, one_file_system)
+
+    totals = {}  # path of scanned, but not finished directories -> DiskUsage()
+    remaining_links = {}  # (st_dev, st_ino) -> number of not yet seen links
+
+    scheduler = _TreeScheduler(scan_func, max_workers=max_workers, max_queue=max_queue)
+    for event, node, result in scheduler.run(root):
+        path, st, parent_key = node
+        if event == SCANNED:
+            usage, linked, errors = result
+            for error in errors:
+                onerror(error)
+
+            for entry_stat in linked:
+                key = (entry_stat.st_dev, entry_stat.st_ino)
+                remaining = remaining_links.pop(key, None)
+                if remaining is None:
+                    usage.add_stat(entry_stat)
+                    remaining_links[key] = entry_stat.st_nlink - 1
+                else:
+                    usage.hardlinks += 1
+                    if remaining > 1:
+                        remaining_links[key] = remaining - 1
+
+            totals[path.path] = usage
+        else:  # DONE: all sub directories are added
+            usage = totals.pop(path.path)
+            if parent_key is not None:
+                totals[parent_key].add(usage)
+            yield path, usage
+
+
+def disk_usage(top, max_workers=None, onerror=print, one_file_system=False):
+    """
+    Returns the DiskUsage() of the directory tree 'top'
+    see: iter_disk_usage()
+    """
+    usage = None
+    for path, usage in iter_disk_usage(
+        top, max_workers=max_workers, onerror=onerror, one_file_system=one_file_system
+    ):
+        pass
+    return usage
@@ -0,0 +1,137 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Find files with the same content.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import hashlib
+import os
+
+# pathlib_revised
+from pathlib_revised.dir_entry_path import DirEntryPath
+from pathlib_revised.hashing import hash_file, hash_many
+
+DEFAULT_PARTIAL_SIZE = 4 * 1024  # 4 KiB
+DEFAULT_ALGORITHM = "sha512"
+
+
+def partial_hash(path, partial_size=DEFAULT_PARTIAL_SIZE, algorithm=DEFAULT_ALGORITHM):
+    """
+    Returns the hex digest of the first and the last 'partial_size' bytes of the file.
+    Files up to 2 * partial_size are completely hashed.
+    """
+    hasher = hashlib.new(algorithm)
+    with open(path.extended_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        hasher.update(f.read(partial_size))
+        if size > partial_size:
+            f.seek(max(partial_size, size - partial_size))
+            hasher.update(f.read(partial_size))
+    return hasher.hexdigest()
+
+
+def _group_by_inode(entries, min_size, onerror):
+    """
+    Returns {file size: {(st_dev, st_ino): [DirEntryPath, ...]}}
+    """
+    sizes = collections.defaultdict(lambda: collections.defaultdict(list))
+    for entry in entries:
+        if not isinstance(entry, DirEntryPath):
+            entry = DirEntryPath(entry, onerror=onerror)
+        try:
+            if not entry.is_file or entry.is_symlink:
+                continue
+            stat = entry.stat
+        except OSError as err:
+            onerror("Stat %r error: %s" % (entry.path, err))
+            continue
+        if stat.st_size >= min_size:
+            sizes[stat.st_size][(stat.st_dev, stat.st_ino)].append(entry)
+    return sizes
+
+
+def _split_groups(inode_groups, hash_func, onerror):
+    """
+    Split a list of inode groups by the hash of the first entry
+    and returns only groups with more than one inode.
+    """
+    hashes = collections.defaultdict(list)
+    for inode_group in inode_groups:
+        try:
+            digest = hash_func(inode_group[0])
+        except OSError as err:
+            onerror("Hash %r error: %s" % (inode_group[0].path, err))
+        else:
+            hashes[digest].append(inode_group)
+    return [groups for groups in hashes.values() if len(groups) > 1]
+
+
+def find_duplicates(entries, partial_size=DEFAULT_PARTIAL_SIZE, algorithm=DEFAULT_ALGORITHM,
+                    min_size=1, max_workers=1, onerror=print):
+    """
+    Find files with the same content in 'entries' (DirEntryPath() or Path2() instances)
+
+    Yields lists of duplicates. Every duplicate is a list of DirEntryPath()
+    instances with the same (st_dev, st_ino), so hardlinks are collapsed and
+    hashed only once, e.g.:
+        [[<DirEntryPath a>, <DirEntryPath hardlink_to_a>], [<DirEntryPath b>]]
+
+    The files are compared in stages, so most of them are never read completely:
+        1. group by file size
+        2. group by the hash of the first and the last 'partial_size' bytes
+        3. group by the hash of the complete content
+
+    With max_workers > 1 the complete content is hashed in a process pool.
+    Errors are reported via onerror(message) and the file is skipped.
+    """
+    sizes = _group_by_inode(entries, min_size, onerror)
+
+    def get_partial_hash(entry):
+        return partial_hash(entry.path_instance, partial_size=partial_size, algorithm=algorithm)
+
+    def get_full_hash(entry):
+        return hash_file(entry.path_instance.extended_path, algorithms=(algorithm,))[algorithm]
+
+    full_hash_groups = []
+    for size in sorted(sizes, reverse=True):
+        inode_groups = list(sizes[size].values())
+        if len(inode_groups) < 2:
+            continue
+
+        for partial_groups in _split_groups(inode_groups, get_partial_hash, onerror):
+            if size <= partial_size * 2:
+                # partial hash covers the complete content
+                yield partial_groups
+            elif max_workers > 1:
+                full_hash_groups.append(partial_groups)
+            else:
+                yield from _split_groups(partial_groups, get_full_hash, onerror)
+
+    if full_hash_groups:
+        yield from _split_groups_parallel(full_hash_groups, algorithm, max_workers, onerror)
+
+
+def _split_groups_parallel(candidates, algorithm, max_workers, onerror):
+    """
+    Hash the first entry of all inode groups in a process pool and
+    split the candidate lists by the hash.
+    """
+    first_entries = {}
+    for candidate_no, inode_groups in enumerate(candidates):
+        for inode_group in inode_groups:
+            first_entries[inode_group[0]] = (candidate_no, inode_group)
+
+    hashes = collections.defaultdict(list)
+    results = hash_many(first_entries, algorithms=(algorithm,), max_workers=max_workers, onerror=onerror)
+    for entry, digests in results:
+        candidate_no, inode_group = first_entries[entry]
+        hashes[(candidate_no, digests[algorithm])].append(inode_group)
+
+    for groups in hashes.values():
+        if len(groups) > 1:
+            yield groups
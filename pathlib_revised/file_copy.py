@@ -0,0 +1,280 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Copy file content with the fastest available strategy.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import errno
+import os
+import shutil
+import stat
+import sys
+
+try:
+    import fcntl
+except ImportError:
+    # e.g.: Windows
+    fcntl = None
+
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024  # 8 MiB
+
+# The copy strategies:
+REFLINK = "reflink"  # copy-on-write clone via FICLONE ioctl (Linux: e.g. btrfs, xfs)
+SPARSE = "sparse"  # copy only the data parts via SEEK_DATA/SEEK_HOLE and keep holes
+COPY_FILE_RANGE = "copy_file_range"  # kernel side copy via os.copy_file_range() (Linux, Python 3.8+)
+SENDFILE = "sendfile"  # kernel side copy via os.sendfile() (Linux)
+READINTO = "readinto"  # read into a reusable buffer and write it
+SYMLINK = "symlink"  # follow_symlinks=False and source is a symlink
+
+DEFAULT_STRATEGIES = (COPY_FILE_RANGE, SENDFILE, READINTO)
+
+# copy_file_range() and sendfile() may fill the holes:
+SPARSE_STRATEGIES = (SPARSE, READINTO)
+
+# from linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+CopyResult = collections.namedtuple("CopyResult", ("strategy", "bytes_copied"))
+
+# Errors, that signals, that a strategy can't be used for the files:
+FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name) for name in (
+        "EBADF", "EINVAL", "ENOSYS", "ENOTSOCK", "ENOTSUP", "ENOTTY", "EOPNOTSUPP", "EXDEV",
+    ) if hasattr(errno, name)
+)
+
+
+class StrategyUnavailable(Exception):
+    """
+    A copy strategy can't be used, the next one should be tried.
+    """
+    pass
+
+
+def _reflink(fsrc, fdst, size, block_size, progress):
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise StrategyUnavailable(OSError(errno.ENOTSUP, "FICLONE is not available"))
+
+    try:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError as err:
+        if err.errno in FALLBACK_ERRNOS or err.errno == errno.EPERM:
+            # e.g.: EOPNOTSUPP on ext4/tmpfs, EXDEV for different filesystems
+            raise StrategyUnavailable(err)
+        raise
+
+    progress(size)
+    return size
+
+
+def _sparse(fsrc, fdst, size, block_size, progress):
+    if not hasattr(os, "SEEK_DATA"):
+        raise StrategyUnavailable(OSError(errno.ENOTSUP, "SEEK_DATA/SEEK_HOLE is not available"))
+
+    infd = fsrc.fileno()
+    buffer = bytearray(max(1, min(block_size, size)))
+    with memoryview(buffer) as buffer_view:
+        bytes_copied = 0
+        offset = 0
+        while offset < size:
+            try:
+                data_start = os.lseek(infd, offset, os.SEEK_DATA)
+            except OSError as err:
+                if err.errno == errno.ENXIO:
+                    # Only a hole after offset
+                    break
+                if offset == 0 and err.errno in FALLBACK_ERRNOS:
+                    raise StrategyUnavailable(err)
+                raise
+            hole_start = os.lseek(infd, data_start, os.SEEK_HOLE)
+
+            fsrc.seek(data_start)
+            fdst.seek(data_start)  # Seek behind the end will create a hole
+            remaining = hole_start - data_start
+            while remaining > 0:
+                with buffer_view[:min(remaining, len(buffer))] as chunk:
+                    read = fsrc.readinto(chunk)
+                    if not read:
+                        break
+                    written = 0
+                    while written < read:
+                        written += fdst.write(chunk[written:read])
+                remaining -= read
+                bytes_copied += read
+                progress(bytes_copied)
+
+            offset = hole_start
+
+    # Create the hole at the end of the file:
+    fdst.truncate(size)
+    return bytes_copied
+
+
+def _copy_file_range(fsrc, fdst, size, block_size, progress):
+    try:
+        copy_file_range = os.copy_file_range  # new in Python 3.8
+    except AttributeError:
+        raise StrategyUnavailable(OSError(errno.ENOSYS, "os.copy_file_range() is not available"))
+
+    infd = fsrc.fileno()
+    outfd = fdst.fileno()
+    bytes_copied = 0
+    while True:
+        try:
+            sent = copy_file_range(infd, outfd, block_size)
+        except OSError as err:
+            if bytes_copied == 0 and err.errno in FALLBACK_ERRNOS:
+                raise StrategyUnavailable(err)
+            raise
+        if sent == 0:
+            if bytes_copied == 0 and size > 0:
+                # e.g.: some pseudo filesystems returns always 0
+                raise StrategyUnavailable(OSError(errno.ENOTSUP, "copy_file_range() copied nothing"))
+            return bytes_copied
+        bytes_copied += sent
+        progress(bytes_copied)
+
+
+def _sendfile(fsrc, fdst, size, block_size, progress):
+    try:
+        sendfile = os.sendfile
+    except AttributeError:
+        raise StrategyUnavailable(OSError(errno.ENOSYS, "os.sendfile() is not available"))
+
+    infd = fsrc.fileno()
+    outfd = fdst.fileno()
+    bytes_copied = 0
+    while True:
+        try:
+            sent = sendfile(outfd, infd, bytes_copied, block_size)
+        except OSError as err:
+            if bytes_copied == 0 and err.errno in FALLBACK_ERRNOS:
+                # e.g.: ENOTSOCK under macOS, EINVAL under old Linux kernels
+                raise StrategyUnavailable(err)
+            raise
+        if sent == 0:
+            return bytes_copied
+        bytes_copied += sent
+        progress(bytes_copied)
+
+
+def _readinto(fsrc, fdst, size, block_size, progress):
+    # Don't allocate a big buffer for small files:
+    buffer = bytearray(max(1, min(block_size, size)))
+    with memoryview(buffer) as buffer_view:
+        bytes_copied = 0
+        while True:
+            read = fsrc.readinto(buffer_view)
+            if not read:
+                return bytes_copied
+
+            with buffer_view[:read] as chunk:
+                written = 0
+                while written < read:
+                    written += fdst.write(chunk[written:])
+
+            bytes_copied += read
+            progress(bytes_copied)
+
+
+STRATEGY_FUNCS = {
+    REFLINK: _reflink,
+    SPARSE: _sparse,
+    COPY_FILE_RANGE: _copy_file_range,
+    SENDFILE: _sendfile,
+    READINTO: _readinto,
+}
+
+
+def _samefile(src, dst):
+    try:
+        return os.path.samefile(src, dst)
+    except OSError:
+        return False
+
+
+def _check_special_files(*filenames):
+    for filename in filenames:
+        try:
+            st = os.stat(filename)
+        except OSError:
+            # File most likely does not exist
+            pass
+        else:
+            if stat.S_ISFIFO(st.st_mode):
+                raise shutil.SpecialFileError("`%s` is a named pipe" % filename)
+
+
+def get_strategies(reflink=False, sparse=False):
+    """
+    Returns the copy strategies for the given copy mode.
+    """
+    if sparse:
+        strategies = SPARSE_STRATEGIES
+    else:
+        strategies = DEFAULT_STRATEGIES
+
+    if reflink:
+        # A copy-on-write clone shares the data blocks, so holes are kept, too.
+        strategies = (REFLINK,) + strategies
+
+    return strategies
+
+
+def copy_file(src, dst, follow_symlinks=True, block_size=None, callback=None, strategies=None,
+              reflink=False, sparse=False):
+    """
+    Copy the content of the file 'src' to 'dst' (both are str paths).
+    Raise errors like shutil.copyfile(), returns a CopyResult(strategy, bytes_copied)
+
+    All 'strategies' are tried in the given order, until one can be used.
+    The next strategy will only be used, if the previous one failed
+    without copying anything.
+    If no 'strategies' are given, they are chosen by get_strategies(reflink, sparse)
+
+    callback(bytes_copied, file_size) is called after every copied chunk.
+    """
+    block_size = block_size or DEFAULT_BLOCK_SIZE
+    if strategies is None:
+        strategies = get_strategies(reflink=reflink, sparse=sparse)
+    elif reflink or sparse:
+        raise ValueError("Use 'strategies' or 'reflink'/'sparse', but not both!")
+    if not strategies:
+        raise ValueError("No copy strategy given!")
+    for strategy in strategies:
+        if strategy not in STRATEGY_FUNCS:
+            raise ValueError("Unknown copy strategy: %r" % strategy)
+
+    if _samefile(src, dst):
+        raise shutil.SameFileError("%r and %r are the same file" % (src, dst))
+
+    _check_special_files(src, dst)
+
+    if not follow_symlinks and os.path.islink(src):
+        os.symlink(os.readlink(src), dst)
+        return CopyResult(SYMLINK, 0)
+
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+
+        if callback is None:
+            def progress(bytes_copied):
+                pass
+        else:
+            def progress(bytes_copied):
+                callback(bytes_copied, size)
+
+        for strategy in strategies:
+            try:
+                bytes_copied = STRATEGY_FUNCS[strategy](fsrc, fdst, size, block_size, progress)
+            except StrategyUnavailable as err:
+                last_error = err.args[0]
+            else:
+                return CopyResult(strategy, bytes_copied)
+
+    raise last_error
@@ -0,0 +1,236 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Exclude/include filter with gitignore-style patterns.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+import re
+
+# pathlib_revised
+from pathlib_revised.pathlib import Path2
+
+
+def _translate_segment(segment):
+    """
+    Translate one path segment of a pattern into a regular expression.
+    Like fnmatch.translate(), but the wildcards don't match "/"
+    """
+    result = []
+    index = 0
+    length = len(segment)
+    while index < length:
+        char = segment[index]
+        index += 1
+        if char == "*":
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "\\" and index < length:
+            result.append(re.escape(segment[index]))
+            index += 1
+        elif char == "[":
+            end = index
+            if end < length and segment[end] in "!^":
+                end += 1
+            if end < length and segment[end] == "]":
+                end += 1
+            while end < length and segment[end] != "]":
+                end += 1
+            if end >= length:
+                result.append("\\[")
+            else:
+                chars = segment[index:end].replace("\\", "\\\\")
+                if chars[0] in "!^":
+                    chars = "^" + chars[1:]
+                result.append("[%s]" % chars)
+                index = end + 1
+        else:
+            result.append(re.escape(char))
+    return "".join(result)
+
+
+def _translate_path(pattern):
+    """
+    Translate a anchored pattern (relative to the root) into a regular expression.
+    """
+    segments = pattern.split("/")
+    last = len(segments) - 1
+    result = []
+    for index, segment in enumerate(segments):
+        if segment == "**":
+            if index == last:
+                result.append(".*")  # everything inside
+            else:
+                result.append("(?:.*/)?")  # zero or more directories
+        else:
+            result.append(_translate_segment(segment))
+            if index != last:
+                result.append("/")
+    return "".join(result)
+
+
+def _literal(segment):
+    """
+    Returns the unescaped name, if the segment has no wildcards, otherwise None
+    """
+    result = []
+    escaped = False
+    for char in segment:
+        if escaped:
+            result.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in "*?[":
+            return None
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def _compile(regexes):
+    if not regexes:
+        return None
+    return re.compile("(?:%s)\\Z" % "|".join(regexes), re.DOTALL)
+
+
+class _PatternBlock:
+    """
+    Consecutive patterns with the same type (exclude or include), compiled into
+    a set of literal names and combined regular expressions.
+    """
+    __slots__ = (
+        "exclude",
+        "names", "dir_names",
+        "name_regex", "dir_name_regex",
+        "path_regex", "dir_path_regex",
+    )
+
+    def __init__(self, exclude, patterns):
+        self.exclude = exclude
+
+        names = ([], [])  # (for all entries, only for directories)
+        name_regexes = ([], [])
+        path_regexes = ([], [])
+        for pattern, dir_only in patterns:
+            index = 1 if dir_only else 0
+            if "/" in pattern:
+                path_regexes[index].append(_translate_path(pattern.lstrip("/")))
+                continue
+            name = _literal(pattern)
+            if name is None:
+                name_regexes[index].append(_translate_segment(pattern))
+            else:
+                names[index].append(name)
+
+        self.names, self.dir_names = frozenset(names[0]), frozenset(names[1])
+        self.name_regex, self.dir_name_regex = _compile(name_regexes[0]), _compile(name_regexes[1])
+        self.path_regex, self.dir_path_regex = _compile(path_regexes[0]), _compile(path_regexes[1])
+
+    def match(self, relative_path, name, is_dir):
+        if name in self.names:
+            return True
+        if self.name_regex is not None and self.name_regex.match(name):
+            return True
+        if self.path_regex is not None and self.path_regex.match(relative_path):
+            return True
+        if is_dir:
+            if name in self.dir_names:
+                return True
+            if self.dir_name_regex is not None and self.dir_name_regex.match(name):
+                return True
+            if self.dir_path_regex is not None and self.dir_path_regex.match(relative_path):
+                return True
+        return False
+
+
+class PathFilter:
+    """
+    Exclude paths with gitignore-style patterns, e.g.:
+
+        path_filter = PathFilter(["node_modules/", ".git/", "*.tmp", "!keep.tmp", "/build/**/cache"])
+        path_filter.is_excluded("src/foo.tmp") -> True
+
+    * A pattern without "/" matches the name in any directory
+    * A pattern with a "/" at the start or in the middle is relative to the root
+    * A pattern with a "/" at the end matches only directories
+    * "*" and "?" doesn't match a "/", "**" matches any number of directories
+    * A pattern with "!" at the start includes paths excluded by a previous pattern
+    * Empty lines and lines starting with "#" are ignored
+
+    All patterns are compiled once: Literal names are looked up in sets and the
+    other patterns are combined into single regular expressions.
+    Like git: Paths in excluded directories can't be included again.
+    Use it with walk_parallel(path_filter=...), fwalk(path_filter=...) or
+    PathFilter.scandir(), so excluded directories are never scanned.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = []
+        blocks = []
+        for line in patterns:
+            pattern = line.rstrip("\n")
+            if not pattern.endswith("\\ "):
+                pattern = pattern.rstrip(" ")
+            if not pattern or pattern.startswith("#"):
+                continue
+            self.patterns.append(pattern)
+
+            exclude = True
+            if pattern.startswith("!"):
+                exclude = False
+                pattern = pattern[1:]
+            elif pattern.startswith(("\\!", "\\#")):
+                pattern = pattern[1:]
+
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if not pattern:
+                continue
+
+            if not blocks or blocks[-1][0] != exclude:
+                blocks.append((exclude, []))
+            blocks[-1][1].append((pattern, dir_only))
+
+        # The last matching pattern decides, so the blocks are checked in reverse order:
+        self._blocks = tuple(_PatternBlock(exclude, block_patterns) for exclude, block_patterns in reversed(blocks))
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Create a filter from a file with one pattern per line, e.g.: a .gitignore file
+        """
+        with Path2(path).open("r") as f:
+            return cls(f.readlines())
+
+    def is_excluded(self, relative_path, is_dir=False):
+        """
+        Is the path excluded? 'relative_path' is relative to the root of the walk.
+        """
+        if os.sep != "/":
+            relative_path = relative_path.replace(os.sep, "/")
+        name = relative_path.rpartition("/")[2]
+        for block in self._blocks:
+            if block.match(relative_path, name, is_dir):
+                return block.exclude
+        return False
+
+    def scandir(self, path, relative_dir=""):
+        """
+        Like Path2().scandir(), but yields only the not excluded os.DirEntry() instances.
+        'relative_dir' is the path of the directory relative to the root.
+        """
+        if relative_dir:
+            relative_dir = relative_dir.rstrip("/" + os.sep) + "/"
+        with Path2(path).scandir() as scandir_it:
+            for dir_entry in scandir_it:
+                if not self.is_excluded(relative_dir + dir_entry.name, dir_entry.is_dir(follow_symlinks=False)):
+                    yield dir_entry
+
+    def __repr__(self):
+        return "<PathFilter %r>" % self.patterns
@@ -0,0 +1,224 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    glob engine based on os.scandir()
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import fnmatch
+import functools
+import os
+import re
+import threading
+
+# pathlib_revised
+from pathlib_revised.walk import SCANNED, _TreeScheduler
+
+# The segment types of a compiled pattern:
+LITERAL = "literal"  # a name without wildcards
+WILDCARD = "wildcard"  # a name with wildcards
+RECURSIVE = "recursive"  # "**": this directory and all sub directories
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern, case_sensitive=True):
+    """
+    Compile a relative glob pattern into a tuple of (segment type, name or match function)
+    """
+    if not pattern:
+        raise ValueError("Unacceptable pattern: %r" % pattern)
+    if pattern.startswith(("/", os.sep)) or os.path.splitdrive(pattern)[0]:
+        raise NotImplementedError("Non-relative patterns are unsupported")
+
+    segments = []
+    for part in re.split(r"[/%s]+" % re.escape(os.sep), pattern):
+        if part in ("", "."):
+            continue
+        if part == "**":
+            if not segments or segments[-1][0] != RECURSIVE:
+                segments.append((RECURSIVE, None))
+        elif "**" in part:
+            raise ValueError("Invalid pattern: '**' can only be an entire path component")
+        elif _WILDCARD_CHARS.isdisjoint(part):
+            segments.append((LITERAL, part))
+        else:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            segments.append((WILDCARD, re.compile(fnmatch.translate(part), flags).match))
+
+    if not segments:
+        raise ValueError("Unacceptable pattern: %r" % pattern)
+    return tuple(segments)
+
+
+def _scandir(path):
+    """
+    Returns a list of all os.DirEntry() instances or None on errors.
+    The directory is closed, before the entries are processed.
+    """
+    try:
+        with os.scandir(path.extended_path) as scandir_it:
+            return list(scandir_it)
+    except OSError:
+        return None
+
+
+def _is_dir(dir_entry, follow_symlinks=True):
+    try:
+        return dir_entry.is_dir(follow_symlinks=follow_symlinks)
+    except OSError:
+        return False
+
+
+def _dir_key(dir_entry):
+    """
+    Returns (st_dev, st_ino) of a directory entry, only directories needs a stat call.
+    """
+    return dir_entry.stat(follow_symlinks=False).st_dev, dir_entry.inode()
+
+
+def _iter_dirs(path, visited):
+    """
+    Yields (directory path, entries) for 'path' and all sub directories.
+
+    The file type is taken from d_type of the os.DirEntry(), symlinks are not followed.
+    Directories with a (st_dev, st_ino) in 'visited' are skipped (e.g.: bind mounts)
+    """
+    stack = [path]
+    while stack:
+        dir_path = stack.pop()
+        entries = _scandir(dir_path)
+        if entries is None:
+            continue
+
+        for dir_entry in reversed(entries):
+            if _is_dir(dir_entry, follow_symlinks=False):
+                try:
+                    key = _dir_key(dir_entry)
+                except OSError:
+                    continue
+                if key not in visited:
+                    visited.add(key)
+                    stack.append(dir_path.child(dir_entry.name))
+
+        yield dir_path, entries
+
+
+def _select(path, segments, index, entries=None):
+    """
+    Yields all paths in 'path' that matches segments[index:]
+    'entries' are the already scanned os.DirEntry() instances of 'path', if available.
+    """
+    segment_type, segment = segments[index]
+    last = index == len(segments) - 1
+
+    if segment_type == LITERAL:
+        child = path.child(segment)
+        if last:
+            if os.path.exists(child.extended_path):
+                yield child
+        else:
+            yield from _select(child, segments, index + 1)
+
+    elif segment_type == WILDCARD:
+        if entries is None:
+            entries = _scandir(path)
+            if entries is None:
+                return
+        for dir_entry in entries:
+            if not segment(dir_entry.name):
+                continue
+            if last:
+                yield path.child(dir_entry.name)
+            elif _is_dir(dir_entry):
+                yield from _select(path.child(dir_entry.name), segments, index + 1)
+
+    else:  # RECURSIVE
+        try:
+            st = os.stat(path.extended_path)
+        except OSError:
+            return
+        for dir_path, dir_entries in _iter_dirs(path, visited={(st.st_dev, st.st_ino)}):
+            if last:
+                yield dir_path
+            else:
+                yield from _select(dir_path, segments, index + 1, dir_entries)
+
+
+def _select_parallel(path, segments, max_workers):
+    """
+    Like _select() for patterns starting with "**", but the directories are
+    scanned in a thread pool. Yields the results of one directory at once.
+    """
+    try:
+        st = os.stat(path.extended_path)
+    except OSError:
+        return
+    visited = {(st.st_dev, st.st_ino)}
+    lock = threading.Lock()
+
+    def scan_func(dir_path):
+        entries = _scandir(dir_path)
+        if entries is None:
+            return [], []
+
+        children = []
+        for dir_entry in entries:
+            if _is_dir(dir_entry, follow_symlinks=False):
+                try:
+                    key = _dir_key(dir_entry)
+                except OSError:
+                    continue
+                with lock:
+                    if key in visited:
+                        continue
+                    visited.add(key)
+                children.append(dir_path.child(dir_entry.name))
+
+        if len(segments) == 1:
+            results = [dir_path]
+        else:
+            results = list(_select(dir_path, segments, 1, entries))
+        return results, children
+
+    scheduler = _TreeScheduler(scan_func, max_workers=max_workers)
+    for event, dir_path, results in scheduler.run(path):
+        if event == SCANNED:
+            yield from results
+
+
+def iglob(path, pattern, max_workers=1, case_sensitive=True):
+    """
+    Yields all paths in the Path2() instance 'path', that matches the relative glob 'pattern'.
+
+    Same semantic as pathlib's glob(), but:
+    * The pattern is compiled once and cached
+    * The file type is taken from d_type of os.scandir() entries, so no
+      stat call is needed, except one for every directory in a "**" search
+    * Directories are visited only once in a "**" search (by st_dev and st_ino)
+    * With max_workers > 1, the directories of a pattern starting with "**"
+      (e.g.: from rglob()) are scanned in a thread pool.
+    """
+    segments = compile_pattern(pattern, case_sensitive)
+
+    if max_workers > 1 and segments[0][0] == RECURSIVE:
+        results = _select_parallel(path, segments, max_workers)
+    else:
+        results = _select(path, segments, 0)
+
+    if sum(1 for segment_type, segment in segments if segment_type == RECURSIVE) > 1:
+        # e.g.: "**/foo/**" can find the same path more than once
+        results = _unique(results)
+    yield from results
+
+
+def _unique(results):
+    seen = set()
+    for path in results:
+        if path.path not in seen:
+            seen.add(path.path)
+            yield path
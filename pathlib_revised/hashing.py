@@ -0,0 +1,149 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Calculate content hashes of files.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# pathlib_revised
+from pathlib_revised.dir_entry_path import DirEntryPath
+from pathlib_revised.pathlib import Path2
+
+DEFAULT_ALGORITHMS = ("sha512", "md5")
+DEFAULT_BLOCK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def _fadvise(fd, advice_name):
+    """
+    Call os.posix_fadvise() for the whole file, if available (e.g.: not under Windows)
+    """
+    try:
+        posix_fadvise = os.posix_fadvise
+    except AttributeError:
+        return
+    try:
+        posix_fadvise(fd, 0, 0, getattr(os, advice_name))
+    except OSError:
+        # e.g.: not supported for this file type
+        pass
+
+
+def hash_file(path, algorithms=None, block_size=None):
+    """
+    Read the file 'path' once and feed all hashlib algorithms with the content.
+    Returns a dict with the hex digests, e.g.: {"sha512": "...", "md5": "..."}
+
+    The content is read into a reusable buffer. With os.posix_fadvise() the
+    kernel is informed about the sequential read and the page cache for this
+    file is dropped afterwards.
+    """
+    algorithms = algorithms or DEFAULT_ALGORITHMS
+    block_size = block_size or DEFAULT_BLOCK_SIZE
+    hashers = [(name, hashlib.new(name)) for name in algorithms]
+
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+
+        # Don't allocate a big buffer for small files:
+        size = os.fstat(fd).st_size
+        buffer = bytearray(max(1, min(block_size, size)))
+        with memoryview(buffer) as buffer_view:
+            while True:
+                read = f.readinto(buffer_view)
+                if not read:
+                    break
+                with buffer_view[:read] as chunk:
+                    for name, hasher in hashers:
+                        hasher.update(chunk)
+
+        _fadvise(fd, "POSIX_FADV_DONTNEED")
+
+    return {name: hasher.hexdigest() for name, hasher in hashers}
+
+
+def _sized_paths(paths, onerror):
+    """
+    Returns a list of (file size, Path2 instance, origin item) sorted by size, largest first.
+    The file size of DirEntryPath() instances is taken from the cached stat result.
+    """
+    sized_paths = []
+    for item in paths:
+        try:
+            if isinstance(item, DirEntryPath):
+                if not item.is_file:
+                    continue
+                path = item.path_instance
+                size = item.stat.st_size
+            else:
+                path = Path2(item)
+                size = path.stat().st_size
+        except OSError as err:
+            onerror("Stat %r error: %s" % (str(item), err))
+        else:
+            sized_paths.append((size, path, item))
+
+    sized_paths.sort(key=lambda x: x[0], reverse=True)
+    return sized_paths
+
+
+def _hash_sized_paths(sized_paths, algorithms, block_size, max_in_flight, executor, onerror):
+    sized_paths = iter(sized_paths)
+    in_flight = {}
+    try:
+        while True:
+            for size, path, item in sized_paths:
+                future = executor.submit(hash_file, path.extended_path, algorithms, block_size)
+                in_flight[future] = (path, item)
+                if len(in_flight) >= max_in_flight:
+                    break
+
+            if not in_flight:
+                return
+
+            done, not_done = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, item = in_flight.pop(future)
+                try:
+                    digests = future.result()
+                except OSError as err:
+                    onerror("Hash %r error: %s" % (path.path, err))
+                else:
+                    yield item, digests
+    finally:
+        # e.g.: generator closed before the end
+        for future in in_flight:
+            future.cancel()
+
+
+def hash_many(paths, algorithms=None, block_size=None, max_workers=None, max_in_flight=None,
+              executor=None, onerror=print):
+    """
+    Hash many files in a process pool and yield (item, digests) in completion order.
+
+    'paths' can contain Path2() or DirEntryPath() instances (e.g.: from
+    Path2().walk_parallel()), DirEntryPath() instances that are not files are skipped.
+    'digests' is the dict from hash_file()
+
+    The largest files are scheduled first and the number of scheduled but
+    not finished files is limited to 'max_in_flight'.
+    Errors are reported via onerror(message) and the file is skipped.
+    """
+    sized_paths = _sized_paths(paths, onerror)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or max_workers * 2
+
+    if executor is not None:
+        yield from _hash_sized_paths(sized_paths, algorithms, block_size, max_in_flight, executor, onerror)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from _hash_sized_paths(sized_paths, algorithms, block_size, max_in_flight, executor, onerror)
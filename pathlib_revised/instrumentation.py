@@ -0,0 +1,361 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Opt-in instrumentation: count and time all file system calls, e.g.:
+
+        with instrument() as stats:
+            backup_run()
+        print(stats.report())
+
+    The methods and the os functions used by the library modules are only
+    wrapped inside the context manager, so there is no overhead if the
+    instrumentation is not used.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import builtins
+import collections
+import contextlib
+import functools
+import importlib
+import mmap
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # e.g.: Windows
+    fcntl = None
+
+# pathlib_revised
+from pathlib_revised.dir_entry_path import DirEntryPath
+from pathlib_revised.pathlib import PosixPath2, WindowsPath2
+
+# All methods of PosixPath2/WindowsPath2, that make file system calls.
+# The own overrides and the inherited pathlib methods are wrapped.
+PATH_METHODS = (
+    "stat", "lstat", "open", "resolve", "exists", "is_dir", "is_file", "is_symlink",
+    "chmod", "unlink", "rmdir", "mkdir", "rename", "replace", "touch", "symlink_to", "samefile", "readlink",
+    "copyfile", "hash_content", "link", "listdir", "makedirs", "utime", "scandir",
+)
+
+# The library modules, that call the os functions and open() directly.
+# Their module globals 'os', 'open', 'mmap' and 'fcntl' are replaced.
+OS_MODULES = (
+    "compare", "copy_tree", "duplicates", "file_copy", "filters", "globbing", "hashing", "links",
+    "memory_map", "remove", "resolve_cache", "scan_index", "tree_snapshot", "walk",
+)
+OS_FUNCTIONS = (
+    "stat", "lstat", "fstat", "open", "close", "read", "pread", "write", "lseek", "fsync", "ftruncate",
+    "scandir", "listdir", "readlink", "link", "symlink", "unlink", "remove", "rmdir", "mkdir", "makedirs",
+    "rename", "replace", "chmod", "utime", "copy_file_range", "sendfile", "posix_fadvise", "fwalk", "walk",
+)
+OS_PATH_FUNCTIONS = ("exists", "lexists", "isdir", "isfile", "islink", "samefile", "getsize")
+
+Event = collections.namedtuple("Event", ("name", "path", "duration", "error"))
+
+_MISSING = object()
+
+_lock = threading.Lock()
+_sinks = ()
+_originals = {}
+
+
+def _emit(name, path, duration, error):
+    event = Event(name, path, duration, error)
+    for sink in _sinks:
+        sink(event)
+
+
+def _wrap(name, func, get_path):
+    """
+    Returns a wrapper around 'func' that emits a Event() for every call.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as err:
+            _emit(name, get_path(args, kwargs), time.perf_counter() - start_time, err)
+            raise
+        _emit(name, get_path(args, kwargs), time.perf_counter() - start_time, None)
+        return result
+
+    return wrapper
+
+
+def _as_path(path):
+    if isinstance(path, int):
+        return "<fd %i>" % path
+    if isinstance(path, bytes):
+        return os.fsdecode(path)
+    return getattr(path, "path", str(path))  # os.DirEntry(), Path2() or string
+
+
+def _path_from_self(args, kwargs):
+    return args[0].path
+
+
+def _path_from_arg(args, kwargs):
+    # args[0] is the instance or the class
+    if len(args) > 1:
+        return _as_path(args[1])
+    return _as_path(kwargs.get("path", kwargs.get("dir_entry")))
+
+
+def _path_from_first_arg(args, kwargs):
+    if args:
+        return _as_path(args[0])
+    for key in ("path", "fd", "src", "in_fd"):
+        if key in kwargs:
+            return _as_path(kwargs[key])
+    return ""
+
+
+class _ModuleProxy:
+    """
+    Stands in for the 'os' module in the library modules, while the
+    instrumentation is active: The file system functions are wrapped,
+    everything else is taken from the module.
+    """
+
+    def __init__(self, module, wrappers):
+        self._module = module
+        self.__dict__.update(wrappers)
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+def _os_proxy():
+    wrappers = {}
+    for name in OS_FUNCTIONS:
+        func = getattr(os, name, None)
+        if func is not None:
+            wrappers[name] = _wrap("os.%s" % name, func, _path_from_first_arg)
+
+    # Keep feature checks like "os.link in os.supports_dir_fd" working:
+    for set_name in ("supports_fd", "supports_dir_fd", "supports_follow_symlinks", "supports_effective_ids"):
+        functions = getattr(os, set_name, None)
+        if functions is not None:
+            wrappers[set_name] = functions | {
+                wrappers[func.__name__] for func in functions
+                if func.__name__ in wrappers and getattr(os, func.__name__) is func
+            }
+
+    path_wrappers = {
+        name: _wrap("os.path.%s" % name, getattr(os.path, name), _path_from_first_arg)
+        for name in OS_PATH_FUNCTIONS
+    }
+    wrappers["path"] = _ModuleProxy(os.path, path_wrappers)
+    return _ModuleProxy(os, wrappers)
+
+
+def _targets():
+    """
+    Yields (class or module, attribute name, wrapper) for all instrumented methods and modules.
+    """
+    for cls in (PosixPath2, WindowsPath2):
+        for attr_name in PATH_METHODS:
+            func = getattr(cls, attr_name, None)
+            if func is not None:
+                yield cls, attr_name, _wrap(attr_name, func, _path_from_self)
+
+    yield DirEntryPath, "__init__", _wrap("DirEntryPath.__init__", DirEntryPath.__init__, _path_from_arg)
+
+    from_dir_entry = DirEntryPath.__dict__["from_dir_entry"].__func__
+    yield DirEntryPath, "from_dir_entry", classmethod(
+        _wrap("DirEntryPath.from_dir_entry", from_dir_entry, _path_from_arg)
+    )
+
+    # The direct os.*, open(), mmap.mmap() and fcntl.ioctl() calls of the library modules:
+    os_proxy = _os_proxy()
+    wrapped_open = _wrap("builtins.open", builtins.open, _path_from_first_arg)
+    mmap_proxy = _ModuleProxy(mmap, {"mmap": _wrap("mmap.mmap", mmap.mmap, _path_from_first_arg)})
+    if fcntl is not None:
+        fcntl_proxy = _ModuleProxy(fcntl, {"ioctl": _wrap("fcntl.ioctl", fcntl.ioctl, _path_from_first_arg)})
+    for module_name in OS_MODULES:
+        module = importlib.import_module("pathlib_revised.%s" % module_name)
+        yield module, "os", os_proxy
+        yield module, "open", wrapped_open  # shadows the builtin
+        if getattr(module, "mmap", None) is mmap:
+            yield module, "mmap", mmap_proxy
+        if fcntl is not None and getattr(module, "fcntl", None) is fcntl:
+            yield module, "fcntl", fcntl_proxy
+
+
+def _install():
+    for cls, attr_name, wrapper in _targets():
+        _originals[(cls, attr_name)] = cls.__dict__.get(attr_name, _MISSING)
+        setattr(cls, attr_name, wrapper)
+
+
+def _uninstall():
+    for (cls, attr_name), original in _originals.items():
+        if original is _MISSING:
+            delattr(cls, attr_name)  # use the inherited method again
+        else:
+            setattr(cls, attr_name, original)
+    _originals.clear()
+
+
+def add_sink(sink):
+    """
+    Start the instrumentation: sink(Event(name, path, duration, error)) will be called for every call.
+
+    The sink will be called in the thread that made the call.
+    Note: Nested calls are also recorded, e.g.: Path2().is_dir() calls Path2().stat()
+    """
+    global _sinks
+    with _lock:
+        if not _sinks:
+            _install()
+        _sinks += (sink,)
+
+
+def remove_sink(sink):
+    """
+    Stop the instrumentation for 'sink'. The methods will be unwrapped with the last sink.
+    """
+    global _sinks
+    with _lock:
+        sinks = list(_sinks)
+        sinks.remove(sink)
+        _sinks = tuple(sinks)
+        if not _sinks:
+            _uninstall()
+
+
+@contextlib.contextmanager
+def instrument(sink=None):
+    """
+    Context manager that instruments all file system calls.
+    Yields the sink, default: a new StatsSink() instance.
+    """
+    if sink is None:
+        sink = StatsSink()
+    add_sink(sink)
+    try:
+        yield sink
+    finally:
+        remove_sink(sink)
+
+
+def find_mount_point(path):
+    """
+    Returns the mount point of 'path' (the path may not exist)
+    """
+    path = os.path.abspath(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+class OperationStats:
+    """
+    Statistics of one operation: count, errors, durations and a histogram.
+
+    The histogram counts the durations in power of two microsecond buckets:
+    {bucket: count} with: 2 ** (bucket - 1) <= microseconds < 2 ** bucket
+    """
+    __slots__ = ("count", "errors", "total", "min", "max", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.histogram = collections.Counter()
+
+    def add(self, duration, error):
+        self.count += 1
+        if error is not None:
+            self.errors += 1
+        self.total += duration
+        if self.min is None or duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        self.histogram[int(duration * 1000000).bit_length()] += 1
+
+    @property
+    def average(self):
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "average": self.average,
+            "histogram": dict(self.histogram),
+        }
+
+
+class StatsSink:
+    """
+    Collect OperationStats() per operation name or per (mount point, operation name)
+    Calls with a file descriptor instead of a path are grouped under the mount point "<fd>"
+    """
+
+    def __init__(self, group_by_mount=False):
+        self.group_by_mount = group_by_mount
+        self.stats = collections.defaultdict(OperationStats)
+        self._mount_points = {}
+        self._lock = threading.Lock()
+
+    def _mount_point(self, path):
+        if path.startswith("<fd "):
+            return "<fd>"
+        parent = os.path.dirname(os.path.abspath(path))
+        try:
+            return self._mount_points[parent]
+        except KeyError:
+            mount_point = find_mount_point(parent)
+            self._mount_points[parent] = mount_point
+            return mount_point
+
+    def __call__(self, event):
+        if self.group_by_mount:
+            key = (self._mount_point(event.path), event.name)
+        else:
+            key = event.name
+        with self._lock:
+            self.stats[key].add(event.duration, event.error)
+
+    def as_dict(self):
+        with self._lock:
+            if self.group_by_mount:
+                result = collections.defaultdict(dict)
+                for (mount_point, name), stats in self.stats.items():
+                    result[mount_point][name] = stats.as_dict()
+                return dict(result)
+            return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    def report(self):
+        """
+        Returns a text table, sorted by the total duration
+        """
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1].total, reverse=True)
+            lines = []
+            for key, stats in items:
+                if self.group_by_mount:
+                    key = "%s %s" % key
+                lines.append("%-40s %8i calls %6i errors %10.3f sec. total %8.1f µs avg. %8.1f µs max." % (
+                    key, stats.count, stats.errors, stats.total, stats.average * 1000000, stats.max * 1000000
+                ))
+            return "\n".join(lines)
@@ -0,0 +1,110 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Create many hardlinks.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# pathlib_revised
+from pathlib_revised.pathlib import Path2
+
+LinkError = collections.namedtuple("LinkError", ("source", "destination", "error"))
+
+
+def dir_fd_supported():
+    """
+    Can os.link() be used with src_dir_fd and dst_dir_fd? (e.g.: not under Windows)
+    """
+    return os.link in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+def _open_dir(path):
+    return os.open(path.extended_path, os.O_RDONLY | os.O_DIRECTORY)
+
+
+def _link_group_dir_fd(src_dir, dst_dir, pairs):
+    """
+    Link all pairs with dir_fd relative names, so that the kernel must
+    resolve the directory paths only once.
+    """
+    try:
+        src_dir_fd = _open_dir(src_dir)
+    except OSError as err:
+        return [LinkError(src, dst, err) for src, dst in pairs]
+
+    try:
+        if dst_dir == src_dir:
+            dst_dir_fd = src_dir_fd
+        else:
+            try:
+                dst_dir_fd = _open_dir(dst_dir)
+            except OSError as err:
+                return [LinkError(src, dst, err) for src, dst in pairs]
+
+        try:
+            failures = []
+            for src, dst in pairs:
+                try:
+                    os.link(src.name, dst.name, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+                except OSError as err:
+                    failures.append(LinkError(src, dst, err))
+            return failures
+        finally:
+            if dst_dir_fd != src_dir_fd:
+                os.close(dst_dir_fd)
+    finally:
+        os.close(src_dir_fd)
+
+
+def _link_group_path(src_dir, dst_dir, pairs):
+    failures = []
+    for src, dst in pairs:
+        try:
+            src.link(dst)
+        except OSError as err:
+            failures.append(LinkError(src, dst, err))
+    return failures
+
+
+def link_many(pairs, max_workers=1):
+    """
+    Create hardlinks for all (source, destination) pairs.
+
+    The pairs are grouped by the source and destination directory. Where
+    supported, the links are created relative to opened directory file
+    descriptors. With max_workers > 1 the groups are linked in a thread pool.
+
+    Errors doesn't stop the linking: Returns a list of
+    LinkError(source, destination, error) for all failed links.
+    """
+    groups = collections.defaultdict(list)
+    for src, dst in pairs:
+        src = Path2(src)
+        dst = Path2(dst)
+        groups[(src.parent, dst.parent)].append((src, dst))
+
+    if dir_fd_supported():
+        link_group = _link_group_dir_fd
+    else:
+        link_group = _link_group_path
+
+    def link_func(item):
+        (src_dir, dst_dir), group_pairs = item
+        return link_group(src_dir, dst_dir, group_pairs)
+
+    failures = []
+    if max_workers > 1 and len(groups) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for group_failures in executor.map(link_func, groups.items()):
+                failures += group_failures
+    else:
+        for item in groups.items():
+            failures += link_func(item)
+    return failures
@@ -0,0 +1,66 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Read files without copying them into bytes objects.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import contextlib
+import mmap
+import os
+import stat
+
+
+def _map_file(f):
+    """
+    Returns a read only mmap of the whole file, or None if it can't be mapped.
+    Empty files can't be mapped and the size of special files has no meaning.
+    """
+    st = os.fstat(f.fileno())
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        return None
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # e.g.: a file system without mmap support
+        return None
+
+
+@contextlib.contextmanager
+def read_view(path):
+    """
+    Context manager that returns a read only memoryview of the whole file content, e.g.:
+
+        with read_view("/foo/bar.iso") as view:
+            hasher.update(view)
+
+    Regular files are memory-mapped, so the content is not copied and only
+    the accessed pages are read. Empty files, special files (e.g.: pipes) and
+    files that can't be mapped are read into a bytes object.
+
+    The view is released at the end of the context. Release all slices of the
+    view before, otherwise the mmap can't be closed immediately and will be
+    closed by the garbage collector.
+    """
+    with open(path, "rb", buffering=0) as f:
+        mapped = _map_file(f)
+        if mapped is None:
+            view = memoryview(f.read())  # read until EOF, also from pipes
+        else:
+            if hasattr(mapped, "madvise"):  # new in Python 3.8
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            view = memoryview(mapped)
+
+    try:
+        yield view
+    finally:
+        view.release()
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # Slices of the view are still in use
+                pass
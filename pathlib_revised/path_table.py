@@ -0,0 +1,215 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Store many paths with shared prefixes.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import array
+
+# pathlib_revised
+from pathlib_revised.pathlib import Path2
+
+NO_PARENT = -1
+
+
+class PathTable:
+    """
+    A set of paths, stored as a tree of (parent id, name) nodes.
+
+    Every path prefix is stored only once and all names are interned,
+    so e.g. a million files in a deep directory tree need only a fraction
+    of the memory of a million Path2() instances.
+    Path2() instances are only created on demand.
+
+    A node is created for every prefix of an added path, but only the added
+    paths are members of the table. Parent nodes have always a lower id than
+    their child nodes.
+
+    e.g.:
+        table = PathTable()
+        table.add("/foo/bar/file1.txt")
+        table.add("/foo/bar/file2.txt")
+        "/foo/bar/file1.txt" in table -> True
+        "/foo/bar" in table -> False
+        list(table.subtree("/foo/bar")) -> [Path2("/foo/bar/file1.txt"), Path2("/foo/bar/file2.txt")]
+    """
+
+    def __init__(self, paths=None):
+        self._parents = array.array("q")
+        self._name_ids = array.array("I")
+        self._members = bytearray()
+        self._member_count = 0
+
+        self._names = []
+        self._name_lookup = {}
+
+        # (parent id, name id) -> node id, stored as a single int: (parent id + 1) << 32 | name id
+        self._children = {}
+
+        if paths is not None:
+            for path in paths:
+                self.add(path)
+
+    @staticmethod
+    def _split(path):
+        return Path2(path).parts
+
+    def _child_key(self, parent_id, name_id):
+        return (parent_id + 1) << 32 | name_id
+
+    def _find(self, path):
+        """
+        Returns the node id of 'path' or None, if no node exists.
+        """
+        node_id = NO_PARENT
+        for name in self._split(path):
+            name_id = self._name_lookup.get(name)
+            if name_id is None:
+                return None
+            node_id = self._children.get(self._child_key(node_id, name_id))
+            if node_id is None:
+                return None
+        if node_id == NO_PARENT:
+            return None
+        return node_id
+
+    def add_child(self, parent_id, name):
+        """
+        Returns the node id of the child 'name' of the node 'parent_id',
+        the node is created if needed, but it will not be added as member.
+        Use NO_PARENT for the anchor of a path, e.g.: "/" or "C:\\"
+        """
+        try:
+            name_id = self._name_lookup[name]
+        except KeyError:
+            name_id = self._name_lookup[name] = len(self._names)
+            self._names.append(name)
+
+        key = self._child_key(parent_id, name_id)
+        try:
+            return self._children[key]
+        except KeyError:
+            node_id = self._children[key] = len(self._parents)
+            self._parents.append(parent_id)
+            self._name_ids.append(name_id)
+            self._members.append(0)
+            return node_id
+
+    def add_node(self, node_id):
+        """
+        Add the existing node as member.
+        """
+        if not self._members[node_id]:
+            self._members[node_id] = 1
+            self._member_count += 1
+
+    def add(self, path):
+        """
+        Add the path and returns the node id.
+        """
+        node_id = NO_PARENT
+        for name in self._split(path):
+            node_id = self.add_child(node_id, name)
+        if node_id == NO_PARENT:
+            raise ValueError("Can't add a empty path")
+        self.add_node(node_id)
+        return node_id
+
+    def discard(self, path):
+        """
+        Remove the path from the members, if it's a member.
+        Note: The nodes are not removed.
+        """
+        node_id = self._find(path)
+        if node_id is not None and self._members[node_id]:
+            self._members[node_id] = 0
+            self._member_count -= 1
+
+    def node_id(self, path):
+        """
+        Returns the node id of the member 'path' or None
+        """
+        node_id = self._find(path)
+        if node_id is None or not self._members[node_id]:
+            return None
+        return node_id
+
+    def __contains__(self, path):
+        return self.node_id(path) is not None
+
+    def __len__(self):
+        return self._member_count
+
+    def parts(self, node_id):
+        """
+        Returns the parts of the path of the node, like Path2().parts
+        """
+        parts = []
+        while node_id != NO_PARENT:
+            parts.append(self._names[self._name_ids[node_id]])
+            node_id = self._parents[node_id]
+        parts.reverse()
+        return tuple(parts)
+
+    def path(self, node_id):
+        """
+        Create the Path2() instance of the node.
+        """
+        return Path2(*self.parts(node_id))
+
+    def node_ids(self):
+        """
+        Yields the node ids of all members.
+        """
+        members = self._members
+        for node_id in range(len(members)):
+            if members[node_id]:
+                yield node_id
+
+    def __iter__(self):
+        """
+        Yields Path2() instances of all members, in the order in which the nodes were created.
+        """
+        for node_id in self.node_ids():
+            yield self.path(node_id)
+
+    def subtree_node_ids(self, path):
+        """
+        Yields the node ids of all members in 'path' (incl. 'path' itself)
+        """
+        root_id = self._find(path)
+        if root_id is None:
+            return
+
+        parents = self._parents
+        members = self._members
+        # Parent nodes have always lower ids, so a single pass is enough:
+        in_subtree = bytearray(len(parents) - root_id)
+        in_subtree[0] = 1
+        if members[root_id]:
+            yield root_id
+        for node_id in range(root_id + 1, len(parents)):
+            parent_id = parents[node_id]
+            if parent_id >= root_id and in_subtree[parent_id - root_id]:
+                in_subtree[node_id - root_id] = 1
+                if members[node_id]:
+                    yield node_id
+
+    def subtree(self, path):
+        """
+        Yields Path2() instances of all members in 'path' (incl. 'path' itself)
+        """
+        for node_id in self.subtree_node_ids(path):
+            yield self.path(node_id)
+
+    def has_subtree(self, path):
+        """
+        Is 'path' or any path in it a member?
+        """
+        for node_id in self.subtree_node_ids(path):
+            return True
+        return False
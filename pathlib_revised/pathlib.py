@@ -9,18 +9,86 @@
 
 import os
 import pathlib
-import shutil
 
 IS_WINDOWS = os.name == 'nt'
 
 
 class SharedPathMethods:
-    def copyfile(self, other, *args, **kwargs):
-        shutil.copyfile(self.extended_path, other.extended_path, *args, **kwargs)
+    __slots__ = ()
+
+    def child(self, name):
+        """
+        Fast path for: self / name
+        The path is not parsed again, so 'name' must be a single name,
+        e.g.: os.DirEntry().name from scandir()
+        """
+        return self._make_child_relpath(name)
+
+    def copyfile(self, other, follow_symlinks=True, block_size=None, callback=None, strategies=None,
+                 reflink=False, sparse=False):
+        """
+        Copy the file content to 'other', returns a CopyResult(strategy, bytes_copied)
+
+        reflink=True: Try a copy-on-write clone first
+        sparse=True: Don't fill holes in sparse files
+
+        see: pathlib_revised.file_copy.copy_file()
+        """
+        from pathlib_revised.file_copy import copy_file
+        return copy_file(
+            self.extended_path, Path2(other).extended_path,
+            follow_symlinks=follow_symlinks, block_size=block_size, callback=callback, strategies=strategies,
+            reflink=reflink, sparse=sparse,
+        )
+
+    def copytree(self, other, max_workers=None, dirs_exist_ok=False, onerror=print, reflink=False, sparse=False):
+        """
+        Copy the directory tree to 'other' with a thread pool and recreate the hardlinks.
+        Returns a list of CopyTreeError(source, destination, error)
+        see: pathlib_revised.copy_tree.copy_tree()
+        """
+        from pathlib_revised.copy_tree import copy_tree
+        return copy_tree(
+            self, other, max_workers=max_workers, dirs_exist_ok=dirs_exist_ok, onerror=onerror,
+            reflink=reflink, sparse=sparse,
+        )
+
+    def disk_usage(self, max_workers=None, onerror=print, one_file_system=False):
+        """
+        Returns the DiskUsage() of the directory tree, every hardlinked inode is counted once.
+        see: pathlib_revised.disk_usage.disk_usage()
+        """
+        from pathlib_revised.disk_usage import disk_usage
+        return disk_usage(self, max_workers=max_workers, onerror=onerror, one_file_system=one_file_system)
+
+    def iter_disk_usage(self, max_workers=None, onerror=print, one_file_system=False):
+        """
+        Yields (path, DiskUsage()) for every directory, after all of its sub directories.
+        see: pathlib_revised.disk_usage.iter_disk_usage()
+        """
+        from pathlib_revised.disk_usage import iter_disk_usage
+        return iter_disk_usage(self, max_workers=max_workers, onerror=onerror, one_file_system=one_file_system)
 
     def expanduser(self):
         return Path2(os.path.expanduser(self.extended_path))
 
+    def find_duplicates(self, **kwargs):
+        """
+        Find files with the same content in this directory tree.
+        see: pathlib_revised.duplicates.find_duplicates()
+        """
+        from pathlib_revised.duplicates import find_duplicates
+        return find_duplicates(self.walk_parallel(), **kwargs)
+
+    def hash_content(self, algorithms=None, block_size=None):
+        """
+        Read the file once and returns the hex digests of all hashlib algorithms,
+        e.g.: {"sha512": "...", "md5": "..."}
+        see: pathlib_revised.hashing.hash_file()
+        """
+        from pathlib_revised.hashing import hash_file
+        return hash_file(self.extended_path, algorithms=algorithms, block_size=block_size)
+
     def link(self, other):
         os.link(self.extended_path, other.extended_path)
 
@@ -39,6 +107,32 @@ class SharedPathMethods:
         """ Set the access and modified times of the file specified by path. """
         os.utime(self.extended_path, *args, **kwargs)
 
+    def read_view(self):
+        """
+        Context manager that returns a read only memoryview of the file content.
+        Regular files are memory-mapped, so the content is not copied.
+        see: pathlib_revised.memory_map.read_view()
+        """
+        from pathlib_revised.memory_map import read_view
+        return read_view(self.extended_path)
+
+    def rmtree(self, max_workers=None, max_open_fds=64):
+        """
+        Remove the directory tree with a thread pool.
+        Returns a list of RmtreeError(path, error) for all entries, that can't be removed.
+        see: pathlib_revised.remove.rmtree()
+        """
+        from pathlib_revised.remove import rmtree
+        return rmtree(self, max_workers=max_workers, max_open_fds=max_open_fds)
+
+    def same_content(self, other, **kwargs):
+        """
+        Returns True, if the file has the same content as 'other'.
+        see: pathlib_revised.compare.same_content()
+        """
+        from pathlib_revised.compare import same_content
+        return same_content(self.extended_path, Path2(other).extended_path, **kwargs)
+
     def scandir(self):
         # Use the built-in version of scandir/walk if possible, otherwise
         # use the scandir module version
@@ -52,8 +146,33 @@ class SharedPathMethods:
                 raise ImportError("For Python <3.5: Please install 'scandir' !")
         return scandir(self.extended_path)
 
+    def fwalk(self, topdown=True, onerror=print, max_open_fds=64, path_filter=None):
+        """
+        Walk the directory tree with open directory file descriptors.
+        Yields (dirpath, dirnames, filenames, dir_fd) like os.fwalk()
+        see: pathlib_revised.walk.fwalk()
+        """
+        from pathlib_revised.walk import fwalk
+        return fwalk(
+            self, topdown=topdown, onerror=onerror, max_open_fds=max_open_fds, path_filter=path_filter
+        )
+
+    def walk_parallel(self, max_workers=None, topdown=True, onerror=print, max_queue=None, resolve_cache=None,
+                      path_filter=None):
+        """
+        Walk the directory tree with a thread pool and yield DirEntryPath() instances.
+        see: pathlib_revised.walk.walk_parallel()
+        """
+        from pathlib_revised.walk import walk_parallel
+        return walk_parallel(
+            self, max_workers=max_workers, topdown=topdown, onerror=onerror, max_queue=max_queue,
+            resolve_cache=resolve_cache, path_filter=path_filter,
+        )
+
 
 class WindowsPath2(SharedPathMethods, pathlib.WindowsPath):
+    __slots__ = ()
+
     def stat(self):
         return os.stat(self.extended_path)
 
@@ -133,15 +252,35 @@ class WindowsPath2(SharedPathMethods, pathlib.WindowsPath):
 
 
 class PosixPath2(SharedPathMethods, pathlib.PosixPath):
+    __slots__ = ()
+
     @property
     def extended_path(self):
         return self.path
 
+    def glob(self, pattern, max_workers=1):
+        """
+        Like pathlib's glob(), but the file types are taken from os.scandir()
+        see: pathlib_revised.globbing.iglob()
+        """
+        from pathlib_revised.globbing import iglob
+        return iglob(self, pattern, max_workers=max_workers)
+
+    def rglob(self, pattern, max_workers=1):
+        """
+        Like glob() with "**/" in front of the pattern.
+        With max_workers > 1 the directories are scanned in a thread pool.
+        """
+        from pathlib_revised.globbing import iglob
+        return iglob(self, "**/%s" % pattern, max_workers=max_workers)
+
 
 class Path2(pathlib.Path):
     """
     https://github.com/python/cpython/blob/master/Lib/pathlib.py
     """
+    __slots__ = ()
+
     def __new__(cls, *args, **kwargs):
         if cls is Path2 or cls is pathlib.Path:
             cls = WindowsPath2 if IS_WINDOWS else PosixPath2
@@ -152,6 +291,29 @@ class Path2(pathlib.Path):
         self._init()
         return self
 
+    @classmethod
+    def from_strings(cls, paths):
+        """
+        Create Path2() instances from many path strings.
+
+        Every parent directory is parsed only once, all paths
+        in it are created as child of it via Path2().child()
+        """
+        parents = {}
+        result = []
+        for path in paths:
+            parent_path, name = os.path.split(path)
+            if not name or name in (".", ".."):
+                # e.g.: "/", "foo/" or "foo/.."
+                result.append(cls(path))
+                continue
+            try:
+                parent = parents[parent_path]
+            except KeyError:
+                parent = parents[parent_path] = cls(parent_path)
+            result.append(parent.child(name))
+        return result
+
     @classmethod
     def home(cls):
         """
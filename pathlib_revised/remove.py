@@ -0,0 +1,313 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Remove directory trees.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import os
+import stat
+import threading
+
+# pathlib_revised
+from pathlib_revised.pathlib import IS_WINDOWS, Path2
+from pathlib_revised.walk import DONE, SCANNED, _TreeScheduler
+
+RmtreeError = collections.namedtuple("RmtreeError", ("path", "error"))
+
+
+def _check_dir_fd_support():
+    if not (hasattr(os, "O_DIRECTORY") and hasattr(os, "O_NOFOLLOW")):
+        return False
+    if os.scandir not in os.supports_fd:
+        return False
+    return {os.open, os.stat, os.unlink, os.rmdir} <= os.supports_dir_fd
+
+
+# Checked once: the functions are compared by identity and can be wrapped later
+_DIR_FD_SUPPORTED = _check_dir_fd_support()
+
+
+def dir_fd_supported():
+    """
+    Can os.scandir() be used with a file descriptor and os.open(), os.unlink()
+    and os.rmdir() with dir_fd? (e.g.: not under Windows and not with Python < 3.7)
+    """
+    return _DIR_FD_SUPPORTED
+
+
+def _is_link(dir_entry):
+    """
+    Is the os.DirEntry() a symlink or a junction? They must be removed, but not followed.
+    """
+    if dir_entry.is_symlink():
+        return True
+    if IS_WINDOWS:
+        st = dir_entry.stat(follow_symlinks=False)
+        return bool(st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+    return False
+
+
+class _DirNode:
+    """
+    A directory in the dir_fd mode: It's opened relative to the file descriptor
+    of the parent directory. The fd is managed by _DirFds().
+    """
+    __slots__ = ("path", "name", "parent", "st", "fd", "users", "skip")
+
+    def __init__(self, path, name, parent, st):
+        self.path = path
+        self.name = name  # None for the top directory
+        self.parent = parent
+        self.st = st  # lstat() result from the scan of the parent directory
+        self.fd = None
+        self.users = 0  # number of threads, that use the fd at the moment
+        self.skip = False  # don't remove it: it's not the scanned directory
+
+
+class _DirFds:
+    """
+    The open directory file descriptors of the dir_fd mode.
+
+    Not more than 'max_open_fds' file descriptors stay open: If needed, the
+    least recently used fd, that is not in use, is closed. It will be reopened
+    by its path, if needed again, and it's verified, that it's still the
+    scanned directory (same as fwalk())
+    """
+    def __init__(self, max_open_fds):
+        self.flags = os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW
+        self.max_open_fds = max_open_fds
+        self.lock = threading.Lock()
+        self.unused = collections.OrderedDict()  # open, but unused nodes: least recently used first
+        self.open_count = 0
+
+    def _open(self, node, path, dir_fd=None):
+        fd = os.open(path, self.flags, dir_fd=dir_fd)
+        try:
+            if not os.path.samestat(os.fstat(fd), node.st):
+                node.skip = True
+                raise OSError("Directory %r changed during rmtree" % node.path.path)
+        except OSError:
+            os.close(fd)
+            raise
+        node.fd = fd
+        self.open_count += 1
+
+    def _acquire(self, node):
+        if node.fd is None:
+            self._open(node, node.path.extended_path)
+        else:
+            self.unused.pop(node, None)
+        node.users += 1
+
+    def _make_room(self):
+        while self.open_count > self.max_open_fds and self.unused:
+            node, _ = self.unused.popitem(last=False)
+            os.close(node.fd)
+            node.fd = None
+            self.open_count -= 1
+
+    def open_child(self, node):
+        """
+        Open the directory the first time: relative to the parent fd.
+        Returns the fd, it must be released via release()
+        """
+        with self.lock:
+            if node.parent is None:
+                self._open(node, node.path.extended_path)
+            else:
+                self._acquire(node.parent)
+                try:
+                    self._open(node, node.name, dir_fd=node.parent.fd)
+                finally:
+                    self._release(node.parent)
+            node.users += 1
+            self._make_room()
+            return node.fd
+
+    def acquire(self, node):
+        """
+        Returns the fd of the node, reopened if it was closed.
+        It must be released via release()
+        """
+        with self.lock:
+            self._acquire(node)
+            self._make_room()
+            return node.fd
+
+    def _release(self, node):
+        node.users -= 1
+        if node.users == 0:
+            self.unused[node] = None
+
+    def release(self, node):
+        with self.lock:
+            self._release(node)
+            self._make_room()
+
+    def close(self, node):
+        with self.lock:
+            if node.fd is not None:
+                self.unused.pop(node, None)
+                os.close(node.fd)
+                node.fd = None
+                self.open_count -= 1
+
+    def close_all(self):
+        with self.lock:
+            for node in self.unused:
+                os.close(node.fd)
+                node.fd = None
+            self.unused.clear()
+            self.open_count = 0
+
+
+def _remove_content_dir_fd(node, fds):
+    """
+    Open the directory relative to the parent fd and remove all files and
+    symlinks relative to its own fd. Like shutil.rmtree(): The directory must
+    be the same (st_dev, st_ino) as scanned, so a directory that was replaced
+    by a symlink or an other directory is never entered.
+    Returns: (errors, sub directory nodes)
+    """
+    errors = []
+    sub_dirs = []
+    try:
+        fd = fds.open_child(node)
+    except OSError as err:
+        return [RmtreeError(node.path, err)], sub_dirs
+
+    try:
+        with os.scandir(fd) as scandir_it:
+            for dir_entry in scandir_it:
+                try:
+                    is_dir = dir_entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    try:
+                        st = dir_entry.stat(follow_symlinks=False)
+                    except OSError as err:
+                        errors.append(RmtreeError(node.path.child(dir_entry.name), err))
+                        continue
+                    sub_dirs.append(_DirNode(node.path.child(dir_entry.name), dir_entry.name, node, st))
+                    continue
+                try:
+                    os.unlink(dir_entry.name, dir_fd=fd)
+                except OSError as err:
+                    errors.append(RmtreeError(node.path.child(dir_entry.name), err))
+    except OSError as err:
+        errors.append(RmtreeError(node.path, err))
+    finally:
+        fds.release(node)
+    return errors, sub_dirs
+
+
+def _rmtree_dir_fd(top, top_stat, max_workers, max_queue, max_open_fds):
+    errors = []
+    fds = _DirFds(max_open_fds)
+
+    def scan_func(node):
+        return _remove_content_dir_fd(node, fds)
+
+    scheduler = _TreeScheduler(scan_func, max_workers=max_workers, max_queue=max_queue)
+    try:
+        for event, node, result in scheduler.run(_DirNode(top, None, None, top_stat)):
+            if event == SCANNED:
+                errors += result
+            elif event == DONE:
+                # All sub directories are removed (or failed)
+                fds.close(node)
+                if node.skip:
+                    continue
+                try:
+                    if node.parent is None:
+                        os.rmdir(node.path.extended_path)
+                    else:
+                        parent_fd = fds.acquire(node.parent)
+                        try:
+                            os.rmdir(node.name, dir_fd=parent_fd)
+                        finally:
+                            fds.release(node.parent)
+                except OSError as err:
+                    errors.append(RmtreeError(node.path, err))
+    finally:
+        # e.g.: generator closed before the end
+        fds.close_all()
+    return errors
+
+
+def _remove_content_path(path):
+    """
+    Remove all files, symlinks and junctions of the directory by their (extended) path.
+    Returns: (errors, sub directories)
+    """
+    errors = []
+    sub_dirs = []
+    try:
+        with path.scandir() as scandir_it:
+            for dir_entry in scandir_it:
+                try:
+                    if _is_link(dir_entry):
+                        if IS_WINDOWS and dir_entry.is_dir():
+                            # a junction or directory symlink
+                            os.rmdir(dir_entry.path)
+                        else:
+                            os.unlink(dir_entry.path)
+                    elif dir_entry.is_dir():
+                        sub_dirs.append(path.child(dir_entry.name))
+                    else:
+                        os.unlink(dir_entry.path)
+                except OSError as err:
+                    errors.append(RmtreeError(path.child(dir_entry.name), err))
+    except OSError as err:
+        errors.append(RmtreeError(path, err))
+    return errors, sub_dirs
+
+
+def rmtree(top, max_workers=None, max_queue=None, max_open_fds=64):
+    """
+    Remove the directory tree 'top' with a thread pool.
+
+    The files of the directories are removed in parallel. Where supported,
+    every directory is opened relative to the file descriptor of its parent
+    and verified (st_dev, st_ino) against the scan, like shutil.rmtree().
+    The files are removed relative to the directory file descriptor and a
+    directory relative to its parent, after all of its content is removed.
+    The pending directories are processed depth first, so the memory usage
+    doesn't depend on the tree size. Not more than 'max_open_fds' unused
+    directory file descriptors stay open, closed ones are reopened by their
+    path and verified again.
+
+    Symlinks (and junctions under Windows) are removed, but not followed.
+
+    Errors doesn't stop the removing: Returns a list of
+    RmtreeError(path, error) for all entries, that can't be removed.
+    """
+    if max_open_fds < 2:
+        raise ValueError("max_open_fds must be at least 2")
+
+    top = Path2(top)
+    top_stat = top.lstat()
+    if stat.S_ISLNK(top_stat.st_mode):
+        # same as shutil.rmtree()
+        raise OSError("Cannot call rmtree on a symbolic link: %r" % top.path)
+
+    if dir_fd_supported():
+        return _rmtree_dir_fd(top, top_stat, max_workers, max_queue, max_open_fds)
+
+    errors = []
+    scheduler = _TreeScheduler(_remove_content_path, max_workers=max_workers, max_queue=max_queue)
+    for event, path, result in scheduler.run(top):
+        if event == SCANNED:
+            errors += result
+        elif event == DONE:
+            try:
+                os.rmdir(path.extended_path)
+            except OSError as err:
+                errors.append(RmtreeError(path, err))
+    return errors
@@ -0,0 +1,149 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Cache for resolved paths.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import collections
+import os
+import threading
+
+# pathlib_revised
+from pathlib_revised.pathlib import IS_WINDOWS, Path2
+
+DEFAULT_MAX_SIZE = 100000
+
+
+def _absolute(path):
+    path = Path2(path)
+    if path.is_absolute():
+        return path
+    return Path2(os.getcwd(), path)
+
+
+class ResolveCache:
+    """
+    Resolve paths like Path2().resolve(), but memoize the resolved parent
+    directories and symlinks:
+
+    * The resolved path of a entry that is not a symlink is:
+      resolved parent directory + entry name
+    * Only directories and symlinks are really resolved and stored in the cache.
+
+    So in a walk, only one resolve() per directory and per symlink is needed.
+    Under Windows a directory can be a junction, that is not a symlink, so
+    directories are always resolved there.
+
+    Relative paths are made absolute, so the cache stays valid if the current
+    working directory changes. ".." is applied to the resolved parent.
+
+    The cache holds at most 'max_size' paths (least recently used are dropped).
+    Use invalidate() if the directory tree was changed.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _set(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def _resolve(self, path):
+        key = path.path
+        resolved_path = self._get(key)
+        if resolved_path is None:
+            resolved_path = path.resolve()
+            self._set(key, resolved_path)
+        return resolved_path
+
+    def resolve(self, path, is_symlink=None, is_dir=None):
+        """
+        Returns the resolved Path2() instance, same as: Path2(path).resolve()
+
+        Pass is_symlink and is_dir, if known (e.g.: from os.DirEntry()),
+        otherwise they will be requested.
+        """
+        path = _absolute(path)
+        parent = path.parent
+        if parent == path:
+            # e.g.: the root directory
+            return self._resolve(path)
+
+        if path.name == "..":
+            # The resolved parent contains no symlinks, so ".." is its parent
+            # (pathlib removes all "." components)
+            return self._resolve(parent).parent
+
+        if is_symlink is None:
+            is_symlink = path.is_symlink()
+        if is_symlink:
+            return self._resolve(path)
+
+        if IS_WINDOWS:
+            if is_dir is None:
+                is_dir = path.is_dir()
+            if is_dir:
+                # maybe a junction
+                return self._resolve(path)
+
+        resolved_path = self._resolve(parent).child(path.name)
+        if is_dir:
+            # store it for the child entries
+            self._set(path.path, resolved_path)
+        return resolved_path
+
+    def invalidate(self, path=None):
+        """
+        Remove 'path' and all paths below it from the cache.
+        Clear the complete cache, if no path is given.
+        """
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+
+            path = _absolute(path).path
+            prefix = path.rstrip("\\/") + ("\\" if IS_WINDOWS else "/")
+            keys = [key for key in self._cache if key == path or key.startswith(prefix)]
+            for key in keys:
+                del self._cache[key]
+
+    def __len__(self):
+        return len(self._cache)
+
+
+_process_cache = None
+_process_cache_lock = threading.Lock()
+
+
+def get_process_cache():
+    """
+    Returns the ResolveCache() instance, that is shared in the whole process.
+    """
+    global _process_cache
+    with _process_cache_lock:
+        if _process_cache is None:
+            _process_cache = ResolveCache()
+        return _process_cache
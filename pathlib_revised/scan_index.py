@@ -0,0 +1,125 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Persistent index of stat signatures for incremental scans.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import json
+import os
+import sqlite3
+
+
+def stat_signature(stat_result):
+    """
+    Returns the values that are used to detect a changed file.
+    """
+    return (stat_result.st_dev, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+
+class ScanIndex:
+    """
+    Store the stat signature (st_dev, st_ino, st_size, st_mtime_ns) and
+    derived values (e.g.: content hashes) for every path in a SQLite database.
+
+    e.g.:
+        with ScanIndex("index.sqlite3") as index:
+            for entry, data in index.lookup(Path2("/foo/bar").walk_parallel()):
+                if data is None:
+                    # new or changed file
+                    data = {"sha512": calculate_hash(entry.path_instance)}
+                    index.set(entry.path, entry.stat, data)
+
+    The derived values must be JSON serializable.
+    Changes are committed every 'commit_every' writes and on close().
+    """
+
+    def __init__(self, db_path, commit_every=10000):
+        self.db_path = str(db_path)
+        self.commit_every = commit_every
+        self._uncommitted = 0
+
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " path TEXT PRIMARY KEY,"
+            " st_dev INTEGER, st_ino INTEGER, st_size INTEGER, st_mtime_ns INTEGER,"
+            " data TEXT"
+            ") WITHOUT ROWID"
+        )
+
+    def get(self, path, stat_result):
+        """
+        Returns the stored values, if the stat signature is unchanged, otherwise None
+        """
+        row = self.connection.execute(
+            "SELECT st_dev, st_ino, st_size, st_mtime_ns, data FROM entries WHERE path=?",
+            (str(path),)
+        ).fetchone()
+        if row is None or row[:4] != stat_signature(stat_result):
+            return None
+        return json.loads(row[4])
+
+    def set(self, path, stat_result, data):
+        """
+        Store (or replace) the stat signature and the values for the path.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+            (str(path),) + stat_signature(stat_result) + (json.dumps(data),)
+        )
+        self._written()
+
+    def discard(self, path):
+        self.connection.execute("DELETE FROM entries WHERE path=?", (str(path),))
+        self._written()
+
+    def lookup(self, entries):
+        """
+        Yields (DirEntryPath, stored values or None) for all files of the given
+        DirEntryPath() instances. Directories and symlinks are skipped.
+        """
+        for entry in entries:
+            if entry.is_file and not entry.is_symlink:
+                yield entry, self.get(entry.path, entry.stat)
+
+    def remove_missing(self):
+        """
+        Remove all paths that doesn't exist anymore. Returns the number of removed paths.
+        """
+        cursor = self.connection.execute("SELECT path FROM entries")
+        missing = [(path,) for (path,) in cursor if not os.path.lexists(path)]
+        self.connection.executemany("DELETE FROM entries WHERE path=?", missing)
+        self.commit()
+        return len(missing)
+
+    def _written(self):
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        self.connection.commit()
+        self._uncommitted = 0
+
+    def close(self):
+        self.commit()
+        self.connection.close()
+
+    def __contains__(self, path):
+        row = self.connection.execute("SELECT 1 FROM entries WHERE path=?", (str(path),)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,123 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import asyncio
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import DirEntryPath, Path2
+from pathlib_revised.aio import AsyncExecutor, AsyncPath2
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture(scope="function")
+def executor():
+    with AsyncExecutor(max_workers=4, batch_size=2) as executor:
+        yield executor
+
+
+def test_file_operations(tmp_path, executor):
+    async def main():
+        base_path = AsyncPath2(tmp_path, executor=executor)
+        dir_path = base_path / "sub" / "dir"
+        await dir_path.makedirs()
+        assert await dir_path.is_dir()
+
+        src = dir_path / "src.txt"
+        await executor.run(src.path_instance.write_text, "content")
+
+        dst = dir_path / "dst.txt"
+        result = await src.copyfile(dst)
+        assert result.bytes_copied == 7
+
+        await src.link(dir_path / "link.txt")
+        assert (await src.stat()).st_nlink == 2
+
+        await dst.utime(times=(111111111, 222222222))
+        assert (await dst.stat()).st_mtime == 222222222
+
+        assert await dst.hash_content(algorithms=("md5",)) == {"md5": "9a0364b9e99bb480dd25e1f0284c8555"}
+        assert sorted(await dir_path.listdir()) == ["dst.txt", "link.txt", "src.txt"]
+
+        await dst.unlink()
+        assert not await dst.exists()
+
+    run(main())
+
+
+def test_concurrent(tmp_path, executor):
+    async def main():
+        paths = [AsyncPath2(tmp_path, "dir%i" % no, executor=executor) for no in range(20)]
+        await asyncio.gather(*[path.makedirs() for path in paths])
+        results = await asyncio.gather(*[path.is_dir() for path in paths])
+        assert results == [True] * 20
+
+    run(main())
+
+
+def test_scandir(tmp_path, executor):
+    for no in range(5):
+        Path2(tmp_path, "file%i.txt" % no).touch()
+
+    async def main():
+        names = []
+        async for dir_entry in AsyncPath2(tmp_path, executor=executor).scandir():
+            names.append(dir_entry.name)
+        return sorted(names)
+
+    assert run(main()) == ["file%i.txt" % no for no in range(5)]
+
+
+def test_walk_parallel(tmp_path, executor):
+    Path2(tmp_path, "a", "b").makedirs()
+    Path2(tmp_path, "a", "b", "file.txt").touch()
+
+    async def main():
+        entries = []
+        async for entry in AsyncPath2(tmp_path, executor=executor).walk_parallel():
+            entries.append(entry)
+        return entries
+
+    entries = run(main())
+    assert all(isinstance(entry, DirEntryPath) for entry in entries)
+    assert sorted(entry.path for entry in entries) == [
+        Path2(tmp_path, "a").path,
+        Path2(tmp_path, "a", "b").path,
+        Path2(tmp_path, "a", "b", "file.txt").path,
+    ]
+
+
+def test_stop_early(tmp_path, executor):
+    for no in range(10):
+        Path2(tmp_path, "file%i.txt" % no).touch()
+
+    async def main():
+        iterator = AsyncPath2(tmp_path, executor=executor).scandir()
+        async for dir_entry in iterator:
+            break
+        await iterator.aclose()
+        return dir_entry.name
+
+    assert run(main()).startswith("file")
+
+
+def test_path_api(tmp_path):
+    path = AsyncPath2(tmp_path, "foo.txt")
+    assert path.path == Path2(tmp_path, "foo.txt").path
+    assert path.name == "foo.txt"
+    assert path.parent == Path2(tmp_path)
+    assert AsyncPath2(path) == path
+    assert repr(path) == "<AsyncPath2 %r>" % path.path
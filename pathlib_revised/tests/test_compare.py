@@ -0,0 +1,107 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import mmap
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised import compare
+
+IS_NT = os.name == 'nt'
+
+CHUNK_SIZE = 1024
+
+
+def _write(path, content):
+    path.write_bytes(content)
+    return path
+
+
+@pytest.fixture(scope="function")
+def content():
+    return bytes(range(256)) * 20  # 5 KiB: more than CHUNK_SIZE
+
+
+@pytest.mark.parametrize("size", [0, 1, CHUNK_SIZE - 1, CHUNK_SIZE, CHUNK_SIZE + 1, 5 * CHUNK_SIZE])
+def test_same_content(tmp_path, size):
+    data = os.urandom(size)
+    path1 = _write(Path2(tmp_path, "one"), data)
+    path2 = _write(Path2(tmp_path, "two"), data)
+    assert path1.same_content(path2, chunk_size=CHUNK_SIZE, sample_size=64)
+
+    if size:
+        for offset in (0, size // 2, size - 1):
+            changed = bytearray(data)
+            changed[offset] ^= 0xFF
+            _write(path2, bytes(changed))
+            assert not path1.same_content(path2, chunk_size=CHUNK_SIZE, sample_size=64)
+
+
+def test_different_size(tmp_path, content):
+    path1 = _write(Path2(tmp_path, "one"), content)
+    path2 = _write(Path2(tmp_path, "two"), content + b"X")
+    assert not path1.same_content(path2)
+    assert not path2.same_content(path1)
+
+
+def test_same_inode(tmp_path, content, monkeypatch):
+    path1 = _write(Path2(tmp_path, "one"), content)
+    path2 = Path2(tmp_path, "two")
+    path1.link(path2)
+
+    def fail(*args):
+        raise AssertionError("content compared")
+
+    monkeypatch.setattr(compare, "_same_mmap", fail)
+    monkeypatch.setattr(compare, "_same_buffered", fail)
+    assert path1.same_content(path2)
+    assert path1.same_content(path1)
+
+
+def test_samples_exit_early(tmp_path, content, monkeypatch):
+    path1 = _write(Path2(tmp_path, "one"), content)
+    path2 = _write(Path2(tmp_path, "two"), content[:-1] + b"X")
+
+    def fail(*args):
+        raise AssertionError("full compare")
+
+    monkeypatch.setattr(compare, "_same_mmap", fail)
+    assert not path1.same_content(path2, chunk_size=CHUNK_SIZE, sample_size=64)
+
+
+def test_buffered_fallback(tmp_path, content, monkeypatch):
+    path1 = _write(Path2(tmp_path, "one"), content)
+    path2 = _write(Path2(tmp_path, "two"), content)
+
+    def no_mmap(*args, **kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr(mmap, "mmap", no_mmap)
+    assert path1.same_content(path2, chunk_size=CHUNK_SIZE)
+
+    _write(path2, content[:-1] + b"X")
+    assert not path1.same_content(path2, chunk_size=CHUNK_SIZE, samples=0)
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_special_files(tmp_path, content):
+    path = _write(Path2(tmp_path, "one"), content)
+    assert not path.same_content("/dev/null")
+    assert Path2("/dev/null").same_content("/dev/null")
+
+    empty = _write(Path2(tmp_path, "empty"), b"")
+    assert empty.same_content("/dev/null")
+
+
+def test_missing_file(tmp_path, content):
+    path = _write(Path2(tmp_path, "one"), content)
+    with pytest.raises(FileNotFoundError):
+        path.same_content(Path2(tmp_path, "missing"))
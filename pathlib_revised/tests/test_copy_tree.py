@@ -0,0 +1,150 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+import stat
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised import copy_tree
+
+IS_NT = os.name == 'nt'
+
+MTIME = 111111111  # UTC: 1973-07-10 00:11:51
+ATIME = 222222222  # UTC: 1977-01-16 01:23:42
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    top = Path2(tmp_path, "src")
+    for dir_name in ("one", "two"):
+        Path2(top, dir_name, "sub").makedirs()
+        for file_no in range(3):
+            Path2(top, dir_name, "sub", "file%i.txt" % file_no).write_text("%s %i" % (dir_name, file_no))
+    Path2(top, "empty").mkdir()
+    Path2(top, "one", "sub", "file0.txt").link(Path2(top, "two", "link.txt"))
+    Path2(top, "one", "sub", "file0.txt").link(Path2(top, "link.txt"))
+
+    Path2(top, "one", "sub", "file1.txt").chmod(0o600)
+    Path2(top, "one", "sub", "file1.txt").utime(times=(ATIME, MTIME))
+    Path2(top, "two").utime(times=(ATIME, MTIME))
+    return top
+
+
+def tree_content(top):
+    content = {}
+    for path in top.rglob("*"):
+        relative_path = path.relative_to(top).path
+        if path.is_symlink():
+            content[relative_path] = "-> %s" % os.readlink(path.path)
+        elif path.is_dir():
+            content[relative_path] = None
+        else:
+            content[relative_path] = path.read_text()
+    return content
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_copytree(tree_path, tmp_path, max_workers):
+    dst = Path2(tmp_path, "dst")
+    assert tree_path.copytree(dst, max_workers=max_workers) == []
+
+    # The hardlinks are recreated:
+    st = Path2(dst, "one", "sub", "file0.txt").stat()
+    assert st.st_nlink == 3
+    assert Path2(dst, "two", "link.txt").stat().st_ino == st.st_ino
+    assert Path2(dst, "link.txt").stat().st_ino == st.st_ino
+    assert Path2(dst, "one", "sub", "file1.txt").stat().st_nlink == 1
+
+    # The metadata (check it before the content is read):
+    st = Path2(dst, "one", "sub", "file1.txt").stat()
+    assert stat.S_IMODE(st.st_mode) == 0o600 or IS_NT
+    assert st.st_mtime == MTIME
+    assert st.st_atime == ATIME
+    assert Path2(dst, "two").stat().st_mtime == MTIME
+
+    assert tree_content(dst) == tree_content(tree_path)
+
+
+def test_copytree_exists(tree_path, tmp_path):
+    dst = Path2(tmp_path, "dst")
+    dst.mkdir()
+    with pytest.raises(FileExistsError):
+        tree_path.copytree(dst)
+
+    Path2(dst, "one").mkdir()
+    assert tree_path.copytree(dst, dirs_exist_ok=True) == []
+    assert tree_content(dst) == tree_content(tree_path)
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_copytree_symlinks(tree_path, tmp_path):
+    Path2(tree_path, "one", "dir_link").symlink_to("sub")
+    Path2(tree_path, "broken_link").symlink_to("missing")
+
+    dst = Path2(tmp_path, "dst")
+    assert tree_path.copytree(dst) == []
+    assert tree_content(dst) == tree_content(tree_path)
+    assert Path2(dst, "one", "dir_link").is_symlink()
+
+
+def test_copytree_errors(tree_path, tmp_path):
+    dst = Path2(tmp_path, "dst")
+    dst.makedirs()
+    Path2(dst, "one", "sub").makedirs()
+    Path2(dst, "one", "sub", "file2.txt").mkdir()  # a directory can't be overwritten
+
+    errors = tree_path.copytree(dst, dirs_exist_ok=True)
+    assert [(error.source, error.destination) for error in errors] == [
+        (Path2(tree_path, "one", "sub", "file2.txt"), Path2(dst, "one", "sub", "file2.txt")),
+    ]
+    assert isinstance(errors[0].error, OSError)
+
+
+def test_copytree_dir_error(tree_path, tmp_path):
+    dst = Path2(tmp_path, "dst")
+    Path2(dst, "one").makedirs()
+    Path2(dst, "one", "sub").touch()  # a file is in the way
+
+    errors = tree_path.copytree(dst, dirs_exist_ok=True)
+    assert [(error.source, error.destination) for error in errors] == [
+        (Path2(tree_path, "one", "sub"), Path2(dst, "one", "sub")),
+    ]
+
+    # The subtree is skipped, the rest is copied:
+    content = tree_content(tree_path)
+    del content["one/sub"]
+    for no in range(3):
+        del content["one/sub/file%i.txt" % no]
+    content["one/sub"] = ""
+    assert tree_content(dst) == content
+
+
+def test_copytree_metadata_order(tree_path, tmp_path, monkeypatch):
+    calls = []
+    origin_set_metadata = copy_tree._set_metadata
+
+    def set_metadata(item):
+        calls.append(item[1])
+        return origin_set_metadata(item)
+
+    monkeypatch.setattr(copy_tree, "_set_metadata", set_metadata)
+    dst = Path2(tmp_path, "dst")
+    assert tree_path.copytree(dst, max_workers=4) == []
+
+    # First all files, then the directories, the deepest first.
+    # e.g.: a directory without 'x' permission would block its content.
+    is_dir = [path.is_dir() for path in calls]
+    first_dir = is_dir.index(True)
+    assert not any(is_dir[:first_dir])
+    assert all(is_dir[first_dir:])
+    depths = [len(path.parts) for path in calls[first_dir:]]
+    assert depths == sorted(depths, reverse=True)
+    assert calls[-1] == dst
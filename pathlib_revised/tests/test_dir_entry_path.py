@@ -205,3 +205,126 @@ class TestDirEntryPathPosix:
             FileNotFoundError)  # <- the error instance
         self.assertTrue(dir_entry_path.is_symlink)
         self.assertFalse(dir_entry_path.is_file)
+
+
+def test_from_dir_entry(tmp_path):
+    Path2(tmp_path, "a_file.txt").write_text("content")
+    Path2(tmp_path, "a_directory").mkdir()
+
+    dir_entries = sorted(Path2(tmp_path).scandir(), key=lambda x: x.name)
+    dir_entry_paths = [DirEntryPath.from_dir_entry(dir_entry) for dir_entry in dir_entries]
+    for dir_entry_path in dir_entry_paths:
+        print(dir_entry_path.pformat())
+
+    dir_path, file_path = dir_entry_paths
+
+    assert dir_path.path_instance == Path2(tmp_path, "a_directory")
+    assert dir_path.is_dir is True
+    assert dir_path.is_file is False
+    assert dir_path.is_symlink is False
+    assert dir_path.different_path is False
+    assert dir_path.resolve_error is None
+
+    assert file_path.path == str(Path2(tmp_path, "a_file.txt"))
+    assert file_path.is_dir is False
+    assert file_path.is_file is True
+    assert file_path.is_symlink is False
+    assert file_path.stat.st_size == 7
+    assert file_path.stat.st_ino == Path2(tmp_path, "a_file.txt").stat().st_ino
+    assert file_path.resolved_path == Path2(tmp_path, "a_file.txt").resolve()
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_from_dir_entry_symlink(tmp_path):
+    src_file = Path2(tmp_path, "source_file.txt")
+    src_file.write_text("content")
+    Path2(tmp_path, "symlink.txt").symlink_to(src_file)
+
+    dir_entries = sorted(Path2(tmp_path).scandir(), key=lambda x: x.name)
+    source_path, symlink_path = [DirEntryPath.from_dir_entry(dir_entry) for dir_entry in dir_entries]
+
+    assert source_path.is_symlink is False
+    assert source_path.different_path is False
+
+    assert symlink_path.is_symlink is True
+    assert symlink_path.is_file is True
+    assert symlink_path.different_path is True
+    assert symlink_path.resolved_path == src_file.resolve()
+    assert symlink_path.stat.st_ino == source_path.stat.st_ino
+
+
+def test_from_dir_entry_parent(tmp_path):
+    Path2(tmp_path, "a_file.txt").write_text("content")
+
+    parent = Path2(tmp_path)
+    dir_entry = next(parent.scandir())
+    dir_entry_path = DirEntryPath.from_dir_entry(dir_entry, parent=parent)
+    assert dir_entry_path.path_instance == Path2(tmp_path, "a_file.txt")
+    assert dir_entry_path.path == dir_entry.path
+    assert dir_entry_path.is_file is True
+
+
+def test_lazy_information(tmp_path):
+    file_path = Path2(tmp_path, "a_file.txt")
+    file_path.write_text("content")
+
+    dir_entry = tuple(Path2(tmp_path).scandir())[0]
+    dir_entry_path = DirEntryPath.from_dir_entry(dir_entry)
+    assert not hasattr(dir_entry_path, "__dict__")
+
+    # The file type information is taken from os.DirEntry(),
+    # but stat() will be called on first access:
+    file_path.unlink()
+    assert dir_entry_path.is_file is True
+    with pytest.raises(FileNotFoundError):
+        dir_entry_path.stat
+
+    # a successful stat() result is cached:
+    file_path.write_text("new content")
+    stat = dir_entry_path.stat
+    assert stat.st_size == 11
+    file_path.write_text("changed")
+    assert dir_entry_path.stat is stat
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_lazy_resolve_onerror(tmp_path, monkeypatch):
+    file_path = Path2(tmp_path, "a_file.txt")
+    file_path.touch()
+
+    errors = []
+    dir_entry_path = DirEntryPath(file_path, onerror=errors.append)
+
+    def resolve(path):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr(type(file_path), "resolve", resolve)
+
+    # resolve() will only be called on demand:
+    assert dir_entry_path.is_file is True
+    assert errors == []
+
+    assert dir_entry_path.resolved_path is None
+    assert dir_entry_path.different_path is True
+    assert isinstance(dir_entry_path.resolve_error, PermissionError)
+    assert errors == ["Resolve %r error: denied" % dir_entry_path.path]
+
+
+def test_memory_usage(tmp_path):
+    Path2(tmp_path, "a_file.txt").write_text("content")
+
+    parent = Path2(tmp_path)
+    dir_entry = next(parent.scandir())
+    dir_entry_path = DirEntryPath.from_dir_entry(dir_entry, parent=parent)
+
+    # Only the shared parent and the name are stored, the path is created on first access:
+    assert dir_entry_path._path_instance is None
+    assert dir_entry_path._parent is parent
+    path_instance = dir_entry_path.path_instance
+    assert path_instance == Path2(tmp_path, "a_file.txt")
+    assert dir_entry_path.path_instance is path_instance
+
+    # The stat result is the unchanged os.stat_result:
+    st = dir_entry_path.stat
+    assert isinstance(st, os.stat_result)
+    assert st == Path2(tmp_path, "a_file.txt").stat()
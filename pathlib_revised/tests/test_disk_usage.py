@@ -0,0 +1,126 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised.disk_usage import DiskUsage, iter_disk_usage
+
+IS_NT = os.name == 'nt'
+
+
+@pytest.fixture(scope="function")
+def backup_path(tmp_path):
+    """
+    Two backup generations: The files of the second one are hardlinks to the first one.
+    """
+    top = Path2(tmp_path, "backups")
+    for dir_name in ("sub1", "sub2"):
+        Path2(top, "first", dir_name).makedirs()
+        for file_no in range(3):
+            Path2(top, "first", dir_name, "file%i.txt" % file_no).write_bytes(b"X" * 100)
+    Path2(top, "first", "only_first.txt").write_bytes(b"X" * 10)
+
+    for dir_name in ("sub1", "sub2"):
+        Path2(top, "second", dir_name).makedirs()
+        for file_no in range(3):
+            Path2(top, "first", dir_name, "file%i.txt" % file_no).link(
+                Path2(top, "second", dir_name, "file%i.txt" % file_no)
+            )
+    Path2(top, "second", "new.txt").write_bytes(b"X" * 20)
+    return top
+
+
+def _expected(*paths):
+    usage = DiskUsage()
+    seen = set()
+    for path in paths:
+        for dirpath, dirnames, filenames in os.walk(path):
+            usage.add_stat(os.lstat(dirpath))
+            dir_links = [name for name in dirnames if os.path.islink(os.path.join(dirpath, name))]
+            for filename in filenames + dir_links:
+                st = os.lstat(os.path.join(dirpath, filename))
+                if (st.st_dev, st.st_ino) in seen:
+                    usage.hardlinks += 1
+                    continue
+                seen.add((st.st_dev, st.st_ino))
+                usage.add_stat(st)
+    return usage
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_disk_usage(backup_path, max_workers):
+    usage = backup_path.disk_usage(max_workers=max_workers)
+    assert usage == _expected(backup_path.path)
+    assert usage.files == 8
+    assert usage.dirs == 7
+    assert usage.hardlinks == 6
+    assert usage.apparent_size >= 6 * 100 + 10 + 20
+    assert usage.allocated_size > 0
+
+
+def test_iter_disk_usage(backup_path):
+    results = list(backup_path.iter_disk_usage(max_workers=4))
+    paths = [path.path for path, usage in results]
+    assert len(paths) == 7
+    assert paths[-1] == backup_path.path
+
+    # A directory is yielded after its sub directories:
+    for index, path in enumerate(paths):
+        for sub_path in paths[index + 1:]:
+            assert not sub_path.startswith(path + os.sep)
+
+    usages = {path.path: usage for path, usage in results}
+    first = usages[Path2(backup_path, "first").path]
+    second = usages[Path2(backup_path, "second").path]
+    if first.files == 7:
+        # the first generation was scanned first:
+        assert first == _expected(Path2(backup_path, "first").path)
+        assert second.files == 1
+        assert second.hardlinks == 6
+
+    total = DiskUsage()
+    total.add_stat(backup_path.stat())
+    total.add(first)
+    total.add(second)
+    assert total == usages[backup_path.path]
+
+
+def test_disk_usage_partial_hardlinks(backup_path):
+    # The other links are outside, count the files once:
+    usage = Path2(backup_path, "second").disk_usage()
+    assert usage == _expected(Path2(backup_path, "second").path)
+    assert usage.files == 7
+    assert usage.hardlinks == 0
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_disk_usage_symlinks(backup_path, tmp_path):
+    outside = Path2(tmp_path, "outside")
+    outside.mkdir()
+    Path2(outside, "big.txt").write_bytes(b"X" * 10000)
+    Path2(backup_path, "dir_link").symlink_to(outside)
+
+    usage = backup_path.disk_usage()
+    assert usage.symlinks == 1
+    assert usage.files == 8
+    assert usage == _expected(backup_path.path)
+
+
+def test_disk_usage_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Path2(tmp_path, "missing").disk_usage()
+
+    messages = []
+    Path2(tmp_path, "file.txt").touch()
+    list(iter_disk_usage(Path2(tmp_path, "file.txt"), onerror=messages.append))
+    assert len(messages) == 1
+    assert messages[0].startswith("Scandir ")
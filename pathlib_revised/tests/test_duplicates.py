@@ -0,0 +1,101 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised.duplicates import find_duplicates, partial_hash
+
+CONTENT = bytes(range(256)) * 100
+
+
+def as_names(duplicates):
+    """
+    Convert the find_duplicates() result into a sorted list of file names
+    """
+    return sorted(
+        sorted(
+            sorted(entry.path_instance.name for entry in inode_group)
+            for inode_group in groups
+        )
+        for groups in duplicates
+    )
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    Path2(tmp_path, "sub_dir").mkdir()
+
+    Path2(tmp_path, "a.bin").write_bytes(CONTENT)
+    Path2(tmp_path, "a.bin").link(Path2(tmp_path, "a_hardlink.bin"))
+    Path2(tmp_path, "sub_dir", "a_copy.bin").write_bytes(CONTENT)
+
+    # same size, same start and end, but different in the middle:
+    middle = len(CONTENT) // 2
+    Path2(tmp_path, "b.bin").write_bytes(CONTENT[:middle] + b"X" + CONTENT[middle + 1:])
+
+    # small files:
+    Path2(tmp_path, "small1.txt").write_bytes(b"small")
+    Path2(tmp_path, "sub_dir", "small2.txt").write_bytes(b"small")
+    Path2(tmp_path, "other.txt").write_bytes(b"other")
+
+    # empty files are ignored by default:
+    Path2(tmp_path, "empty1.txt").touch()
+    Path2(tmp_path, "empty2.txt").touch()
+
+    # only hardlinks -> no duplicates:
+    Path2(tmp_path, "single.txt").write_bytes(b"single file")
+    Path2(tmp_path, "single.txt").link(Path2(tmp_path, "single_hardlink.txt"))
+
+    return Path2(tmp_path)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_find_duplicates(tree_path, max_workers):
+    errors = []
+    duplicates = tree_path.find_duplicates(max_workers=max_workers, onerror=errors.append)
+    assert as_names(duplicates) == [
+        [["a.bin", "a_hardlink.bin"], ["a_copy.bin"]],
+        [["small1.txt"], ["small2.txt"]],
+    ]
+    assert errors == []
+
+
+def test_min_size(tree_path):
+    duplicates = find_duplicates(tree_path.walk_parallel(), min_size=0)
+    assert as_names(duplicates) == [
+        [["a.bin", "a_hardlink.bin"], ["a_copy.bin"]],
+        [["empty1.txt"], ["empty2.txt"]],
+        [["small1.txt"], ["small2.txt"]],
+    ]
+
+
+def test_path2_entries(tree_path):
+    paths = [Path2(tree_path, name) for name in ("small1.txt", "other.txt", "a.bin")]
+    paths.append(Path2(tree_path, "sub_dir", "small2.txt"))
+    assert as_names(find_duplicates(paths)) == [[["small1.txt"], ["small2.txt"]]]
+
+
+def test_partial_hash(tmp_path):
+    file_path = Path2(tmp_path, "file.bin")
+    file_path.write_bytes(CONTENT)
+
+    assert partial_hash(file_path, partial_size=100, algorithm="md5") == (
+        hashlib.md5(CONTENT[:100] + CONTENT[-100:]).hexdigest()
+    )
+
+    # small files are hashed completely:
+    assert partial_hash(file_path, partial_size=len(CONTENT) - 1, algorithm="md5") == (
+        hashlib.md5(CONTENT).hexdigest()
+    )
+    assert partial_hash(file_path, partial_size=len(CONTENT) * 2, algorithm="md5") == (
+        hashlib.md5(CONTENT).hexdigest()
+    )
@@ -0,0 +1,212 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import errno
+import os
+import shutil
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised import file_copy
+from pathlib_revised.file_copy import COPY_FILE_RANGE, READINTO, REFLINK, SENDFILE, SPARSE, SYMLINK, CopyResult
+
+IS_NT = os.name == 'nt'
+
+CONTENT = bytes(range(256)) * 100
+
+
+@pytest.fixture(scope="function")
+def src_file(tmp_path):
+    src_file = Path2(tmp_path, "source.bin")
+    src_file.write_bytes(CONTENT)
+    return src_file
+
+
+def strategy_available(strategy):
+    if strategy == COPY_FILE_RANGE:
+        return hasattr(os, "copy_file_range")
+    if strategy == SENDFILE:
+        return hasattr(os, "sendfile") and not IS_NT
+    return True
+
+
+@pytest.mark.parametrize("strategy", [COPY_FILE_RANGE, SENDFILE, READINTO])
+def test_strategies(src_file, strategy):
+    if not strategy_available(strategy):
+        pytest.skip("%s not available" % strategy)
+
+    dst_file = Path2(src_file.parent, "destination.bin")
+
+    progress = []
+    result = src_file.copyfile(
+        dst_file, block_size=1000, strategies=(strategy,),
+        callback=lambda bytes_copied, size: progress.append((bytes_copied, size))
+    )
+    assert result == CopyResult(strategy, len(CONTENT))
+    assert dst_file.read_bytes() == CONTENT
+
+    # callback called for every chunk:
+    assert len(progress) == 26
+    assert progress[0] == (1000, len(CONTENT))
+    assert progress[-1] == (len(CONTENT), len(CONTENT))
+
+
+def test_default_strategy(src_file):
+    dst_file = Path2(src_file.parent, "destination.bin")
+    result = src_file.copyfile(dst_file)
+    assert result.strategy in file_copy.DEFAULT_STRATEGIES
+    assert result.bytes_copied == len(CONTENT)
+    assert dst_file.read_bytes() == CONTENT
+
+
+def test_empty_file(tmp_path):
+    src_file = Path2(tmp_path, "empty.txt")
+    src_file.touch()
+    dst_file = Path2(tmp_path, "destination.txt")
+
+    result = src_file.copyfile(dst_file)
+    assert result.bytes_copied == 0
+    assert dst_file.read_bytes() == b""
+
+
+def test_overwrite(src_file):
+    dst_file = Path2(src_file.parent, "destination.bin")
+    dst_file.write_bytes(b"X" * (len(CONTENT) * 2))
+    src_file.copyfile(dst_file)
+    assert dst_file.read_bytes() == CONTENT
+
+
+def test_fallback(src_file, monkeypatch):
+    def unsupported(*args, **kwargs):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+
+    dst_file = Path2(src_file.parent, "destination.bin")
+    result = src_file.copyfile(dst_file)
+    assert result == CopyResult(READINTO, len(CONTENT))
+    assert dst_file.read_bytes() == CONTENT
+
+    # The last error will be raised, if no strategy can be used:
+    with pytest.raises(OSError) as excinfo:
+        src_file.copyfile(dst_file, strategies=(COPY_FILE_RANGE, SENDFILE))
+    assert excinfo.value.errno == errno.EXDEV
+
+
+def test_no_fallback_on_other_errors(src_file, monkeypatch):
+    def no_space(*args, **kwargs):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(os, "copy_file_range", no_space, raising=False)
+
+    dst_file = Path2(src_file.parent, "destination.bin")
+    with pytest.raises(OSError) as excinfo:
+        src_file.copyfile(dst_file, strategies=(COPY_FILE_RANGE, READINTO))
+    assert excinfo.value.errno == errno.ENOSPC
+
+
+def test_wrong_strategy(src_file):
+    dst_file = Path2(src_file.parent, "destination.bin")
+    with pytest.raises(ValueError):
+        src_file.copyfile(dst_file, strategies=("foobar",))
+    with pytest.raises(ValueError):
+        src_file.copyfile(dst_file, strategies=(READINTO,), reflink=True)
+
+
+def test_same_file(src_file):
+    with pytest.raises(shutil.SameFileError):
+        src_file.copyfile(src_file)
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_symlink(src_file):
+    link = Path2(src_file.parent, "link")
+    link.symlink_to(src_file)
+
+    dst_file = Path2(src_file.parent, "destination.bin")
+    result = link.copyfile(dst_file)
+    assert result.bytes_copied == len(CONTENT)
+    assert dst_file.is_symlink() is False
+    assert dst_file.read_bytes() == CONTENT
+
+    dst_link = Path2(src_file.parent, "destination_link")
+    result = link.copyfile(dst_link, follow_symlinks=False)
+    assert result == CopyResult(SYMLINK, 0)
+    assert dst_link.is_symlink() is True
+    assert dst_link.resolve() == src_file.resolve()
+
+
+def test_get_strategies():
+    assert file_copy.get_strategies() == file_copy.DEFAULT_STRATEGIES
+    assert file_copy.get_strategies(reflink=True) == (REFLINK,) + file_copy.DEFAULT_STRATEGIES
+    assert file_copy.get_strategies(sparse=True) == (SPARSE, READINTO)
+    assert file_copy.get_strategies(reflink=True, sparse=True) == (REFLINK, SPARSE, READINTO)
+
+
+def test_reflink(src_file):
+    """
+    Works on every filesystem: With FICLONE support (e.g.: btrfs, xfs) or via fallback.
+    """
+    dst_file = Path2(src_file.parent, "destination.bin")
+    result = src_file.copyfile(dst_file, reflink=True)
+    assert result.strategy in (REFLINK,) + file_copy.DEFAULT_STRATEGIES
+    assert result.bytes_copied == len(CONTENT)
+    assert dst_file.read_bytes() == CONTENT
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_reflink_fallback(src_file, monkeypatch):
+    def ioctl(*args):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(file_copy, "fcntl", type("fcntl", (), {"ioctl": staticmethod(ioctl)}))
+
+    dst_file = Path2(src_file.parent, "destination.bin")
+    result = src_file.copyfile(dst_file, strategies=(REFLINK, READINTO))
+    assert result == CopyResult(READINTO, len(CONTENT))
+    assert dst_file.read_bytes() == CONTENT
+
+
+@pytest.mark.skipif(not hasattr(os, "SEEK_DATA"), reason='test requires SEEK_DATA/SEEK_HOLE')
+def test_sparse(tmp_path):
+    mib = 1024 * 1024
+    src_file = Path2(tmp_path, "sparse.bin")
+    with src_file.open("wb") as f:
+        f.seek(2 * mib)
+        f.write(b"data in the middle")
+        f.seek(4 * mib)
+        f.write(b"data at 4MiB")
+        f.truncate(8 * mib)  # hole at the end
+    src_blocks = src_file.stat().st_blocks
+
+    dst_file = Path2(tmp_path, "destination.bin")
+    progress = []
+    result = src_file.copyfile(dst_file, sparse=True, callback=lambda *args: progress.append(args))
+    assert result.strategy in (SPARSE, READINTO)
+    assert dst_file.stat().st_size == 8 * mib
+    assert dst_file.read_bytes() == src_file.read_bytes()
+
+    if src_blocks * 512 >= mib:
+        # filesystem without sparse files support
+        return
+
+    assert result.strategy == SPARSE
+    assert result.bytes_copied < mib
+    assert progress[-1] == (result.bytes_copied, 8 * mib)
+    assert dst_file.stat().st_blocks <= src_blocks
+
+
+@pytest.mark.skipif(not hasattr(os, "SEEK_DATA"), reason='test requires SEEK_DATA/SEEK_HOLE')
+def test_sparse_normal_file(src_file):
+    dst_file = Path2(src_file.parent, "destination.bin")
+    result = src_file.copyfile(dst_file, strategies=(SPARSE,))
+    assert result == CopyResult(SPARSE, len(CONTENT))
+    assert dst_file.read_bytes() == CONTENT
@@ -0,0 +1,154 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised import walk
+from pathlib_revised.filters import PathFilter
+
+
+@pytest.mark.parametrize("pattern, path, is_dir, excluded", [
+    # name in any directory:
+    ("node_modules", "node_modules", True, True),
+    ("node_modules", "a/b/node_modules", True, True),
+    ("node_modules", "a/node_modules_foo", True, False),
+    ("*.tmp", "a/b/foo.tmp", False, True),
+    ("*.tmp", "a/foo.tmp/bar", False, False),
+    ("foo?.txt", "foo1.txt", False, True),
+    ("foo[0-9].txt", "a/foo5.txt", False, True),
+    ("foo[!0-9].txt", "a/foo5.txt", False, False),
+    (r"\*.txt", "*.txt", False, True),
+    (r"\*.txt", "a.txt", False, False),
+    # only directories:
+    ("build/", "build", True, True),
+    ("build/", "build", False, False),
+    ("build/", "a/build", True, True),
+    # relative to the root:
+    ("/build", "build", True, True),
+    ("/build", "a/build", True, False),
+    ("doc/*.txt", "doc/foo.txt", False, True),
+    ("doc/*.txt", "doc/sub/foo.txt", False, False),
+    ("doc/*.txt", "a/doc/foo.txt", False, False),
+    # "**":
+    ("**/cache", "cache", True, True),
+    ("**/cache", "a/b/cache", True, True),
+    ("a/**/b", "a/b", True, True),
+    ("a/**/b", "a/x/y/b", True, True),
+    ("a/**/b", "x/a/b", True, False),
+    ("a/**", "a/x/y", False, True),
+    ("a/**", "a", True, False),
+])
+def test_patterns(pattern, path, is_dir, excluded):
+    assert PathFilter([pattern]).is_excluded(path, is_dir) is excluded
+
+
+def test_negation():
+    path_filter = PathFilter(["*.tmp", "!keep*.tmp", "keep_not.tmp"])
+    assert path_filter.is_excluded("foo.tmp") is True
+    assert path_filter.is_excluded("a/keep.tmp") is False
+    assert path_filter.is_excluded("keep_not.tmp") is True
+    assert path_filter.is_excluded("foo.txt") is False
+
+
+def test_comments():
+    path_filter = PathFilter([
+        "# a comment\n", "\n", "   \n", r"\#hash" + "\n", r"\!bang", "trailing   \n",
+    ])
+    assert path_filter.patterns == [r"\#hash", r"\!bang", "trailing"]
+    assert path_filter.is_excluded("#hash") is True
+    assert path_filter.is_excluded("!bang") is True
+    assert path_filter.is_excluded("trailing") is True
+    assert path_filter.is_excluded("# a comment") is False
+
+
+def test_from_file(tmp_path):
+    ignore_file = Path2(tmp_path, ".gitignore")
+    ignore_file.write_text("*.pyc\n__pycache__/\n")
+    path_filter = PathFilter.from_file(ignore_file)
+    assert path_filter.is_excluded("a/foo.pyc") is True
+    assert path_filter.is_excluded("a/__pycache__", is_dir=True) is True
+    assert repr(path_filter) == "<PathFilter ['*.pyc', '__pycache__/']>"
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    for path in (
+        ("src", "main.py"),
+        ("src", "main.pyc"),
+        ("src", "node_modules", "lib", "lib.js"),
+        ("node_modules", "foo.js"),
+        (".git", "objects", "ab"),
+        ("build", "out.txt"),
+        ("docs", "build", "index.html"),
+    ):
+        Path2(tmp_path, *path[:-1]).makedirs(exist_ok=True)
+        Path2(tmp_path, *path).touch()
+    return Path2(tmp_path)
+
+
+PATTERNS = ["node_modules/", ".git/", "*.pyc", "/build/"]
+
+EXPECTED = sorted(os.path.join(*path) for path in (
+    ("src",), ("src", "main.py"),
+    ("docs",), ("docs", "build"), ("docs", "build", "index.html"),
+))
+
+
+def test_walk_parallel(tree_path, monkeypatch):
+    scanned = []
+    origin_scan_dir = walk._scan_dir
+
+    def scan_dir(path, *args):
+        scanned.append(path.path)
+        return origin_scan_dir(path, *args)
+
+    monkeypatch.setattr(walk, "_scan_dir", scan_dir)
+
+    entries = tree_path.walk_parallel(path_filter=PathFilter(PATTERNS))
+    assert sorted(entry.path_instance.relative_to(tree_path).path for entry in entries) == EXPECTED
+
+    # The excluded directories are not scanned:
+    scanned_dirs = ((), ("src",), ("docs",), ("docs", "build"))
+    assert sorted(scanned) == sorted(Path2(tree_path, *path).path for path in scanned_dirs)
+
+
+@pytest.mark.skipif(not walk.fwalk_supported(), reason='fwalk() not supported')
+def test_fwalk(tree_path):
+    paths = []
+    for dirpath, dirnames, filenames, dir_fd in tree_path.fwalk(path_filter=PathFilter(PATTERNS)):
+        relative_path = dirpath.relative_to(tree_path).path
+        paths += [os.path.normpath(os.path.join(relative_path, name)) for name in dirnames + filenames]
+    assert sorted(paths) == EXPECTED
+
+
+def test_scandir(tree_path):
+    path_filter = PathFilter(PATTERNS)
+    assert sorted(dir_entry.name for dir_entry in path_filter.scandir(tree_path)) == ["docs", "src"]
+    assert sorted(
+        dir_entry.name for dir_entry in path_filter.scandir(Path2(tree_path, "docs"), relative_dir="docs")
+    ) == ["build"]
+
+
+def test_relative_root(tree_path, monkeypatch):
+    monkeypatch.chdir(tree_path.path)
+    path_filter = PathFilter(PATTERNS + ["/docs/build/"])
+    expected = sorted(os.path.join(*path) for path in (("src",), ("src", "main.py"), ("docs",)))
+
+    for top in (Path2("."), Path2("")):
+        entries = top.walk_parallel(path_filter=path_filter)
+        assert sorted(entry.path for entry in entries) == expected
+
+    if walk.fwalk_supported():
+        paths = []
+        for dirpath, dirnames, filenames, dir_fd in Path2(".").fwalk(path_filter=path_filter):
+            paths += [os.path.normpath(os.path.join(dirpath.path, name)) for name in dirnames + filenames]
+        assert sorted(paths) == expected
@@ -0,0 +1,121 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+import pathlib
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised.globbing import LITERAL, RECURSIVE, WILDCARD, compile_pattern, iglob
+
+IS_NT = os.name == 'nt'
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    top = Path2(tmp_path, "top")
+    for dir_name in ("one", "two", ".hidden"):
+        Path2(top, dir_name, "a", "deep").makedirs()
+        Path2(top, dir_name, "a", "deep", "file.txt").touch()
+        Path2(top, dir_name, "a", "file.txt").touch()
+        Path2(top, dir_name, "a", "file.py").touch()
+        Path2(top, dir_name, "file.txt").touch()
+    Path2(top, "file.txt").touch()
+    Path2(top, "empty").mkdir()
+    return top
+
+
+def _paths(paths):
+    return sorted(str(path) for path in paths)
+
+
+def test_compile_pattern():
+    assert compile_pattern("foo/**/**/bar") == (
+        (LITERAL, "foo"), (RECURSIVE, None), (LITERAL, "bar"),
+    )
+    segments = compile_pattern("./a*//b?")
+    assert [segment_type for segment_type, segment in segments] == [WILDCARD, WILDCARD]
+    assert segments[0][1]("abc")
+    assert not segments[0][1]("cba")
+
+    # compiled once:
+    assert compile_pattern("*.txt") is compile_pattern("*.txt")
+
+    with pytest.raises(ValueError):
+        compile_pattern("")
+    with pytest.raises(ValueError):
+        compile_pattern("foo**")
+    with pytest.raises(NotImplementedError):
+        compile_pattern("/foo")
+
+
+@pytest.mark.parametrize("pattern", [
+    "*", "*.txt", "*/a/*.txt", "one/a/file.txt", "one/a/missing.txt", "*/a/deep",
+    "**", "**/*", "**/*.txt", "**/a", "**/a/*.py", "*/**/file.txt", "**/a/**", "**/a/**/*.txt",
+    "[ot]*/a", "?ne/*", "missing/*", "file.txt/*",
+])
+def test_glob_same_as_pathlib(tree_path, pattern):
+    expected = _paths(pathlib.Path(tree_path.path).glob(pattern))
+    result = list(tree_path.glob(pattern))
+    assert len(result) == len(set(path.path for path in result)), "duplicate results"
+    assert _paths(result) == expected
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@pytest.mark.parametrize("pattern", ["*", "*.txt", "a/*", "a/**/*.txt"])
+def test_rglob(tree_path, max_workers, pattern):
+    expected = _paths(pathlib.Path(tree_path.path).rglob(pattern))
+    assert _paths(tree_path.rglob(pattern, max_workers=max_workers)) == expected
+
+
+def test_glob_returns_path2(tree_path):
+    path = next(iter(tree_path.glob("*.txt")))
+    assert isinstance(path, type(tree_path))
+    assert path.path == Path2(tree_path, "file.txt").path
+
+
+def test_glob_is_lazy(tree_path, monkeypatch):
+    calls = []
+    origin_scandir = os.scandir
+
+    def scandir(path):
+        calls.append(path)
+        return origin_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    results = tree_path.glob("**/*")
+    assert calls == []
+    next(results)
+    assert len(calls) == 1
+
+
+def test_glob_case_sensitive(tree_path):
+    assert _paths(iglob(tree_path, "*.TXT")) == []
+    assert _paths(iglob(tree_path, "*.TXT", case_sensitive=False)) == [Path2(tree_path, "file.txt").path]
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_rglob_symlinks(tree_path, tmp_path, max_workers):
+    outside = Path2(tmp_path, "outside")
+    outside.mkdir()
+    Path2(outside, "outside.txt").touch()
+    Path2(tree_path, "one", "dir_link").symlink_to(outside)
+    Path2(tree_path, "one", "loop").symlink_to(tree_path)
+
+    # Like pathlib: the symlinks are matched, but "**" doesn't follow them:
+    expected = _paths(pathlib.Path(tree_path.path).rglob("*"))
+    result = _paths(tree_path.rglob("*", max_workers=max_workers))
+    assert result == expected
+    assert Path2(tree_path, "one", "dir_link").path in result
+    assert Path2(tree_path, "one", "dir_link", "outside.txt").path not in result
+
+    # A symlink to a directory is followed by a wildcard:
+    assert _paths(tree_path.glob("one/dir_link/*")) == [Path2(tree_path, "one", "dir_link", "outside.txt").path]
@@ -0,0 +1,140 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import DirEntryPath, Path2
+from pathlib_revised import hashing
+
+CONTENT = bytes(range(256)) * 100
+
+
+def test_hash_content(tmp_path):
+    file_path = Path2(tmp_path, "file.bin")
+    file_path.write_bytes(CONTENT)
+
+    assert file_path.hash_content() == {
+        "sha512": hashlib.sha512(CONTENT).hexdigest(),
+        "md5": hashlib.md5(CONTENT).hexdigest(),
+    }
+    assert file_path.hash_content(algorithms=("sha1",), block_size=1000) == {
+        "sha1": hashlib.sha1(CONTENT).hexdigest(),
+    }
+
+
+def test_empty_file(tmp_path):
+    file_path = Path2(tmp_path, "empty.txt")
+    file_path.touch()
+    assert file_path.hash_content(algorithms=("sha256",)) == {"sha256": hashlib.sha256(b"").hexdigest()}
+
+
+def test_read_once(tmp_path, monkeypatch):
+    file_path = Path2(tmp_path, "file.bin")
+    file_path.write_bytes(CONTENT)
+
+    advices = []
+    monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, advice: advices.append(advice), raising=False)
+    monkeypatch.setattr(os, "POSIX_FADV_SEQUENTIAL", "SEQUENTIAL", raising=False)
+    monkeypatch.setattr(os, "POSIX_FADV_DONTNEED", "DONTNEED", raising=False)
+
+    read_sizes = []
+    origin_open = open
+
+    class FileWrapper:
+        def __init__(self, f):
+            self.f = f
+
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.f.close()
+
+        def readinto(self, buffer):
+            read = self.f.readinto(buffer)
+            read_sizes.append(read)
+            return read
+
+    def wrapped_open(*args, **kwargs):
+        return FileWrapper(origin_open(*args, **kwargs))
+
+    monkeypatch.setattr(hashing, "open", wrapped_open, raising=False)
+
+    digests = file_path.hash_content(algorithms=("sha512", "md5", "sha1"), block_size=10000)
+    assert digests["sha1"] == hashlib.sha1(CONTENT).hexdigest()
+
+    assert read_sizes == [10000, 10000, 5600, 0]
+    assert advices == ["SEQUENTIAL", "DONTNEED"]
+
+
+def test_unknown_algorithm(tmp_path):
+    file_path = Path2(tmp_path, "file.bin")
+    file_path.touch()
+    with pytest.raises(ValueError):
+        file_path.hash_content(algorithms=("foobar",))
+
+
+@pytest.fixture(scope="function")
+def files(tmp_path):
+    """
+    Create files with different sizes, returns a list of Path2 instances
+    """
+    files = []
+    for no in range(5):
+        file_path = Path2(tmp_path, "file%i.bin" % no)
+        file_path.write_bytes(CONTENT * (no + 1))
+        files.append(file_path)
+    return files
+
+
+def test_hash_many(files):
+    errors = []
+    results = dict(hashing.hash_many(files, algorithms=("sha1",), max_workers=2, onerror=errors.append))
+    assert errors == []
+    assert results == {
+        file_path: {"sha1": hashlib.sha1(file_path.read_bytes()).hexdigest()}
+        for file_path in files
+    }
+
+
+def test_hash_many_largest_first(files):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = list(hashing.hash_many(files, algorithms=("md5",), max_in_flight=1, executor=executor))
+    assert [file_path for file_path, digests in results] == list(reversed(files))
+
+
+def test_hash_many_dir_entry_paths(files):
+    tmp_path = files[0].parent
+    Path2(tmp_path, "sub_dir").mkdir()
+
+    entries = list(tmp_path.walk_parallel())
+    assert len(entries) == 6
+
+    results = list(hashing.hash_many(entries, algorithms=("md5",), max_workers=2))
+    assert len(results) == 5
+    for entry, digests in results:
+        assert isinstance(entry, DirEntryPath)
+        assert digests == {"md5": hashlib.md5(entry.path_instance.read_bytes()).hexdigest()}
+
+
+def test_hash_many_errors(files):
+    files[2].unlink()
+
+    errors = []
+    results = dict(hashing.hash_many(files, max_workers=2, onerror=errors.append))
+    assert len(results) == 4
+    assert len(errors) == 1
+    assert errors[0].startswith("Stat %r error:" % str(files[2]))
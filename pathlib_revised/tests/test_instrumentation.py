@@ -0,0 +1,178 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import mmap
+import os
+import sys
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import DirEntryPath, Path2, hashing, links, memory_map, walk
+from pathlib_revised.instrumentation import StatsSink, find_mount_point, instrument
+from pathlib_revised.pathlib import PosixPath2, WindowsPath2
+
+
+def test_instrument(tmp_path):
+    file_path = Path2(tmp_path, "file.txt")
+    file_path.touch()
+
+    with instrument() as stats:
+        assert isinstance(stats, StatsSink)
+        file_path.stat()
+        file_path.stat()
+        for dir_entry in Path2(tmp_path).scandir():
+            DirEntryPath.from_dir_entry(dir_entry).stat
+        with pytest.raises(FileNotFoundError):
+            Path2(tmp_path, "missing").stat()
+
+    result = stats.as_dict()
+    assert result["stat"]["count"] == 4
+    assert result["stat"]["errors"] == 1
+    assert result["scandir"]["count"] == 1
+    assert result["DirEntryPath.from_dir_entry"]["count"] == 1
+    assert result["DirEntryPath.__init__"]["count"] == 1
+    assert sum(result["stat"]["histogram"].values()) == 4
+
+    report = stats.report()
+    assert "stat" in report
+    assert "scandir" in report
+
+    # Not recorded after the context manager:
+    file_path.stat()
+    assert stats.as_dict()["stat"]["count"] == 4
+
+
+def test_unwrapped():
+    origin_stat = PosixPath2.stat
+    origin_init = DirEntryPath.__init__
+    with instrument():
+        assert PosixPath2.stat is not origin_stat
+        assert DirEntryPath.__init__ is not origin_init
+
+    assert "stat" not in PosixPath2.__dict__  # inherited from pathlib.Path
+    assert "stat" in WindowsPath2.__dict__  # own override
+    assert PosixPath2.stat is origin_stat
+    assert DirEntryPath.__init__ is origin_init
+    assert isinstance(DirEntryPath.__dict__["from_dir_entry"], classmethod)
+
+
+def test_callback_sink(tmp_path):
+    events = []
+    with instrument(events.append):
+        Path2(tmp_path, "dir").makedirs()
+        Path2(tmp_path, "dir").utime()
+
+    assert [(event.name, event.path, event.error) for event in events] == [
+        ("makedirs", Path2(tmp_path, "dir").path, None),
+        ("utime", Path2(tmp_path, "dir").path, None),
+    ]
+    assert all(event.duration >= 0 for event in events)
+
+
+def test_nested(tmp_path):
+    outer_events = []
+    inner_events = []
+    with instrument(outer_events.append):
+        Path2(tmp_path).lstat()
+        with instrument(inner_events.append):
+            Path2(tmp_path).lstat()
+        Path2(tmp_path).lstat()
+
+    assert len(outer_events) == 3
+    assert len(inner_events) == 1
+    assert "lstat" not in PosixPath2.__dict__
+
+
+def test_group_by_mount(tmp_path):
+    with instrument(StatsSink(group_by_mount=True)) as stats:
+        Path2(tmp_path).lstat()
+
+    mount_point = find_mount_point(str(tmp_path))
+    assert stats.as_dict()[mount_point]["lstat"]["count"] == 1
+    assert mount_point in stats.report()
+
+
+def test_group_by_mount_fd(tmp_path):
+    Path2(tmp_path, "file.txt").write_bytes(b"content")
+    with instrument(StatsSink(group_by_mount=True)) as stats:
+        with Path2(tmp_path, "file.txt").read_view() as view:
+            assert view == b"content"
+
+    result = stats.as_dict()
+    # The file descriptor based calls are not counted under a mount point:
+    assert result["<fd>"]["os.fstat"]["count"] == 1
+    assert result["<fd>"]["mmap.mmap"]["count"] == 1
+    mount_point = find_mount_point(str(tmp_path))
+    assert "os.fstat" not in result[mount_point]
+    assert result[mount_point]["builtins.open"]["count"] == 1
+
+
+def test_os_calls(tmp_path):
+    Path2(tmp_path, "dir").mkdir()
+    Path2(tmp_path, "dir", "file.txt").touch()
+    pairs = [(Path2(tmp_path, "dir", "file.txt"), Path2(tmp_path, "dir", "link.txt"))]
+
+    with instrument() as stats:
+        assert links.link_many(pairs) == []
+        if walk.fwalk_supported():
+            list(Path2(tmp_path).fwalk())
+
+    result = stats.as_dict()
+    assert result["os.link"]["count"] == 1
+    if walk.fwalk_supported():
+        assert result["os.open"]["count"] >= 2
+
+    # The modules use the os module again:
+    assert links.os is os
+    assert walk.os is os
+
+
+def test_builtin_open(tmp_path):
+    path = Path2(tmp_path, "file.txt")
+    path.write_bytes(b"content")
+
+    events = []
+    with instrument(events.append):
+        hashing.hash_file(path.path, algorithms=("md5",))
+        with memory_map.read_view(path.path) as view:
+            assert view == b"content"
+        with pytest.raises(FileNotFoundError):
+            hashing.hash_file(Path2(tmp_path, "missing").path)
+
+    open_events = [(event.path, type(event.error)) for event in events if event.name == "builtins.open"]
+    assert open_events == [
+        (path.path, type(None)),
+        (path.path, type(None)),
+        (Path2(tmp_path, "missing").path, FileNotFoundError),
+    ]
+    assert "mmap.mmap" in [event.name for event in events]
+
+    # The builtin is used again:
+    assert "open" not in vars(hashing)
+    assert memory_map.mmap is mmap
+
+
+def test_dir_entry_path_keyword(tmp_path):
+    events = []
+    with instrument(events.append):
+        DirEntryPath(path=Path2(tmp_path))
+    assert [(event.name, event.path) for event in events] == [
+        ("DirEntryPath.__init__", Path2(tmp_path).path),
+    ]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason='test requires FICLONE (Linux)')
+def test_reflink_ioctl(tmp_path):
+    src = Path2(tmp_path, "src.txt")
+    src.write_bytes(b"content")
+    with instrument() as stats:
+        src.copyfile(Path2(tmp_path, "dst.txt"), reflink=True)
+    # The FICLONE ioctl is counted, also if the file system doesn't support it:
+    assert stats.as_dict()["fcntl.ioctl"]["count"] == 1
+    assert Path2(tmp_path, "dst.txt").read_bytes() == b"content"
@@ -0,0 +1,68 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised import links
+
+
+@pytest.fixture(scope="function", params=[True, False], ids=["dir_fd", "path"])
+def dir_fd_supported(request, monkeypatch):
+    if request.param:
+        if not links.dir_fd_supported():
+            pytest.skip("dir_fd not supported")
+    else:
+        monkeypatch.setattr(links, "dir_fd_supported", lambda: False)
+    return request.param
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_link_many(tmp_path, dir_fd_supported, max_workers):
+    pairs = []
+    for dir_name in ("dir1", "dir2"):
+        src_dir = Path2(tmp_path, "src", dir_name)
+        src_dir.makedirs()
+        dst_dir = Path2(tmp_path, "dst", dir_name)
+        dst_dir.makedirs()
+        for no in range(3):
+            src = Path2(src_dir, "file%i.txt" % no)
+            src.write_text("%s %i" % (dir_name, no))
+            pairs.append((src, Path2(dst_dir, "link%i.txt" % no)))
+            pairs.append((src, Path2(src_dir, "link%i.txt" % no)))
+
+    failures = links.link_many(pairs, max_workers=max_workers)
+    assert failures == []
+
+    for src, dst in pairs:
+        assert dst.read_text() == src.read_text()
+        assert dst.stat().st_ino == src.stat().st_ino
+        assert src.stat().st_nlink == 3
+
+
+def test_link_many_failures(tmp_path, dir_fd_supported):
+    src = Path2(tmp_path, "source.txt")
+    src.write_text("content")
+    existing = Path2(tmp_path, "existing.txt")
+    existing.touch()
+    missing = Path2(tmp_path, "missing.txt")
+    missing_dir = Path2(tmp_path, "missing_dir")
+
+    failures = links.link_many([
+        (src, existing),
+        (missing, Path2(tmp_path, "link1.txt")),
+        (src, Path2(tmp_path, "link2.txt")),
+        (src, Path2(missing_dir, "link3.txt")),
+    ])
+    assert [(failure.source, failure.destination, type(failure.error)) for failure in failures] == [
+        (src, existing, FileExistsError),
+        (missing, Path2(tmp_path, "link1.txt"), FileNotFoundError),
+        (src, Path2(missing_dir, "link3.txt"), FileNotFoundError),
+    ]
+    assert Path2(tmp_path, "link2.txt").read_text() == "content"
@@ -0,0 +1,97 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import hashlib
+import mmap
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+
+IS_NT = os.name == 'nt'
+
+
+def test_read_view(tmp_path):
+    content = os.urandom(100 * 1024)
+    path = Path2(tmp_path, "file.bin")
+    path.write_bytes(content)
+
+    with path.read_view() as view:
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert len(view) == len(content)
+        assert view == content
+        assert hashlib.sha512(view).hexdigest() == hashlib.sha512(content).hexdigest()
+        with pytest.raises(TypeError):
+            view[0] = 0
+
+    # released at the end of the context:
+    with pytest.raises(ValueError):
+        len(view)
+
+
+def test_read_view_slices(tmp_path):
+    path = Path2(tmp_path, "file.txt")
+    path.write_bytes(b"0123456789")
+
+    with path.read_view() as view:
+        part = view[2:5]
+
+    # The slice is still usable, the mmap will be closed with it:
+    assert part.tobytes() == b"234"
+    part.release()
+
+
+def test_read_view_empty_file(tmp_path):
+    path = Path2(tmp_path, "empty")
+    path.touch()
+    with path.read_view() as view:
+        assert view.readonly
+        assert view == b""
+
+
+def test_read_view_no_mmap(tmp_path, monkeypatch):
+    path = Path2(tmp_path, "file.txt")
+    path.write_bytes(b"content")
+
+    def no_mmap(*args, **kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr(mmap, "mmap", no_mmap)
+    with path.read_view() as view:
+        assert view.readonly
+        assert view == b"content"
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_read_view_special_file(tmp_path):
+    fifo = Path2(tmp_path, "fifo")
+    os.mkfifo(fifo.path)
+    pid = os.fork()
+    if pid == 0:  # child: write into the pipe
+        try:
+            with open(fifo.path, "wb") as f:
+                f.write(b"from the pipe")
+        finally:
+            os._exit(0)
+
+    with fifo.read_view() as view:
+        assert view == b"from the pipe"
+    os.waitpid(pid, 0)
+
+
+def test_read_view_long_path(tmp_path):
+    path = Path2(tmp_path, *["a" * 50] * 6)
+    path.makedirs()
+    path = Path2(path, "file.txt")
+    path.write_bytes(b"content")
+    assert len(path.path) > 260
+    with path.read_view() as view:
+        assert view == b"content"
@@ -0,0 +1,106 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised.path_table import NO_PARENT, PathTable
+
+
+@pytest.fixture(scope="function")
+def table(tmp_path):
+    return PathTable([
+        Path2(tmp_path, "foo", "bar", "file1.txt"),
+        Path2(tmp_path, "foo", "bar", "file2.txt"),
+        Path2(tmp_path, "foo", "baz"),
+        Path2(tmp_path, "other.txt"),
+    ])
+
+
+def test_membership(table, tmp_path):
+    assert len(table) == 4
+    assert Path2(tmp_path, "foo", "bar", "file1.txt") in table
+    assert str(Path2(tmp_path, "foo", "baz")) in table
+
+    # Nodes of prefixes are not members:
+    assert Path2(tmp_path, "foo", "bar") not in table
+    assert Path2(tmp_path, "foo", "bar", "missing.txt") not in table
+    assert Path2(tmp_path, "missing") not in table
+
+    # Add a existing node as member:
+    table.add(Path2(tmp_path, "foo"))
+    table.add(Path2(tmp_path, "foo"))
+    assert Path2(tmp_path, "foo") in table
+    assert len(table) == 5
+
+    table.discard(Path2(tmp_path, "foo", "baz"))
+    table.discard(Path2(tmp_path, "foo", "baz"))
+    table.discard(Path2(tmp_path, "missing"))
+    assert Path2(tmp_path, "foo", "baz") not in table
+    assert len(table) == 4
+
+
+def test_iteration(table, tmp_path):
+    assert list(table) == [
+        Path2(tmp_path, "foo", "bar", "file1.txt"),
+        Path2(tmp_path, "foo", "bar", "file2.txt"),
+        Path2(tmp_path, "foo", "baz"),
+        Path2(tmp_path, "other.txt"),
+    ]
+
+    node_id = table.node_id(Path2(tmp_path, "foo", "baz"))
+    assert table.parts(node_id) == Path2(tmp_path, "foo", "baz").parts
+    assert table.path(node_id) == Path2(tmp_path, "foo", "baz")
+
+
+def test_subtree(table, tmp_path):
+    assert list(table.subtree(Path2(tmp_path, "foo", "bar"))) == [
+        Path2(tmp_path, "foo", "bar", "file1.txt"),
+        Path2(tmp_path, "foo", "bar", "file2.txt"),
+    ]
+    assert list(table.subtree(Path2(tmp_path, "foo", "baz"))) == [Path2(tmp_path, "foo", "baz")]
+    assert len(list(table.subtree(tmp_path))) == 4
+    assert list(table.subtree(Path2(tmp_path, "missing"))) == []
+
+    assert table.has_subtree(Path2(tmp_path, "foo"))
+    assert not table.has_subtree(Path2(tmp_path, "missing"))
+
+    # A node, that was added later:
+    table.add(Path2(tmp_path, "foo", "bar", "new.txt"))
+    assert len(list(table.subtree(Path2(tmp_path, "foo", "bar")))) == 3
+
+
+def test_add_child(tmp_path):
+    table = PathTable()
+    parent_id = NO_PARENT
+    for name in Path2(tmp_path).parts:
+        parent_id = table.add_child(parent_id, name)
+    assert len(table) == 0
+
+    node_id = table.add_child(parent_id, "file.txt")
+    assert table.add_child(parent_id, "file.txt") == node_id
+    table.add_node(node_id)
+    assert list(table) == [Path2(tmp_path, "file.txt")]
+
+
+def test_prefix_sharing(tmp_path):
+    table = PathTable()
+    for dir_no in range(10):
+        for file_no in range(100):
+            table.add(Path2(tmp_path, "dir%i" % dir_no, "file%i.txt" % file_no))
+    assert len(table) == 1000
+
+    # Only one node per prefix and the names are interned:
+    assert len(table._parents) == len(Path2(tmp_path).parts) + 10 + 1000
+    assert len(table._names) == len(set(Path2(tmp_path).parts)) + 10 + 100
+
+
+def test_empty_path():
+    with pytest.raises(ValueError):
+        PathTable().add("")
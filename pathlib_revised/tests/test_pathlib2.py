@@ -137,6 +137,26 @@ def test_rglob(deep_path):
     assert f.extended_path == file_path.extended_path
 
 
+def test_child(deep_path):
+    child = deep_path.child("a test file.txt")
+    assert child == Path2(deep_path, "a test file.txt")
+    assert child.path == Path2(deep_path, "a test file.txt").path
+    assert child.extended_path == Path2(deep_path, "a test file.txt").extended_path
+    assert type(child) is type(deep_path)
+    assert child.parent == deep_path
+
+
+def test_from_strings(deep_path):
+    paths = [
+        "foo/bar/file1.txt", "foo/bar/file2.txt", "foo//bar/./file3.txt", "file.txt",
+        "foo/bar/", "foo/..", "/", ".", "",
+        os.path.join(deep_path.path, "file.txt"),
+    ]
+    result = Path2.from_strings(paths)
+    assert [path.path for path in result] == [Path2(path).path for path in paths]
+    assert result[0] == Path2("foo", "bar", "file1.txt")
+
+
 @unittest.skipUnless(IS_NT, 'test requires a Windows-compatible system')
 class TestWindowsPath2(unittest.TestCase):
     def test_instances(self):
@@ -0,0 +1,168 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised import remove
+
+IS_NT = os.name == 'nt'
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    top = Path2(tmp_path, "top")
+    for dir_name in ("one", "two", "three"):
+        Path2(top, dir_name, "a", "deep").makedirs()
+        for file_no in range(5):
+            Path2(top, dir_name, "a", "file%i.txt" % file_no).write_text("content")
+            Path2(top, dir_name, "a", "file%i.txt" % file_no).link(Path2(top, dir_name, "link%i.txt" % file_no))
+    Path2(top, "empty").mkdir()
+    return top
+
+
+@pytest.fixture(params=[True, False], ids=["dir_fd", "path"])
+def dir_fd(request, monkeypatch):
+    if request.param:
+        if not remove.dir_fd_supported():
+            pytest.skip("dir_fd not supported")
+    else:
+        monkeypatch.setattr(remove, "dir_fd_supported", lambda: False)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_rmtree(tree_path, dir_fd, max_workers):
+    assert tree_path.rmtree(max_workers=max_workers) == []
+    assert not tree_path.exists()
+    assert tree_path.parent.exists()
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_rmtree_symlinks(tree_path, tmp_path, dir_fd):
+    outside = Path2(tmp_path, "outside")
+    Path2(outside, "sub_dir").makedirs()
+    Path2(outside, "file.txt").touch()
+    Path2(tree_path, "one", "dir_link").symlink_to(outside)
+    Path2(tree_path, "one", "file_link").symlink_to(Path2(outside, "file.txt"))
+    Path2(tree_path, "one", "broken_link").symlink_to(Path2(outside, "missing"))
+
+    assert tree_path.rmtree() == []
+    assert not tree_path.exists()
+
+    # The symlinks are not followed:
+    assert Path2(outside, "sub_dir").is_dir()
+    assert Path2(outside, "file.txt").is_file()
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_rmtree_top_symlink(tree_path, tmp_path):
+    link = Path2(tmp_path, "link")
+    link.symlink_to(tree_path)
+    with pytest.raises(OSError):
+        link.rmtree()
+    assert tree_path.is_dir()
+
+
+def test_rmtree_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Path2(tmp_path, "missing").rmtree()
+
+
+def test_rmtree_errors(tree_path, dir_fd, monkeypatch):
+    error_path = Path2(tree_path, "two", "a", "file3.txt")
+    origin_unlink = os.unlink
+
+    def unlink(path, *args, dir_fd=None):
+        if dir_fd is None:
+            is_error_path = path == error_path.extended_path
+        else:
+            is_error_path = path == error_path.name and os.path.samestat(
+                os.fstat(dir_fd), error_path.parent.stat()
+            )
+        if is_error_path:
+            raise PermissionError("Permission denied")
+        return origin_unlink(path, *args, dir_fd=dir_fd)
+
+    monkeypatch.setattr(os, "unlink", unlink)
+
+    errors = tree_path.rmtree()
+    assert [(error.path, type(error.error)) for error in errors] == [
+        (error_path, PermissionError),
+        (Path2(tree_path, "two", "a"), OSError),
+        (Path2(tree_path, "two"), OSError),
+        (tree_path, OSError),
+    ]
+    monkeypatch.undo()
+    assert sorted(path.path for path in tree_path.rglob("*")) == [
+        Path2(tree_path, "two").path,
+        Path2(tree_path, "two", "a").path,
+        error_path.path,
+    ]
+
+
+@pytest.mark.parametrize("replacement", ["symlink", "directory"])
+def test_rmtree_dir_fd_swapped_dir(tree_path, tmp_path, monkeypatch, replacement):
+    if not remove.dir_fd_supported():
+        pytest.skip("dir_fd not supported")
+
+    outside = Path2(tmp_path, "outside")
+    outside.mkdir()
+    Path2(outside, "victim.txt").write_text("keep me")
+    swapped = Path2(tree_path, "two", "a")
+    origin_open = os.open
+
+    def open_and_swap(path, flags, *args, dir_fd=None, **kwargs):
+        is_two = dir_fd is not None and os.path.samestat(os.fstat(dir_fd), Path2(tree_path, "two").stat())
+        if is_two and path == "a":
+            # Replace the scanned directory, before it's opened:
+            swapped.rename(Path2(tmp_path, "moved"))
+            if replacement == "symlink":
+                swapped.symlink_to(outside)
+            else:
+                outside.rename(swapped)
+        return origin_open(path, flags, *args, dir_fd=dir_fd, **kwargs)
+
+    monkeypatch.setattr(os, "open", open_and_swap)
+    errors = tree_path.rmtree()
+    monkeypatch.undo()
+
+    assert Path2(tree_path, "two", "a") in [error.path for error in errors]
+    if replacement == "symlink":
+        assert Path2(outside, "victim.txt").read_text() == "keep me"
+    else:
+        assert Path2(swapped, "victim.txt").read_text() == "keep me"
+    # The other directories are removed:
+    assert not Path2(tree_path, "one").exists()
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_rmtree_fd_limit(tmp_path):
+    if not remove.dir_fd_supported():
+        pytest.skip("dir_fd not supported")
+    resource = pytest.importorskip("resource")
+
+    top = Path2(tmp_path, "top")
+    for chain_no in range(50):
+        path = Path2(top, "chain%i" % chain_no, *["d"] * 30)
+        path.makedirs()
+        Path2(path, "file.txt").touch()
+
+    soft_limit, hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (128, hard_limit))
+    try:
+        errors = top.rmtree(max_workers=16)
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft_limit, hard_limit))
+    assert errors == []
+    assert not top.exists()
+
+    with pytest.raises(ValueError):
+        Path2(tmp_path).rmtree(max_open_fds=1)
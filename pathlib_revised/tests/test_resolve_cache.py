@@ -0,0 +1,157 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import DirEntryPath, Path2
+from pathlib_revised.resolve_cache import ResolveCache, get_process_cache
+
+IS_NT = os.name == 'nt'
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    """
+    A tree with symlinks, created in a symlinked directory
+    """
+    real_path = Path2(tmp_path, "real")
+    Path2(real_path, "dir", "sub_dir").makedirs()
+    Path2(real_path, "dir", "file.txt").touch()
+    Path2(real_path, "dir", "sub_dir", "file.txt").touch()
+    if not IS_NT:
+        Path2(real_path, "dir", "file_link").symlink_to("file.txt")
+        Path2(real_path, "dir", "dir_link").symlink_to(Path2(real_path, "dir", "sub_dir"))
+        Path2(real_path, "dir", "broken_link").symlink_to("missing")
+
+        link_path = Path2(tmp_path, "link")
+        link_path.symlink_to(real_path)
+        return link_path
+    return real_path
+
+
+def test_walk_resolve(tree_path):
+    resolve_cache = ResolveCache()
+
+    count = 0
+    for entry in tree_path.walk_parallel(resolve_cache=resolve_cache):
+        assert entry.resolved_path == entry.path_instance.resolve()
+        assert entry.different_path == (entry.path_instance.path != entry.path_instance.resolve().path)
+        count += 1
+    assert count == (7 if not IS_NT else 4)
+
+    # Only the directories and symlinks are stored:
+    assert len(resolve_cache) == (6 if not IS_NT else 2)
+
+    # Only the top directory and the symlinks are really resolved,
+    # all other entries use the cached result of their parent directory:
+    assert resolve_cache.misses == (4 if not IS_NT else 2)
+
+
+def test_resolve(tree_path):
+    resolve_cache = ResolveCache()
+    for path in (
+        tree_path,
+        Path2(tree_path, "dir"),
+        Path2(tree_path, "dir", "file.txt"),
+        Path2(tree_path, "dir", "sub_dir", "file.txt"),
+        Path2(tree_path, "dir", "missing.txt"),
+        Path2(tree_path.anchor),
+    ):
+        assert resolve_cache.resolve(path) == path.resolve()
+        assert resolve_cache.resolve(path) == path.resolve()
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_symlinks(tree_path):
+    resolve_cache = ResolveCache()
+    for name in ("file_link", "dir_link", "broken_link"):
+        path = Path2(tree_path, "dir", name)
+        assert resolve_cache.resolve(path) == path.resolve()
+        assert resolve_cache.resolve(path, is_symlink=True) == path.resolve()
+
+    # path via a symlinked directory:
+    path = Path2(tree_path, "dir", "dir_link", "file.txt")
+    assert resolve_cache.resolve(path) == Path2(tree_path.resolve(), "dir", "sub_dir", "file.txt")
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_parent_of_symlinks(tree_path):
+    resolve_cache = ResolveCache()
+    for path in (
+        Path2(tree_path, ".."),
+        Path2(tree_path, "dir", "dir_link", ".."),
+        Path2(tree_path, "dir", "dir_link", "file.txt", ".."),
+        Path2(tree_path, "dir", "dir_link", "..", "file.txt"),
+        Path2(tree_path, "dir", "dir_link", "..", ".."),
+        Path2(tree_path.anchor, ".."),
+    ):
+        assert resolve_cache.resolve(path) == path.resolve()
+        assert resolve_cache.resolve(path) == path.resolve()
+
+    # link/.. and link/sub/.. are the parent of the symlink destination:
+    assert resolve_cache.resolve(Path2(tree_path, "..")) == tree_path.resolve().parent
+    assert resolve_cache.resolve(Path2(tree_path, "dir", "..")) == tree_path.resolve()
+
+
+def test_max_size(tree_path):
+    resolve_cache = ResolveCache(max_size=2)
+    for path in Path2(tree_path, "dir").rglob("*"):
+        resolve_cache.resolve(path)
+        assert len(resolve_cache) <= 2
+
+
+def test_invalidate(tree_path):
+    resolve_cache = ResolveCache()
+    dir_path = Path2(tree_path, "dir")
+    resolve_cache.resolve(dir_path, is_dir=True)
+    resolve_cache.resolve(Path2(dir_path, "sub_dir"), is_dir=True)
+    resolve_cache.resolve(Path2(dir_path, "sub_dir", "file.txt"), is_dir=False)
+    assert len(resolve_cache) == 3  # tree_path, dir and sub_dir
+
+    resolve_cache.invalidate(Path2(dir_path, "sub_dir"))
+    assert len(resolve_cache) == 2
+
+    resolve_cache.invalidate(tree_path)
+    assert len(resolve_cache) == 0
+
+    resolve_cache.resolve(dir_path, is_dir=True)
+    resolve_cache.invalidate()
+    assert len(resolve_cache) == 0
+
+
+def test_dir_entry_path(tree_path):
+    resolve_cache = get_process_cache()
+    assert get_process_cache() is resolve_cache
+
+    file_path = Path2(tree_path, "dir", "file.txt")
+    dir_entry_path = DirEntryPath(file_path, resolve_cache=resolve_cache)
+    assert dir_entry_path.resolved_path == file_path.resolve()
+    assert dir_entry_path.different_path is not IS_NT
+    resolve_cache.invalidate()
+
+
+def test_relative_paths(tmp_path, monkeypatch):
+    for name in ("one", "two"):
+        Path2(tmp_path, name, "sub").makedirs()
+        Path2(tmp_path, name, "sub", "file.txt").touch()
+
+    resolve_cache = ResolveCache()
+    monkeypatch.chdir(Path2(tmp_path, "one").path)
+    assert resolve_cache.resolve("sub/file.txt") == Path2(tmp_path, "one", "sub", "file.txt").resolve()
+
+    # The cached entries are not used after the working directory changed:
+    monkeypatch.chdir(Path2(tmp_path, "two").path)
+    assert resolve_cache.resolve("sub/file.txt") == Path2(tmp_path, "two", "sub", "file.txt").resolve()
+    dir_entry_path = DirEntryPath(Path2("sub", "file.txt"), resolve_cache=resolve_cache)
+    assert dir_entry_path.resolved_path == Path2(tmp_path, "two", "sub", "file.txt").resolve()
+
+    resolve_cache.invalidate("sub")
+    assert all(not key.startswith(Path2(tmp_path, "two", "sub").path) for key in resolve_cache._cache)
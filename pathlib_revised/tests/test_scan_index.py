@@ -0,0 +1,78 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised.scan_index import ScanIndex, stat_signature
+
+
+def test_stat_signature(tmp_path):
+    file_path = Path2(tmp_path, "file.txt")
+    file_path.touch()
+    stat = file_path.stat()
+    assert stat_signature(stat) == (stat.st_dev, stat.st_ino, 0, stat.st_mtime_ns)
+
+
+def test_get_set(tmp_path):
+    file_path = Path2(tmp_path, "file.txt")
+    file_path.write_text("content")
+    db_path = Path2(tmp_path, "index.sqlite3")
+
+    with ScanIndex(db_path) as index:
+        assert len(index) == 0
+        assert index.get(file_path, file_path.stat()) is None
+
+        index.set(file_path, file_path.stat(), {"hash": "abc"})
+        assert file_path in index
+        assert index.get(file_path, file_path.stat()) == {"hash": "abc"}
+
+    # persistent:
+    with ScanIndex(db_path) as index:
+        assert len(index) == 1
+        assert index.get(file_path, file_path.stat()) == {"hash": "abc"}
+
+        # changed mtime -> values are outdated:
+        file_path.utime(ns=(0, 1))
+        assert index.get(file_path, file_path.stat()) is None
+
+        index.discard(file_path)
+        assert file_path not in index
+        assert len(index) == 0
+
+
+def test_lookup(tmp_path):
+    tree_path = Path2(tmp_path, "tree")
+    Path2(tree_path, "sub_dir").makedirs()
+    unchanged = Path2(tree_path, "sub_dir", "unchanged.txt")
+    unchanged.write_text("unchanged")
+    changed = Path2(tree_path, "changed.txt")
+    changed.write_text("changed")
+
+    with ScanIndex(Path2(tmp_path, "index.sqlite3")) as index:
+        index.set(unchanged, unchanged.stat(), {"hash": "unchanged"})
+        index.set(changed, changed.stat(), {"hash": "changed"})
+
+        changed.write_text("changed content")
+
+        result = {entry.path: data for entry, data in index.lookup(tree_path.walk_parallel())}
+        assert result == {unchanged.path: {"hash": "unchanged"}, changed.path: None}
+
+
+def test_remove_missing(tmp_path):
+    file_path = Path2(tmp_path, "file.txt")
+    file_path.touch()
+    with ScanIndex(os.path.join(str(tmp_path), "index.sqlite3"), commit_every=1) as index:
+        index.set(file_path, file_path.stat(), None)
+        index.set(Path2(tmp_path, "removed.txt"), file_path.stat(), None)
+        assert len(index) == 2
+
+        assert index.remove_missing() == 1
+        assert len(index) == 1
+        assert file_path in index
@@ -0,0 +1,121 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import Path2
+from pathlib_revised.tree_snapshot import TreeSnapshot
+
+IS_NT = os.name == 'nt'
+
+
+def rel(*parts):
+    return os.sep.join(parts)
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    top = Path2(tmp_path, "tree")
+    for dir_name in ("one", "two"):
+        Path2(top, dir_name, "sub").makedirs()
+        Path2(top, dir_name, "file.txt").write_text("content")
+        Path2(top, dir_name, "sub", "file.txt").write_text("sub content")
+    Path2(top, "root.txt").write_text("root")
+    return top
+
+
+def test_capture(tree_path):
+    snapshot = TreeSnapshot.capture(tree_path, max_workers=2)
+    assert len(snapshot) == 9
+
+    paths = dict(snapshot.iter_relative_paths())
+    assert sorted(paths.values()) == sorted([
+        "one", rel("one", "sub"), rel("one", "file.txt"), rel("one", "sub", "file.txt"),
+        "two", rel("two", "sub"), rel("two", "file.txt"), rel("two", "sub", "file.txt"),
+        "root.txt",
+    ])
+    for index, path in paths.items():
+        assert snapshot.relative_path(index) == path
+        # A directory is stored before its content:
+        assert snapshot.parent[index] < index
+
+        st = Path2(tree_path, path).lstat()
+        assert snapshot.size[index] == st.st_size
+        assert snapshot.mode[index] == st.st_mode
+        assert snapshot.mtime_ns[index] == st.st_mtime_ns
+
+    # The names are interned:
+    assert sorted(snapshot.names) == ["file.txt", "one", "root.txt", "sub", "two"]
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_load(tree_path, tmp_path, use_mmap):
+    snapshot = TreeSnapshot.capture(tree_path)
+    snapshot_path = Path2(tmp_path, "snapshot.bin")
+    snapshot.save(snapshot_path)
+
+    with TreeSnapshot.load(snapshot_path, use_mmap=use_mmap) as loaded:
+        assert loaded.root == tree_path
+        assert loaded.names == snapshot.names
+        assert list(loaded.iter_relative_paths()) == list(snapshot.iter_relative_paths())
+        for column in ("parent", "name", "mode", "size", "mtime_ns", "inode", "dev"):
+            assert list(getattr(loaded, column)) == list(getattr(snapshot, column))
+
+        assert loaded.diff(snapshot) == ([], [], [], [])
+
+
+def test_load_error(tmp_path):
+    path = Path2(tmp_path, "foo.bin")
+    path.write_bytes(b"X" * 100)
+    with pytest.raises(ValueError):
+        TreeSnapshot.load(path)
+
+
+def test_empty(tmp_path):
+    snapshot = TreeSnapshot.capture(tmp_path)
+    assert len(snapshot) == 0
+    snapshot.save(Path2(tmp_path, "snapshot.bin"))
+    with TreeSnapshot.load(Path2(tmp_path, "snapshot.bin")) as loaded:
+        assert len(loaded) == 0
+        assert loaded.names == []
+
+
+def test_diff(tree_path):
+    old = TreeSnapshot.capture(tree_path)
+
+    Path2(tree_path, "new.txt").write_text("new")
+    Path2(tree_path, "one", "sub", "file.txt").unlink()
+    Path2(tree_path, "root.txt").write_text("modified")
+    Path2(tree_path, "one", "file.txt").rename(Path2(tree_path, "moved.txt"))
+
+    new = TreeSnapshot.capture(tree_path)
+    diff = old.diff(new)
+    assert diff.added == ["new.txt"]
+    assert diff.removed == [rel("one", "sub", "file.txt")]
+    assert diff.modified == ["root.txt"]
+    if IS_NT:
+        assert diff.moved == []
+    else:
+        assert diff.moved == [(rel("one", "file.txt"), "moved.txt")]
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires st_ino')
+def test_diff_moved_directory(tree_path):
+    old = TreeSnapshot.capture(tree_path)
+
+    Path2(tree_path, "two").rename(Path2(tree_path, "three"))
+    Path2(tree_path, "three", "sub", "file.txt").write_text("modified content")
+
+    diff = old.diff(TreeSnapshot.capture(tree_path))
+    assert diff.added == []
+    assert diff.removed == []
+    assert diff.moved == [("two", "three")]  # the content is not reported as moved
+    assert diff.modified == [rel("two", "sub", "file.txt")]
@@ -0,0 +1,226 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+
+import pytest
+
+# pathlib_revised
+from pathlib_revised import DirEntryPath, Path2
+from pathlib_revised import walk
+from pathlib_revised.pathlib import PosixPath2
+
+IS_NT = os.name == 'nt'
+
+
+@pytest.fixture(scope="function")
+def tree_path(tmp_path):
+    """
+    Create a small directory tree, returns: (Path2 instance, set of all paths)
+    """
+    paths = set()
+    for dir_name in ("one", "two", "three"):
+        for sub_dir_name in ("a", "b"):
+            sub_dir = Path2(tmp_path, dir_name, sub_dir_name)
+            sub_dir.makedirs()
+            paths.add(sub_dir.parent.path)
+            paths.add(sub_dir.path)
+            for file_no in range(3):
+                file_path = Path2(sub_dir, "file%i.txt" % file_no)
+                file_path.write_text("content %i" % file_no)
+                paths.add(file_path.path)
+
+    empty_dir = Path2(tmp_path, "empty")
+    empty_dir.mkdir()
+    paths.add(empty_dir.path)
+
+    return Path2(tmp_path), paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_walk_parallel_topdown(tree_path, max_workers):
+    top, ref_paths = tree_path
+
+    entries = list(top.walk_parallel(max_workers=max_workers))
+    assert all(isinstance(entry, DirEntryPath) for entry in entries)
+
+    paths = [entry.path for entry in entries]
+    assert len(paths) == len(ref_paths)
+    assert set(paths) == ref_paths
+
+    # A directory is yielded before its content:
+    for no, path in enumerate(paths):
+        parent = Path2(path).parent.path
+        if parent != top.path:
+            assert paths.index(parent) < no
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_walk_parallel_bottomup(tree_path, max_workers):
+    top, ref_paths = tree_path
+
+    paths = [entry.path for entry in top.walk_parallel(max_workers=max_workers, topdown=False)]
+    assert len(paths) == len(ref_paths)
+    assert set(paths) == ref_paths
+
+    # A directory is yielded after its content:
+    for no, path in enumerate(paths):
+        parent = Path2(path).parent.path
+        if parent != top.path:
+            assert paths.index(parent) > no
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_walk_parallel_symlink(tmp_path):
+    Path2(tmp_path, "dir", "sub_dir").makedirs()
+    Path2(tmp_path, "link").symlink_to(Path2(tmp_path, "dir"))
+
+    paths = sorted(entry.path for entry in Path2(tmp_path).walk_parallel())
+    assert paths == [
+        Path2(tmp_path, "dir").path,
+        Path2(tmp_path, "dir", "sub_dir").path,
+        Path2(tmp_path, "link").path,  # yielded, but not followed
+    ]
+
+
+@pytest.mark.skipif(IS_NT, reason='test requires a POSIX-compatible system')
+def test_walk_parallel_onerror(tree_path, monkeypatch):
+    top, ref_paths = tree_path
+    error_path = Path2(top, "two")
+
+    origin_scandir = PosixPath2.scandir
+
+    def scandir(path):
+        if path == error_path:
+            raise PermissionError("Permission denied")
+        return origin_scandir(path)
+
+    monkeypatch.setattr(PosixPath2, "scandir", scandir)
+
+    errors = []
+    paths = {entry.path for entry in top.walk_parallel(onerror=errors.append)}
+    assert errors == ["Scandir %r error: Permission denied" % error_path.path]
+    assert paths == {path for path in ref_paths if not path.startswith(error_path.path + os.sep)}
+
+
+def test_walk_parallel_stop_early(tree_path):
+    top, ref_paths = tree_path
+
+    walker = top.walk_parallel(max_workers=2, max_queue=1)
+    entry = next(walker)
+    assert entry.path in ref_paths
+    walker.close()
+
+
+def fwalk_result(walker):
+    return sorted(
+        (dirpath.path, sorted(dirnames), sorted(filenames))
+        for dirpath, dirnames, filenames, dir_fd in walker
+    )
+
+
+def os_walk_result(top):
+    return sorted(
+        (dirpath, sorted(dirnames), sorted(filenames))
+        for dirpath, dirnames, filenames in os.walk(top)
+    )
+
+
+fwalk_supported = pytest.mark.skipif(not walk.fwalk_supported(), reason='fwalk() not supported')
+
+
+@fwalk_supported
+@pytest.mark.parametrize("topdown", [True, False])
+@pytest.mark.parametrize("max_open_fds", [2, 64])
+def test_fwalk(tree_path, topdown, max_open_fds):
+    top, ref_paths = tree_path
+    Path2(top, "one", "a", "deep", "deeper", "deepest").makedirs()
+
+    result = fwalk_result(top.fwalk(topdown=topdown, max_open_fds=max_open_fds))
+    assert result == os_walk_result(top.path)
+
+    dirpaths = [dirpath.path for dirpath, dirnames, filenames, dir_fd in top.fwalk(topdown=topdown)]
+    if topdown:
+        assert dirpaths[0] == top.path
+    else:
+        assert dirpaths[-1] == top.path
+
+
+@fwalk_supported
+def test_fwalk_dir_fd(tree_path):
+    top, ref_paths = tree_path
+    sizes = {}
+    for dirpath, dirnames, filenames, dir_fd in top.fwalk(max_open_fds=2):
+        for filename in filenames:
+            sizes[Path2(dirpath, filename).path] = os.stat(filename, dir_fd=dir_fd, follow_symlinks=False).st_size
+    assert sizes == {path: os.stat(path).st_size for path in ref_paths if os.path.isfile(path)}
+
+
+@fwalk_supported
+def test_fwalk_open_fds(tmp_path):
+    fd_path = "/proc/self/fd"
+    if not os.path.isdir(fd_path):
+        pytest.skip("%s not available" % fd_path)
+
+    Path2(tmp_path, *["sub_dir%i" % no for no in range(10)]).makedirs()
+
+    start_fds = len(os.listdir(fd_path))
+    max_fds = 0
+    for dirpath, dirnames, filenames, dir_fd in Path2(tmp_path).fwalk(max_open_fds=3):
+        max_fds = max(max_fds, len(os.listdir(fd_path)) - start_fds)
+    assert max_fds == 3
+    assert len(os.listdir(fd_path)) == start_fds
+
+
+@fwalk_supported
+def test_fwalk_prune(tree_path):
+    top, ref_paths = tree_path
+    dirpaths = []
+    for dirpath, dirnames, filenames, dir_fd in top.fwalk():
+        dirpaths.append(dirpath.path)
+        if "two" in dirnames:
+            dirnames.remove("two")
+    assert len(dirpaths) == 8
+    assert Path2(top, "two").path not in dirpaths
+    assert Path2(top, "two", "a").path not in dirpaths
+
+
+@fwalk_supported
+def test_fwalk_symlink(tmp_path):
+    Path2(tmp_path, "dir", "sub_dir").makedirs()
+    Path2(tmp_path, "link").symlink_to(Path2(tmp_path, "dir"))
+
+    assert fwalk_result(Path2(tmp_path).fwalk()) == [
+        (str(tmp_path), ["dir", "link"], []),
+        (Path2(tmp_path, "dir").path, ["sub_dir"], []),
+        (Path2(tmp_path, "dir", "sub_dir").path, [], []),
+    ]
+
+
+@fwalk_supported
+def test_fwalk_replaced_directory(tmp_path):
+    """
+    A closed directory fd will be reopened and it's checked that it's still the same directory.
+    """
+    top = Path2(tmp_path, "top")
+    Path2(top, "a", "deep").makedirs()
+    Path2(top, "b").makedirs()
+
+    errors = []
+    dirpaths = []
+    for dirpath, dirnames, filenames, dir_fd in top.fwalk(max_open_fds=2, onerror=errors.append):
+        dirpaths.append(dirpath.path)
+        if dirpath == top:
+            dirnames.sort()  # visit "a" before "b"
+        elif dirpath == Path2(top, "a", "deep"):
+            # The fd of "top" was closed to open "deep": replace "top"
+            top.rename(Path2(tmp_path, "old_top"))
+            Path2(top, "b").makedirs()
+
+    assert dirpaths == [top.path, Path2(top, "a").path, Path2(top, "a", "deep").path]
+    assert errors == ["Reopen %r error: directory was replaced during the walk" % top.path]
@@ -0,0 +1,357 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Compact snapshots of directory trees and fast diffs between them.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import array
+import collections
+import mmap
+import os
+import stat
+import struct
+import sys
+
+# pathlib_revised
+from pathlib_revised.pathlib import Path2
+from pathlib_revised.walk import SCANNED, _TreeScheduler
+
+MAGIC = b"PRSNAP01"
+
+# The header: magic, little endian flag, entry count, name count, name data size, root path size
+HEADER = struct.Struct("<8sBQQQQ")
+
+# The columns: (attribute name, array typecode)
+COLUMNS = (
+    ("parent", "q"),  # index of the parent directory entry, -1 for entries in the root directory
+    ("name", "I"),  # index in the interned names
+    ("mode", "I"),
+    ("size", "q"),
+    ("mtime_ns", "q"),
+    ("inode", "Q"),
+    ("dev", "Q"),
+)
+
+SnapshotDiff = collections.namedtuple("SnapshotDiff", ("added", "removed", "modified", "moved"))
+
+
+def _padding(size):
+    return -size % 8
+
+
+class TreeSnapshot:
+    """
+    The stat information of all entries of a directory tree, stored in columns.
+
+    Every entry is a row in the column arrays, the names are interned.
+    A directory is stored before its content, so the parent index is always
+    lower than the index of the entry.
+
+    Use TreeSnapshot.capture() to create a snapshot of a directory tree,
+    save() and load() to store it in a compact binary file and diff() to
+    compare two snapshots.
+    """
+
+    def __init__(self, root, names, columns, mmap_instance=None):
+        self.root = Path2(root)
+        self.names = names
+        for attr_name, typecode in COLUMNS:
+            setattr(self, attr_name, columns[attr_name])
+        self._mmap = mmap_instance
+
+    @classmethod
+    def capture(cls, top, max_workers=None, onerror=print):
+        """
+        Walk the directory tree 'top' with a thread pool and create a snapshot of it.
+
+        The stat information is from lstat, so symlinks are stored, but not followed.
+        Errors are reported via onerror(message) in the calling thread.
+        """
+        top = Path2(top)
+        names = []
+        name_ids = {}
+        columns = {attr_name: array.array(typecode) for attr_name, typecode in COLUMNS}
+        append_parent = columns["parent"].append
+        append_name = columns["name"].append
+        append_mode = columns["mode"].append
+        append_size = columns["size"].append
+        append_mtime_ns = columns["mtime_ns"].append
+        append_inode = columns["inode"].append
+        append_dev = columns["dev"].append
+
+        def scan_func(node):
+            # A node is a list of: [path, index of the directory entry]
+            rows = []
+            errors = []
+            children = []
+            try:
+                with os.scandir(node[0]) as scandir_it:
+                    for dir_entry in scandir_it:
+                        try:
+                            st = dir_entry.stat(follow_symlinks=False)
+                        except OSError as err:
+                            errors.append("Stat %r error: %s" % (dir_entry.path, err))
+                            continue
+                        child = None
+                        if stat.S_ISDIR(st.st_mode):
+                            child = [dir_entry.path, None]
+                            children.append(child)
+                        rows.append((dir_entry.name, st, child))
+            except OSError as err:
+                errors.append("Scandir %r error: %s" % (node[0], err))
+            return (rows, errors), children
+
+        scheduler = _TreeScheduler(scan_func, max_workers=max_workers)
+        for event, node, result in scheduler.run([top.extended_path, -1]):
+            if event != SCANNED:
+                continue
+
+            rows, errors = result
+            for error in errors:
+                onerror(error)
+
+            parent = node[1]
+            for name, st, child in rows:
+                try:
+                    name_id = name_ids[name]
+                except KeyError:
+                    name_id = name_ids[name] = len(names)
+                    names.append(name)
+
+                if child is not None:
+                    # Set the index before the sub directory will be scanned
+                    child[1] = len(columns["parent"])
+
+                append_parent(parent)
+                append_name(name_id)
+                append_mode(st.st_mode)
+                append_size(st.st_size)
+                append_mtime_ns(st.st_mtime_ns)
+                append_inode(st.st_ino)
+                append_dev(st.st_dev)
+
+        return cls(top, names, columns)
+
+    def __len__(self):
+        return len(self.parent)
+
+    def relative_path(self, index):
+        """
+        Returns the path of the entry relative to the root as string.
+        """
+        parts = []
+        while index >= 0:
+            parts.append(self.names[self.name[index]])
+            index = self.parent[index]
+        return os.sep.join(reversed(parts))
+
+    def iter_relative_paths(self):
+        """
+        Yields (index, relative path) for all entries.
+        """
+        dir_paths = {}
+        for index in range(len(self)):
+            parent = self.parent[index]
+            name = self.names[self.name[index]]
+            path = name if parent < 0 else dir_paths[parent] + os.sep + name
+            if stat.S_ISDIR(self.mode[index]):
+                dir_paths[index] = path
+            yield index, path
+
+    def save(self, path):
+        """
+        Save the snapshot into a binary file.
+
+        All columns are stored as raw arrays, aligned to 8 bytes,
+        so that load() can use them directly from a memory map.
+        """
+        names_data = b"\0".join(os.fsencode(name) for name in self.names)
+        root_data = os.fsencode(self.root.path)
+        with open(Path2(path).extended_path, "wb") as f:
+            f.write(HEADER.pack(
+                MAGIC, sys.byteorder == "little", len(self), len(self.names), len(names_data), len(root_data)
+            ))
+            f.write(root_data)
+            f.write(b"\0" * _padding(HEADER.size + len(root_data)))
+            for attr_name, typecode in COLUMNS:
+                data = getattr(self, attr_name)
+                if not isinstance(data, array.array):
+                    data = array.array(typecode, data)
+                data = data.tobytes()
+                f.write(data)
+                f.write(b"\0" * _padding(len(data)))
+            f.write(names_data)
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        Load a snapshot saved by save()
+
+        With use_mmap=True the columns are memoryviews of a memory map
+        of the file, so only the names are read into memory.
+        Call close() to release the memory map.
+        """
+        with open(Path2(path).extended_path, "rb") as f:
+            if use_mmap:
+                mmap_instance = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                data = memoryview(mmap_instance)
+            else:
+                mmap_instance = None
+                data = memoryview(f.read())
+
+        magic, little_endian, count, names_count, names_size, root_size = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            data.release()
+            if mmap_instance is not None:
+                mmap_instance.close()
+            raise ValueError("%r is not a tree snapshot file" % str(path))
+
+        offset = HEADER.size
+        root = os.fsdecode(bytes(data[offset:offset + root_size]))
+        offset += root_size + _padding(HEADER.size + root_size)
+
+        native = bool(little_endian) == (sys.byteorder == "little")
+        columns = {}
+        for attr_name, typecode in COLUMNS:
+            size = count * array.array(typecode).itemsize
+            column = data[offset:offset + size]
+            if native:
+                columns[attr_name] = column.cast(typecode)
+            else:
+                column = array.array(typecode, bytes(column))
+                column.byteswap()
+                columns[attr_name] = column
+            offset += size + _padding(size)
+
+        names_data = bytes(data[offset:offset + names_size])
+        names = [os.fsdecode(name) for name in names_data.split(b"\0")] if names_count else []
+
+        if mmap_instance is None:
+            return cls(root, names, columns)
+
+        snapshot = cls(root, names, columns, mmap_instance)
+        snapshot._views = [data] + [column for column in columns.values() if isinstance(column, memoryview)]
+        return snapshot
+
+    def close(self):
+        if self._mmap is not None:
+            for view in reversed(self._views):
+                view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _is_modified(self, index, other, other_index):
+        mode = self.mode[index]
+        if mode != other.mode[other_index]:
+            return True
+        if stat.S_ISDIR(mode):
+            # The size and mtime of directories changes with the content
+            return False
+        return (self.size[index], self.mtime_ns[index], self.inode[index]) != (
+            other.size[other_index], other.mtime_ns[other_index], other.inode[other_index]
+        )
+
+    def diff(self, other):
+        """
+        Compare this (old) snapshot with the 'other' (new) snapshot.
+
+        Returns SnapshotDiff(added, removed, modified, moved) with relative paths,
+        'moved' is a list of (old path, new path).
+
+        The entries are matched by (parent directory, name) and the not matched
+        entries by (st_dev, st_ino) to find moved entries. The content of a
+        moved directory is not reported as moved.
+        """
+        other_name_ids = {name: name_id for name_id, name in enumerate(other.names)}
+        name_map = [other_name_ids.get(name, -1) for name in self.names]
+
+        # Look up the other entries by a single integer key: (parent + 1) * number of names + name
+        name_count = len(other.names)
+        other_parent = other.parent
+        other_name = other.name
+        other_keys = {
+            (other_parent[index] + 1) * name_count + other_name[index]: index
+            for index in range(len(other))
+        }
+
+        dir_map = {-1: -1}  # self index -> other index of matched directories
+        modified = []
+        not_matched = []
+        self_parent = self.parent
+        self_name = self.name
+        self_mode = self.mode
+        for index in range(len(self)):
+            other_index = None
+            other_parent_index = dir_map.get(self_parent[index])
+            if other_parent_index is not None:
+                name_id = name_map[self_name[index]]
+                if name_id >= 0:
+                    other_index = other_keys.pop((other_parent_index + 1) * name_count + name_id, None)
+
+            if other_index is None:
+                not_matched.append(index)
+                continue
+
+            if self._is_modified(index, other, other_index):
+                modified.append(index)
+            if stat.S_ISDIR(self_mode[index]) and stat.S_ISDIR(other.mode[other_index]):
+                dir_map[index] = other_index
+
+        # Find moved entries in the not matched entries.
+        # Note: st_ino is 0, if it's not available (e.g.: under Windows)
+        inodes = collections.defaultdict(list)
+        for other_index in other_keys.values():
+            if other.inode[other_index]:
+                inodes[(other.dev[other_index], other.inode[other_index])].append(other_index)
+
+        moved = []
+        moved_along = set()
+        removed = []
+        for index in not_matched:
+            candidates = inodes.get((self.dev[index], self.inode[index])) if self.inode[index] else None
+            if not candidates:
+                removed.append(index)
+                continue
+            other_index = candidates.pop()
+            if stat.S_IFMT(self_mode[index]) != stat.S_IFMT(other.mode[other_index]):
+                removed.append(index)
+                candidates.append(other_index)
+                continue
+
+            same_name = self.names[self_name[index]] == other.names[other_name[other_index]]
+            if same_name and dir_map.get(self_parent[index]) == other_parent[other_index]:
+                # The parent directory was moved
+                moved_along.add(other_index)
+                if self._is_modified(index, other, other_index):
+                    modified.append(index)
+            else:
+                moved.append((index, other_index))
+            if stat.S_ISDIR(self_mode[index]):
+                dir_map[index] = other_index
+
+        moved_others = {other_index for index, other_index in moved} | moved_along
+        added = sorted(
+            other_index
+            for other_index in other_keys.values()
+            if other_index not in moved_others
+        )
+
+        return SnapshotDiff(
+            added=[other.relative_path(index) for index in added],
+            removed=[self.relative_path(index) for index in removed],
+            modified=[self.relative_path(index) for index in sorted(modified)],
+            moved=[
+                (self.relative_path(index), other.relative_path(other_index))
+                for index, other_index in moved
+            ],
+        )
@@ -0,0 +1,347 @@
+"""
+    pathlib revised
+    ~~~~~~~~~~~~~~~
+
+    Walk directory trees.
+
+    :copyleft: 2016 by the pathlib_revised team, see AUTHORS for more details.
+    :license: GNU GPL v3 or above, see LICENSE for more details.
+"""
+
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# pathlib_revised
+from pathlib_revised.dir_entry_path import DirEntryPath
+from pathlib_revised.pathlib import Path2
+from pathlib_revised.resolve_cache import ResolveCache
+
+# Events yielded by _TreeScheduler.run():
+SCANNED = "scanned"  # A directory was scanned
+DONE = "done"  # A directory and all of its sub directories are scanned
+
+
+def default_max_workers():
+    # Same default as ThreadPoolExecutor() in Python 3.8
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class _TreeScheduler:
+    """
+    Process a directory tree in a thread pool.
+
+    scan_func(node) is called in the worker threads and must return
+    a tuple: (result, child nodes)
+
+    The number of scheduled directories and the number of finished, but
+    not consumed results are bounded. Pending directories are processed
+    depth first, so the memory usage doesn't depend on the tree size.
+    """
+
+    def __init__(self, scan_func, max_workers=None, max_queue=None):
+        self.scan_func = scan_func
+        self.max_workers = max_workers or default_max_workers()
+        self.max_queue = max_queue or self.max_workers * 2
+
+    def _worker(self, results, record):
+        try:
+            result, children = self.scan_func(record[0])
+        except BaseException as err:
+            results.put((record, None, None, err))
+        else:
+            results.put((record, result, children, None))
+
+    def run(self, root):
+        """
+        Generator that yields the events:
+            (SCANNED, node, scan result) - in the order in which the scans finished
+            (DONE, node, None) - after all child nodes are DONE
+        """
+        results = queue.Queue(maxsize=self.max_queue)
+
+        # A record is a list of: [node, parent record, number of open tasks]
+        pending = [[root, None, 1]]
+        in_flight = 0
+        max_in_flight = self.max_workers + self.max_queue
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while pending or in_flight:
+                    while pending and in_flight < max_in_flight:
+                        executor.submit(self._worker, results, pending.pop())
+                        in_flight += 1
+
+                    record, result, children, error = results.get()
+                    in_flight -= 1
+                    if error is not None:
+                        raise error
+
+                    for child in children:
+                        pending.append([child, record, 1])
+                    record[2] += len(children) - 1
+
+                    yield SCANNED, record[0], result
+
+                    while record is not None and record[2] == 0:
+                        yield DONE, record[0], None
+                        record = record[1]
+                        if record is not None:
+                            record[2] -= 1
+            finally:
+                # e.g.: generator closed before the end or scan error:
+                # Wait for all running workers.
+                while in_flight:
+                    results.get()
+                    in_flight -= 1
+
+
+def _relative_dir_func(top):
+    """
+    Returns a function, that returns the directory path relative to 'top'
+    with a trailing "/" for PathFilter().is_excluded() ("" for 'top' itself)
+    """
+    # Compare the parts, not the strings: e.g.: Path2(".").child("sub").path is "sub" and not "./sub"
+    top_length = len(top.parts)
+
+    def relative_dir(path):
+        parts = path.parts[top_length:]
+        if not parts:
+            return ""
+        return "/".join(parts) + "/"
+
+    return relative_dir
+
+
+def _scan_dir(path, onerror, resolve_cache=None, path_filter=None, relative_dir=""):
+    """
+    Scan one directory and create DirEntryPath() instances for all not excluded entries.
+    Returns: (entries, errors)
+    """
+    entries = []
+    errors = []
+    try:
+        with path.scandir() as scandir_it:
+            for dir_entry in scandir_it:
+                try:
+                    if path_filter is not None and path_filter.is_excluded(
+                        relative_dir + dir_entry.name, dir_entry.is_dir(follow_symlinks=False)
+                    ):
+                        continue
+                    entries.append(
+                        DirEntryPath.from_dir_entry(
+                            dir_entry, onerror=onerror, resolve_cache=resolve_cache, parent=path
+                        )
+                    )
+                except OSError as err:
+                    errors.append("DirEntryPath %r error: %s" % (dir_entry.path, err))
+    except OSError as err:
+        errors.append("Scandir %r error: %s" % (path.path, err))
+    return entries, errors
+
+
+def _is_sub_dir(entry):
+    # Don't follow symlinks to directories, like os.walk() does by default
+    return entry.is_dir and not entry.is_symlink
+
+
+def walk_parallel(top, max_workers=None, topdown=True, onerror=print, max_queue=None, resolve_cache=None,
+                  path_filter=None):
+    """
+    Walk the directory tree 'top' with a thread pool and yield DirEntryPath() instances.
+
+    The directories are scanned in parallel, so the order of the entries
+    is not fixed, but:
+        topdown=True: A directory is yielded before its content.
+        topdown=False: A directory is yielded after its content.
+
+    Symlinks to directories are yielded, but not followed.
+    Scan errors are reported via onerror(message) in the calling thread.
+
+    All yielded DirEntryPath() instances share one ResolveCache() for the
+    resolved_path. If no 'resolve_cache' is given, a new one is created
+    for this walk, e.g.: use resolve_cache.get_process_cache() to share it.
+
+    Entries excluded by 'path_filter' (a PathFilter() instance) are skipped
+    and excluded directories are not scanned.
+    """
+    top = Path2(top)
+    if resolve_cache is None:
+        resolve_cache = ResolveCache()
+    relative_dir = _relative_dir_func(top)
+
+    def scan_func(node):
+        path = node if node is top else node.path_instance
+        if path_filter is None:
+            entries, errors = _scan_dir(path, onerror, resolve_cache)
+        else:
+            entries, errors = _scan_dir(path, onerror, resolve_cache, path_filter, relative_dir(path))
+        return (entries, errors), [entry for entry in entries if _is_sub_dir(entry)]
+
+    scheduler = _TreeScheduler(scan_func, max_workers=max_workers, max_queue=max_queue)
+    for event, node, result in scheduler.run(top):
+        if event == SCANNED:
+            entries, errors = result
+            for error in errors:
+                onerror(error)
+
+            if topdown:
+                yield from entries
+            else:
+                # sub directories will be yielded in the DONE event
+                yield from (entry for entry in entries if not _is_sub_dir(entry))
+
+        elif not topdown and node is not top:
+            yield node
+
+
+def fwalk_supported():
+    """
+    Can os.scandir() be used with a file descriptor and os.open() with dir_fd?
+    (e.g.: not under Windows and not with Python < 3.7)
+    """
+    return os.scandir in os.supports_fd and os.open in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+class _FWalkFrame:
+    __slots__ = ("path", "fd", "dev_ino", "dirnames", "filenames", "sub_dirs")
+
+    def __init__(self, path, fd):
+        self.path = path
+        self.fd = fd
+        st = os.fstat(fd)
+        self.dev_ino = (st.st_dev, st.st_ino)
+        self.dirnames = None
+        self.filenames = None
+        self.sub_dirs = None
+
+
+def fwalk(top, topdown=True, onerror=print, max_open_fds=64, path_filter=None):
+    """
+    Walk the directory tree 'top' with open directory file descriptors.
+    Yields (dirpath, dirnames, filenames, dir_fd) like os.fwalk()
+
+    Sub directories are opened relative to the file descriptor of the parent
+    directory and listed via os.scandir(fd), so the kernel must not resolve
+    the complete path again. Use dir_fd for os.stat(), os.open(), os.link() etc.
+    dir_fd is only valid until the next iteration step.
+
+    Not more than 'max_open_fds' directory file descriptors are open at the
+    same time: If needed, the fd of the top most directory is closed. It will
+    be reopened by its path, if needed again and it's verified, that it's
+    still the same directory. Symlinks to directories are not followed.
+
+    With topdown=True the caller can modify dirnames in place, to prune the walk.
+    Entries excluded by 'path_filter' (a PathFilter() instance) are not in
+    dirnames and filenames, so excluded directories are not scanned.
+    Errors are reported via onerror(message).
+    """
+    if not fwalk_supported():
+        raise NotImplementedError("fwalk() is not supported on this platform")
+    if max_open_fds < 2:
+        raise ValueError("max_open_fds must be at least 2")
+
+    flags = os.O_RDONLY | os.O_DIRECTORY
+    no_follow_flags = flags | getattr(os, "O_NOFOLLOW", 0)
+
+    top = Path2(top)
+    relative_dir = _relative_dir_func(top)
+    try:
+        frames = [_FWalkFrame(top, os.open(top.extended_path, flags))]
+    except OSError as err:
+        onerror("Open %r error: %s" % (top.path, err))
+        return
+
+    def make_room(keep_frame):
+        open_frames = [frame for frame in frames if frame.fd is not None]
+        if len(open_frames) >= max_open_fds:
+            for frame in open_frames:
+                if frame is not keep_frame:
+                    os.close(frame.fd)
+                    frame.fd = None
+                    return
+
+    def reopen(frame):
+        """
+        Reopen a directory by its path and check if it's still the same directory
+        """
+        make_room(keep_frame=frame)
+        fd = os.open(frame.path.extended_path, flags if frame is frames[0] else no_follow_flags)
+        st = os.fstat(fd)
+        if (st.st_dev, st.st_ino) != frame.dev_ino:
+            os.close(fd)
+            raise OSError("directory was replaced during the walk")
+        frame.fd = fd
+
+    try:
+        while frames:
+            frame = frames[-1]
+
+            if frame.sub_dirs is None:
+                # first visit: scan the directory
+                frame.dirnames = []
+                frame.filenames = []
+                symlink_names = set()
+                if path_filter is not None:
+                    frame_relative_dir = relative_dir(frame.path)
+                try:
+                    with os.scandir(frame.fd) as scandir_it:
+                        for dir_entry in scandir_it:
+                            if path_filter is not None and path_filter.is_excluded(
+                                frame_relative_dir + dir_entry.name, dir_entry.is_dir(follow_symlinks=False)
+                            ):
+                                continue
+                            if dir_entry.is_dir():
+                                frame.dirnames.append(dir_entry.name)
+                                if dir_entry.is_symlink():
+                                    symlink_names.add(dir_entry.name)
+                            else:
+                                frame.filenames.append(dir_entry.name)
+                except OSError as err:
+                    onerror("Scandir %r error: %s" % (frame.path.path, err))
+                    os.close(frame.fd)
+                    frames.pop()
+                    continue
+
+                if topdown:
+                    yield frame.path, frame.dirnames, frame.filenames, frame.fd
+
+                frame.sub_dirs = iter([name for name in frame.dirnames if name not in symlink_names])
+
+            name = next(frame.sub_dirs, None)
+            if name is None:
+                # All sub directories are done
+                if not topdown:
+                    try:
+                        if frame.fd is None:
+                            reopen(frame)
+                    except OSError as err:
+                        onerror("Reopen %r error: %s" % (frame.path.path, err))
+                    else:
+                        yield frame.path, frame.dirnames, frame.filenames, frame.fd
+
+                if frame.fd is not None:
+                    os.close(frame.fd)
+                frames.pop()
+                continue
+
+            try:
+                if frame.fd is None:
+                    reopen(frame)
+            except OSError as err:
+                onerror("Reopen %r error: %s" % (frame.path.path, err))
+                frame.sub_dirs = iter(())
+                continue
+
+            make_room(keep_frame=frame)
+            try:
+                fd = os.open(name, no_follow_flags, dir_fd=frame.fd)
+            except OSError as err:
+                onerror("Open %r error: %s" % (frame.path.child(name).path, err))
+                continue
+            frames.append(_FWalkFrame(frame.path.child(name), fd))
+    finally:
+        # e.g.: generator closed before the end
+        for frame in frames:
+            if frame.fd is not None:
+                os.close(frame.fd)